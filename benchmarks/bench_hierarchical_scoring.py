@@ -0,0 +1,77 @@
+"""Micro-benchmark: scoring escalar vs. ``EmbeddingMatrix`` vetorizado.
+
+Compara o ranking de irmãos da ``HierarchicalSearchStrategy`` usando o
+``_cosine_similarity`` puro-Python (implementação original) contra o
+motor vetorizado (matriz ``float32`` + ``argpartition``).
+
+Uso::
+
+    python -m benchmarks.bench_hierarchical_scoring
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from typing import List
+
+from src.application.services.search_strategies.embedding_matrix import (
+    EmbeddingMatrix,
+    QueryVector,
+    select_top_k,
+)
+from src.application.services.search_strategies.hierarchical_search_strategy import (
+    HierarchicalSearchStrategy,
+)
+
+_BEAM_WIDTH = 2
+_CASES = [(50, 768), (200, 768), (500, 1536)]
+
+
+def _random_vectors(rng: random.Random, count: int, dim: int) -> List[List[float]]:
+    return [[rng.uniform(-1.0, 1.0) for _ in range(dim)] for _ in range(count)]
+
+
+def _scalar_rank(query: List[float], embeddings: List[List[float]]) -> List[int]:
+    cosine = HierarchicalSearchStrategy._cosine_similarity
+    scored = [(i, cosine(query, emb)) for i, emb in enumerate(embeddings)]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return [i for i, _ in scored[:_BEAM_WIDTH]]
+
+
+def _vector_rank(query: List[float], embeddings: List[List[float]]) -> List[int]:
+    scores = EmbeddingMatrix(embeddings).scores(QueryVector(query))
+    return select_top_k(scores, _BEAM_WIDTH).tolist()
+
+
+def _vector_rank_prebuilt(query: QueryVector, matrix: EmbeddingMatrix) -> List[int]:
+    return select_top_k(matrix.scores(query), _BEAM_WIDTH).tolist()
+
+
+def _best_of(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    rng = random.Random(1234)
+    print(f"{'nodes':>6} {'dim':>5} {'scalar (ms)':>12} {'numpy (ms)':>11} "
+          f"{'prebuilt (ms)':>14} {'speedup':>8} {'prebuilt':>9}")
+    for count, dim in _CASES:
+        embeddings = _random_vectors(rng, count, dim)
+        query = _random_vectors(rng, 1, dim)[0]
+        matrix = EmbeddingMatrix(embeddings)
+        query_vector = QueryVector(query)
+
+        assert _scalar_rank(query, embeddings) == _vector_rank(query, embeddings)
+
+        scalar = _best_of(lambda: _scalar_rank(query, embeddings), number=5)
+        vector = _best_of(lambda: _vector_rank(query, embeddings), number=20)
+        prebuilt = _best_of(
+            lambda: _vector_rank_prebuilt(query_vector, matrix), number=200
+        )
+        print(f"{count:>6} {dim:>5} {scalar * 1e3:>12.3f} {vector * 1e3:>11.3f} "
+              f"{prebuilt * 1e3:>14.4f} {scalar / vector:>7.1f}x {scalar / prebuilt:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
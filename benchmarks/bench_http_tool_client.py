@@ -0,0 +1,128 @@
+"""Benchmark: cliente httpx por chamada vs. ``HttpClientPool`` persistente.
+
+Sobe um servidor HTTP/1.1 local (keep-alive) como substituto do upstream
+e mede a latência de chamadas de tool executadas pelo ``http_function``
+gerado pelo ``HttpToolFactory``:
+
+- ``per-call``: comportamento anterior — um ``httpx.AsyncClient`` novo
+  (handshake + conexão nova) a cada chamada;
+- ``pooled``: cliente compartilhado do ``HttpClientPool``.
+
+Uso::
+
+    python -m benchmarks.bench_http_tool_client
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+
+from src.domain.entities.tool import HttpMethod, Tool
+from src.infrastructure.http.client_pool import HttpClientPool
+from src.infrastructure.http.http_tool_factory import HttpToolFactory
+
+_CALLS = 500
+_CONCURRENCY = 8
+_BODY = b'{"status": "ok", "items": [1, 2, 3]}'
+_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(_BODY)).encode() + b"\r\n"
+    b"Connection: keep-alive\r\n\r\n" + _BODY
+)
+
+
+class _NullLogger:
+    def info(self, message: str, **kwargs) -> None: ...
+    def warning(self, message: str, **kwargs) -> None: ...
+    def error(self, message: str, **kwargs) -> None: ...
+    def debug(self, message: str, **kwargs) -> None: ...
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(_RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _per_call_request(url: str) -> None:
+    """Reproduz o ``http_function`` original (cliente novo por chamada)."""
+    async with httpx.AsyncClient(verify=True) as client:
+        response = await client.request("GET", url, timeout=30.0)
+        response.raise_for_status()
+        response.json()
+
+
+async def _measure(call: Callable[[], Awaitable[object]]) -> List[float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(_CONCURRENCY)
+
+    async def one() -> None:
+        async with semaphore:
+            began = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - began) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(_CALLS)))
+    return latencies
+
+
+def _report(name: str, latencies: List[float]) -> float:
+    p50 = statistics.median(latencies)
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    print(f"{name:>9} {p50:>9.3f} {p99:>9.3f} {statistics.fmean(latencies):>9.3f}")
+    return p50
+
+
+async def main() -> None:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/api/lookup"
+
+    pool = HttpClientPool(_NullLogger())
+    factory = HttpToolFactory(_NullLogger(), client_pool=pool)
+    tool = Tool(
+        id="lookup",
+        name="Lookup",
+        description="Benchmark",
+        route=url,
+        http_method=HttpMethod.GET,
+        parameters=[],
+    )
+    toolkit = (await factory.create_tools_from_configs([tool]))[0]
+    http_function = toolkit.async_functions["lookup"].entrypoint
+
+    # aquecimento
+    await _per_call_request(url)
+    await http_function()
+
+    print(f"{_CALLS} chamadas, concorrência {_CONCURRENCY}")
+    print(f"{'mode':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'mean (ms)':>9}")
+    per_call = _report("per-call", await _measure(lambda: _per_call_request(url)))
+    pooled = _report("pooled", await _measure(lambda: http_function(q="x")))
+    print(f"p50 speedup: {per_call / pooled:.1f}x")
+
+    await pool.aclose()
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""Micro-benchmark: ``_resolve_url`` original vs. ``RouteTemplate`` compilado.
+
+A implementação original roda ``ast.literal_eval`` em todo argumento
+texto e faz ``str.replace`` na rota a cada chamada; o ``RouteTemplate``
+é compilado uma vez por tool e só preenche os slots.
+
+Uso::
+
+    python -m benchmarks.bench_route_template
+"""
+
+from __future__ import annotations
+
+import ast
+import timeit
+from typing import Any, Dict, Tuple
+
+from src.domain.entities.tool import ParameterType, ToolParameter
+from src.infrastructure.http.route_template import RouteTemplate
+
+_ROUTE = "https://api.example.com/v1/users/{user_id}/orders/{order_id}"
+_SEARCH_ROUTE = "https://api.example.com/v1/search"
+_PARAMETERS = [
+    ToolParameter(name="user_id", type=ParameterType.INTEGER, description="u"),
+    ToolParameter(name="order_id", type=ParameterType.STRING, description="o"),
+    ToolParameter(name="limit", type=ParameterType.INTEGER, description="l"),
+]
+_CASES = {
+    "legacy args": (
+        _ROUTE,
+        {
+            "user": '{"user_id": "123"}',
+            "order": '{"order_id": "A-9"}',
+            "q": "status:open",
+            "limit": "20",
+        },
+    ),
+    "named args": (
+        _ROUTE,
+        {"user_id": "123", "order_id": "A-9", "q": "status:open", "limit": "20"},
+    ),
+    "query only": (_SEARCH_ROUTE, {"q": "status:open", "limit": "20", "sort": "desc"}),
+}
+
+
+def _original_resolve_url(
+    route: str, kwargs: Dict[str, Any]
+) -> Tuple[str, Dict[str, Any]]:
+    url = route
+    remaining = kwargs.copy()
+    for key, value in kwargs.items():
+        try:
+            parsed = ast.literal_eval(value) if isinstance(value, str) else value
+        except (ValueError, SyntaxError):
+            parsed = value
+        if isinstance(parsed, dict) and parsed:
+            param_key = next(iter(parsed))
+            placeholder = f"{{{param_key}}}"
+            if placeholder in url:
+                url = url.replace(placeholder, str(parsed[param_key]))
+                remaining.pop(key, None)
+    return url, remaining
+
+
+def _best_of(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    number = 20_000
+    print(f"{'case':>12} {'original (µs)':>14} {'compiled (µs)':>14} {'speedup':>8}")
+    for name, (route, kwargs) in _CASES.items():
+        template = RouteTemplate(route, _PARAMETERS)
+        original = _best_of(lambda: _original_resolve_url(route, kwargs), number)
+        compiled = _best_of(lambda: template.resolve(kwargs), number)
+        print(f"{name:>12} {original * 1e6:>14.2f} {compiled * 1e6:>14.2f} "
+              f"{original / compiled:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
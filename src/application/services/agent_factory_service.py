@@ -2,27 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import time
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional
 
 from agno.agent import Agent
 from agno.db.mongo import MongoDb as MongoAgentDb
 from agno.knowledge import Knowledge
 from agno.vectordb.mongodb import MongoDb as MongoVectorDb
+from pymongo import MongoClient
 
 from src.domain.entities.agent_config import AgentConfig
-from src.domain.entities.rag_config import SearchStrategy
+from src.domain.entities.rag_config import RagConfig, SearchStrategy
+from src.domain.entities.tool import Tool
 from src.domain.ports import ILogger, IModelFactory, IEmbedderFactory, IToolFactory
 from src.domain.repositories.tool_repository import IToolRepository
 from src.application.services.document_indexing_service import DocumentIndexingService
 from src.application.services.knowledge_search_factory import KnowledgeSearchFactory
+from src.application.services.lazy_agent import LazyAgent
+from src.application.services.resource_pool import ResourcePool
+from src.application.services.stage_timer import StageTimer
 from src.infrastructure.tools.hierarchical_search_tool import (
     create_hierarchical_search_tool,
 )
 
 
 class AgentFactoryService:
-    """Cria instâncias de ``Agent`` (agno v2.5) a partir de ``AgentConfig``."""
+    """Cria instâncias de ``Agent`` (agno v2.5) a partir de ``AgentConfig``.
+
+    Db, toolkits e knowledge são obtidos de um ``ResourcePool``: agentes
+    com a mesma configuração compartilham a mesma instância e, quando
+    construídos em paralelo, a criação de um recurso assíncrono (toolkit,
+    carga de documento, indexação) ocorre uma única vez.  Modelos e
+    embedders vêm direto das factories, cujo ``ModelCacheService`` faz o
+    compartilhamento com TTL/LRU.  ``reset_shared_resources`` esvazia o
+    pool a cada refresh para não reter recursos de configurações
+    antigas.  O tempo de cada etapa é registrado por agente e acumulado
+    em ``get_build_stats``.
+
+    ``preload_tools`` busca numa só consulta as tools de vários agentes;
+    depois disso ``_build_tools`` resolve os IDs em memória e só vai ao
+    repositório pelos que não foram pré-carregados.
+    """
 
     def __init__(
         self,
@@ -36,9 +60,13 @@ class AgentFactoryService:
         tool_repository: IToolRepository,
         indexing_service: Optional[DocumentIndexingService] = None,
         search_factory: Optional[KnowledgeSearchFactory] = None,
+        resource_pool: Optional[ResourcePool] = None,
+        mongo_client: Optional[MongoClient] = None,
     ) -> None:
         self._db_url = db_url
         self._db_name = db_name
+        # Cliente compartilhado; sem ele o agno abre um pool por instância
+        self._mongo_client = mongo_client
         self._logger = logger
         self._model_factory = model_factory
         self._embedder_factory = embedder_factory
@@ -46,32 +74,62 @@ class AgentFactoryService:
         self._tool_repository = tool_repository
         self._indexing_service = indexing_service
         self._search_factory = search_factory
+        self._pool = resource_pool or ResourcePool()
+        self._stage_totals = StageTimer()
+        self._agents_built = 0
+        # agent_id → início/fim (epoch ns) e etapas da última construção
+        self._build_times: Dict[str, dict] = {}
+        # ID → tool ativa; ``None`` marca IDs consultados e inexistentes/inativos
+        self._tool_lookup: Dict[str, Optional[Tool]] = {}
 
     # ── public ──────────────────────────────────────────────────────
 
     async def create_agent(self, config: AgentConfig) -> Agent:
         """Cria um agente baseado na configuração fornecida."""
         start = datetime.now(timezone.utc)
+        start_ns = time.time_ns()
+        timer = StageTimer()
         try:
-            self._validate_model_config(config)
-            model = self._model_factory.create_model(
-                config.factory_ia_model, config.model
-            )
-            tools = await self._build_tools(config)
-            knowledge = self._build_knowledge(config)
+            with timer.stage("validate"):
+                self._validate_model_config(config)
+            with timer.stage("model"):
+                model = self._model_factory.create_model(
+                    config.factory_ia_model, config.model
+                )
+            with timer.stage("tools"):
+                tools = await self._build_tools(config)
+            with timer.stage("knowledge"):
+                knowledge = self._build_knowledge(config)
+                if knowledge is not None:
+                    doc_name = config.rag_config.doc_name
+                    await self._pool.aget(
+                        ("rag_document", id(knowledge), doc_name),
+                        partial(self._load_knowledge, knowledge, doc_name),
+                    )
 
             # ── Estratégia hierárquica ──
-            hierarchical_tool = await self._build_hierarchical_tool(config)
+            with timer.stage("hierarchical"):
+                hierarchical_tool = await self._build_hierarchical_tool(config)
             if hierarchical_tool:
                 tools.append(hierarchical_tool)
 
-            db = self._build_db()
-            agent = self._assemble_agent(config, model, db, tools, knowledge)
+            with timer.stage("db"):
+                db = self._build_db()
+            with timer.stage("assemble"):
+                agent = self._assemble_agent(config, model, db, tools, knowledge)
             elapsed = (datetime.now(timezone.utc) - start).total_seconds()
+            self._stage_totals.merge(timer)
+            self._agents_built += 1
+            self._build_times[config.id] = {
+                "start_ns": start_ns,
+                "end_ns": time.time_ns(),
+                "stages_ms": timer.as_dict(),
+            }
             self._logger.info(
                 "Agente criado",
                 agent_id=config.id,
                 elapsed_s=round(elapsed, 3),
+                stages_ms=timer.as_dict(),
             )
             return agent
         except Exception as exc:
@@ -81,9 +139,50 @@ class AgentFactoryService:
                 agent_id=config.id,
                 error=str(exc),
                 elapsed_s=round(elapsed, 3),
+                stages_ms=timer.as_dict(),
             )
             raise
 
+    def create_lazy_agent(self, config: AgentConfig) -> LazyAgent:
+        """Stub que cria o agente com ``create_agent`` no primeiro uso."""
+        return LazyAgent(config, db=self._build_db(), build=self.create_agent)
+
+    async def preload_tools(self, configs: Iterable[AgentConfig]) -> int:
+        """Carrega numa só consulta as tools referenciadas por ``configs``.
+
+        Returns:
+            Quantidade de IDs distintos consultados.
+        """
+        tool_ids = sorted({tid for cfg in configs for tid in cfg.tools_ids or ()})
+        if not tool_ids:
+            return 0
+        tools = await self._tool_repository.get_tools_by_ids(tool_ids)
+        found = {tool.id: tool for tool in tools}
+        for tool_id in tool_ids:
+            self._tool_lookup[tool_id] = found.get(tool_id)
+        return len(tool_ids)
+
+    def reset_shared_resources(self) -> None:
+        """Descarta toolkits, knowledge e tools pré-carregadas do pool.
+
+        Chamado no início de cada refresh: o que continuar em uso é
+        recriado (uma vez) pelos agentes reconstruídos.
+        """
+        self._pool.clear()
+        self._tool_lookup.clear()
+
+    def get_build_stats(self) -> dict:
+        """Agentes criados, tempo acumulado por etapa e uso do pool."""
+        return {
+            "agents_built": self._agents_built,
+            "stages_ms": self._stage_totals.as_dict(),
+            "resource_pool": self._pool.get_stats(),
+        }
+
+    def get_build_times(self) -> Dict[str, dict]:
+        """Início/fim (epoch ns) e etapas da última construção de cada agente."""
+        return dict(self._build_times)
+
     # ── private ─────────────────────────────────────────────────────
 
     def _validate_model_config(self, config: AgentConfig) -> None:
@@ -95,24 +194,52 @@ class AgentFactoryService:
             raise ValueError(f"Configuração de modelo inválida: {errors}")
 
     def _build_db(self) -> MongoAgentDb:
-        """Cria instância unificada de db (storage + memory) — agno v2."""
-        return MongoAgentDb(
-            db_url=self._db_url,
-            db_name=self._db_name,
+        """Instância unificada de db (storage + memory) — agno v2.
+
+        Compartilhada por todos os agentes do mesmo ``db_url``/``db_name``.
+        """
+        return self._pool.get(
+            ("db", self._db_url, self._db_name),
+            partial(
+                MongoAgentDb,
+                db_url=self._db_url,
+                db_name=self._db_name,
+                db_client=self._mongo_client,
+            ),
         )
 
     async def _build_tools(self, config: AgentConfig) -> List[Any]:
         if not config.tools_ids:
             return []
         try:
-            tool_configs = await self._tool_repository.get_tools_by_ids(
-                config.tools_ids
+            tool_configs = await self._resolve_tools(config.tools_ids)
+            # Um toolkit por configuração, compartilhado entre agentes
+            per_tool = await asyncio.gather(
+                *(
+                    self._pool.aget(
+                        ("toolkit", repr(tool)),
+                        partial(
+                            self._tool_factory.create_tools_from_configs, [tool]
+                        ),
+                    )
+                    for tool in tool_configs
+                )
             )
-            return await self._tool_factory.create_tools_from_configs(tool_configs)
+            return [toolkit for toolkits in per_tool for toolkit in toolkits]
         except Exception as exc:
             self._logger.warning("Erro ao criar tools", error=str(exc))
             return []
 
+    async def _resolve_tools(self, tool_ids: List[str]) -> List[Tool]:
+        missing = [tid for tid in tool_ids if tid not in self._tool_lookup]
+        if len(missing) == len(tool_ids):
+            return await self._tool_repository.get_tools_by_ids(tool_ids)
+        fetched = (
+            await self._tool_repository.get_tools_by_ids(missing) if missing else []
+        )
+        tools = [self._tool_lookup[tid] for tid in tool_ids if tid not in missing]
+        return [tool for tool in tools if tool is not None] + fetched
+
     def _build_knowledge(self, config: AgentConfig) -> Optional[Knowledge]:
         rag = config.rag_config
         if not rag or not rag.active:
@@ -129,19 +256,19 @@ class AgentFactoryService:
             return None
 
         try:
-            embedder = self._embedder_factory.create_model(
-                rag.factory_ia_model, rag.model
-            )
-            knowledge = Knowledge(
-                vector_db=MongoVectorDb(
-                    collection_name="rag",
-                    db_url=self._db_url,
-                    database=self._db_name,
-                    embedder=embedder,
+            embedder = self._get_embedder(rag.factory_ia_model, rag.model)
+            return self._pool.get(
+                ("knowledge", rag.factory_ia_model, rag.model),
+                lambda: Knowledge(
+                    vector_db=MongoVectorDb(
+                        collection_name="rag",
+                        db_url=self._db_url,
+                        database=self._db_name,
+                        embedder=embedder,
+                        client=self._mongo_client,
+                    ),
                 ),
             )
-            self._load_document(knowledge, rag.doc_name)
-            return knowledge
         except Exception as exc:
             self._logger.warning("Erro ao criar RAG", error=str(exc))
             return None
@@ -163,36 +290,55 @@ class AgentFactoryService:
             self._logger.warning("doc_name obrigatório para HIERARCHICAL")
             return None
 
+        doc_path = f"docs/{rag.doc_name}"
         try:
-            # Indexar documento (idempotente)
-            doc_path = f"docs/{rag.doc_name}"
-            try:
-                with open(doc_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except FileNotFoundError:
-                self._logger.warning("Documento não encontrado", path=doc_path)
-                return None
-
-            await self._indexing_service.index_document(
-                rag.doc_name, content, rag
+            content = await asyncio.to_thread(_read_text, doc_path)
+        except FileNotFoundError:
+            self._logger.warning("Documento não encontrado", path=doc_path)
+            return None
+        except Exception as exc:
+            self._logger.warning(
+                "Erro ao criar tool hierárquica", error=str(exc)
             )
+            return None
 
-            # Criar embedder e estratégia
-            embedder = self._embedder_factory.create_model(
-                rag.factory_ia_model or "ollama",
-                rag.model or "nomic-embed-text:latest",
-            )
-            strategy = self._search_factory.create_strategy(
-                rag, embedder=embedder
+        # Indexação + estratégia uma vez por (configuração, conteúdo)
+        checksum = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        try:
+            return await self._pool.aget(
+                ("hierarchical_tool", repr(rag), checksum),
+                partial(self._create_hierarchical_tool, rag, content),
             )
-            return create_hierarchical_search_tool(strategy)
         except Exception as exc:
             self._logger.warning(
                 "Erro ao criar tool hierárquica", error=str(exc)
             )
             return None
 
-    def _load_document(
+    async def _create_hierarchical_tool(
+        self, rag: RagConfig, content: str
+    ) -> Any:
+        # Indexar documento (idempotente)
+        await self._indexing_service.index_document(rag.doc_name, content, rag)
+
+        # Criar embedder e estratégia
+        embedder = self._get_embedder(
+            rag.factory_ia_model or "ollama",
+            rag.model or "nomic-embed-text:latest",
+        )
+        strategy = self._search_factory.create_strategy(rag, embedder=embedder)
+        return create_hierarchical_search_tool(strategy, doc_name=rag.doc_name)
+
+    def _get_embedder(self, factory_ia_model: str, model: str) -> Any:
+        return self._embedder_factory.create_model(factory_ia_model, model)
+
+    async def _load_knowledge(
+        self, knowledge: Knowledge, doc_name: Optional[str]
+    ) -> Knowledge:
+        await self._load_document(knowledge, doc_name)
+        return knowledge
+
+    async def _load_document(
         self, knowledge: Knowledge, doc_name: Optional[str]
     ) -> None:
         if not doc_name:
@@ -200,7 +346,10 @@ class AgentFactoryService:
             return
         doc_path = f"docs/{doc_name}"
         try:
-            knowledge.insert(path=doc_path, skip_if_exists=True)
+            # ``insert`` é síncrono (leitura + embeddings) — fora do event loop
+            await asyncio.to_thread(
+                knowledge.insert, path=doc_path, skip_if_exists=True
+            )
             self._logger.info("Documento RAG inserido", path=doc_path)
         except FileNotFoundError:
             self._logger.warning(
@@ -246,3 +395,8 @@ class AgentFactoryService:
             search_knowledge=bool(knowledge),
             read_chat_history=bool(knowledge),
         )
+
+
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
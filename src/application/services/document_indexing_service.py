@@ -3,28 +3,40 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, List
+import hashlib
+from typing import Any, Dict, List, Optional
 
+from src.application.services.document_tree_index import DocumentTreeIndex
+from src.application.services.embedding_pipeline import BatchEmbeddingPipeline
 from src.domain.entities.document_node import DocumentNode
 from src.domain.entities.rag_config import RagConfig
 from src.domain.ports.document_parser_port import IDocumentParser
 from src.domain.ports.document_tree_repository_port import IDocumentTreeRepository
 from src.domain.ports.embedder_factory_port import IEmbedderFactory
+from src.domain.ports.embedding_store_port import IEmbeddingStore
 from src.domain.ports.logger_port import ILogger
 from src.domain.ports.summary_generator_port import ISummaryGenerator
 
 _SUMMARY_BATCH_SIZE = 5
+_FALLBACK_SUMMARY_LENGTH = 200
 
 
 class DocumentIndexingService:
     """Indexa documentos em árvore hierárquica para busca top-down.
 
     Fluxo:
-    1. Verifica idempotência (documento já indexado?).
+    1. Verifica idempotência: documento já indexado? — ou, com
+       ``reindex_if_changed``, o checksum do conteúdo mudou?
     2. Parseia conteúdo em nós hierárquicos.
     3. Gera sumários para nós internos (paralelo em batches).
-    4. Computa embeddings de todos os nós.
-    5. Persiste no repositório.
+    4. Computa embeddings de todos os nós (em lotes, fora do event loop).
+    5. Persiste no repositório e só então remove a versão anterior —
+       uma falha no meio do caminho nunca deixa o documento sem árvore.
+    6. Invalida o snapshot em memória do documento (se houver índice).
+
+    Com um ``embedding_store``, sumários e embeddings são endereçados
+    pelo hash do texto + modelo: ao reindexar um documento editado, só
+    as seções alteradas chamam o LLM e o embedder.
     """
 
     def __init__(
@@ -35,12 +47,22 @@ class DocumentIndexingService:
         summary_generator: ISummaryGenerator,
         embedder_factory: IEmbedderFactory,
         logger: ILogger,
+        tree_index: Optional[DocumentTreeIndex] = None,
+        embedding_pipeline: Optional[BatchEmbeddingPipeline] = None,
+        embedding_store: Optional[IEmbeddingStore] = None,
+        reindex_if_changed: bool = False,
     ) -> None:
         self._parser = parser
         self._tree_repo = tree_repository
         self._summary_gen = summary_generator
         self._embedder_factory = embedder_factory
         self._logger = logger
+        self._tree_index = tree_index
+        self._embedding_pipeline = embedding_pipeline or BatchEmbeddingPipeline(
+            logger=logger
+        )
+        self._store = embedding_store
+        self._reindex_if_changed = reindex_if_changed
 
     async def index_document(
         self,
@@ -48,35 +70,63 @@ class DocumentIndexingService:
         content: str,
         rag_config: RagConfig,
     ) -> List[DocumentNode]:
-        """Indexa documento caso ainda não exista.
+        """Indexa documento caso ainda não exista (ou tenha mudado).
 
         Returns
         -------
         List[DocumentNode]
-            Lista de nós criados (vazia se já existia).
+            Lista de nós criados (vazia se já existia / não mudou).
         """
-        if await self._tree_repo.exists(doc_name):
+        checksum = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        replace = False
+        current: Optional[str] = None
+        if self._reindex_if_changed:
+            current = await self._tree_repo.get_checksum(doc_name)
+            if current == checksum:
+                self._logger.info(
+                    "Documento inalterado — skip", doc_name=doc_name
+                )
+                return []
+            replace = current is not None or await self._tree_repo.exists(
+                doc_name
+            )
+        elif await self._tree_repo.exists(doc_name):
             self._logger.info(
                 "Documento já indexado — skip", doc_name=doc_name
             )
             return []
 
-        self._logger.info("Iniciando indexação hierárquica", doc_name=doc_name)
+        self._logger.info(
+            "Iniciando indexação hierárquica", doc_name=doc_name, reindex=replace
+        )
 
         nodes = self._parser.parse(content, doc_name)
         if not nodes:
             self._logger.warning("Parser retornou zero nós", doc_name=doc_name)
             return []
 
-        embedder = self._embedder_factory.create_model(
-            rag_config.factory_ia_model or "ollama",
-            rag_config.model or "nomic-embed-text:latest",
-        )
+        provider = rag_config.factory_ia_model or "ollama"
+        model_id = rag_config.model or "nomic-embed-text:latest"
+        embedder = self._embedder_factory.create_model(provider, model_id)
 
         await self._generate_summaries(nodes)
-        self._compute_embeddings(nodes, embedder)
-
-        await self._tree_repo.save_nodes(nodes)
+        await self._compute_embeddings(nodes, embedder, f"{provider}:{model_id}")
+
+        if replace:
+            if current is not None:
+                # Descarta sobras de uma gravação interrompida; a versão
+                # atual continua servindo as buscas até a nova estar completa.
+                await self._tree_repo.delete_document(
+                    doc_name, keep_checksum=current
+                )
+            # IDs do parser são determinísticos: as duas versões convivem
+            # por um instante, então os IDs levam o checksum.
+            _version_node_ids(nodes, checksum)
+        await self._tree_repo.save_nodes(nodes, checksum=checksum)
+        if replace:
+            await self._tree_repo.delete_document(doc_name, keep_checksum=checksum)
+        if self._tree_index is not None:
+            self._tree_index.invalidate(doc_name)
         self._logger.info(
             "Indexação concluída",
             doc_name=doc_name,
@@ -92,6 +142,18 @@ class DocumentIndexingService:
         if not internal_nodes:
             return
 
+        keys: Dict[str, str] = {}
+        if self._store is not None:
+            model_key = self._summary_gen.model_key
+            keys = {
+                n.id: _content_key("summary", model_key, n.content)
+                for n in internal_nodes
+            }
+            cached = await self._store.get_many(list(keys.values()))
+            for node in internal_nodes:
+                node.summary = cached.get(keys[node.id])
+            internal_nodes = [n for n in internal_nodes if n.summary is None]
+
         for i in range(0, len(internal_nodes), _SUMMARY_BATCH_SIZE):
             batch = internal_nodes[i : i + _SUMMARY_BATCH_SIZE]
             tasks = [
@@ -99,6 +161,18 @@ class DocumentIndexingService:
             ]
             await asyncio.gather(*tasks)
 
+        if self._store is not None:
+            # Fallbacks (truncamento) não são gravados — o LLM pode voltar
+            await self._store.put_many(
+                {
+                    keys[n.id]: n.summary
+                    for n in internal_nodes
+                    if n.summary
+                    and n.summary != n.content[:_FALLBACK_SUMMARY_LENGTH]
+                },
+                kind="summary",
+            )
+
     async def _safe_summarize(self, node: DocumentNode) -> None:
         """Gera sumário com fallback para os primeiros 200 chars."""
         try:
@@ -111,23 +185,56 @@ class DocumentIndexingService:
                 node_id=node.id,
                 error=str(exc),
             )
-            node.summary = node.content[:200]
+            node.summary = node.content[:_FALLBACK_SUMMARY_LENGTH]
 
-    def _compute_embeddings(
-        self, nodes: List[DocumentNode], embedder: Any
+    async def _compute_embeddings(
+        self, nodes: List[DocumentNode], embedder: Any, model_key: str
     ) -> None:
         """Computa embedding para cada nó usando o texto adequado."""
-        for node in nodes:
-            text = node.searchable_text
-            if not text:
-                continue
-            try:
-                embedding = embedder.get_embedding(text)
-                if isinstance(embedding, list):
-                    node.embedding = embedding
-            except Exception as exc:
-                self._logger.warning(
-                    "Erro ao computar embedding",
-                    node_id=node.id,
-                    error=str(exc),
-                )
+        pending = [n for n in nodes if n.searchable_text]
+        keys: Dict[str, str] = {}
+        if self._store is not None:
+            keys = {
+                n.id: _content_key("embedding", model_key, n.searchable_text)
+                for n in pending
+            }
+            cached = await self._store.get_many(list(keys.values()))
+            for node in pending:
+                node.embedding = cached.get(keys[node.id])
+            reused = len(pending)
+            pending = [n for n in pending if n.embedding is None]
+            self._logger.info(
+                "Embeddings reaproveitados do store",
+                reused=reused - len(pending),
+                computed=len(pending),
+            )
+
+        embeddings = await self._embedding_pipeline.embed(
+            [n.searchable_text for n in pending], embedder
+        )
+        for node, embedding in zip(pending, embeddings):
+            if embedding is not None:
+                node.embedding = embedding
+
+        if self._store is not None:
+            await self._store.put_many(
+                {keys[n.id]: n.embedding for n in pending if n.embedding},
+                kind="embedding",
+            )
+
+
+def _content_key(kind: str, model_key: str, text: str) -> str:
+    """Hash do conteúdo + modelo — chave do ``IEmbeddingStore``."""
+    payload = "\0".join((kind, model_key, text)).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _version_node_ids(nodes: List[DocumentNode], checksum: str) -> None:
+    """Sufixa os IDs (e referências entre nós) com o checksum do conteúdo."""
+    suffix = checksum[:12]
+    mapping = {node.id: f"{node.id}@{suffix}" for node in nodes}
+    for node in nodes:
+        node.id = mapping[node.id]
+        if node.parent_id is not None:
+            node.parent_id = mapping.get(node.parent_id, node.parent_id)
+        node.children_ids = [mapping.get(c, c) for c in node.children_ids]
@@ -0,0 +1,114 @@
+"""Índice em memória das árvores hierárquicas de documentos."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.application.services.search_strategies.embedding_matrix import (
+    EmbeddingMatrix,
+)
+from src.domain.entities.document_node import DocumentNode
+from src.domain.ports.document_tree_repository_port import IDocumentTreeRepository
+from src.domain.ports.logger_port import ILogger
+
+
+class DocumentTreeSnapshot:
+    """Árvore completa de um documento, pronta para travessia sem I/O.
+
+    Os nós ficam em uma lista na ordem de indexação; a adjacência
+    pai→filhos é guardada como arrays de índices e os embeddings de
+    todos os nós em uma única ``EmbeddingMatrix`` — uma query é
+    pontuada contra o documento inteiro com um só produto
+    matriz-vetor e a travessia apenas indexa o vetor de scores.
+    """
+
+    __slots__ = ("doc_name", "nodes", "roots", "children", "embeddings")
+
+    def __init__(self, doc_name: str, nodes: List[DocumentNode]) -> None:
+        self.doc_name = doc_name
+        self.nodes = nodes
+        position = {node.id: i for i, node in enumerate(nodes)}
+        self.roots = np.fromiter(
+            (i for i, node in enumerate(nodes) if node.level == 0),
+            dtype=np.intp,
+        )
+        self.children: List[np.ndarray] = [
+            np.fromiter(
+                (position[cid] for cid in node.children_ids if cid in position),
+                dtype=np.intp,
+            )
+            for node in nodes
+        ]
+        self.embeddings = EmbeddingMatrix.from_nodes(nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+
+class DocumentTreeIndex:
+    """Cache de ``DocumentTreeSnapshot`` por documento.
+
+    Cada documento é carregado do repositório uma única vez (uma query)
+    e servido da memória a partir daí.  Cargas concorrentes do mesmo
+    documento são deduplicadas por um lock por documento.  A
+    indexação chama ``invalidate`` após persistir novos nós para que
+    a próxima busca recarregue o snapshot.
+    """
+
+    def __init__(
+        self,
+        *,
+        tree_repository: IDocumentTreeRepository,
+        logger: ILogger,
+    ) -> None:
+        self._tree_repo = tree_repository
+        self._logger = logger
+        self._snapshots: Dict[str, DocumentTreeSnapshot] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._generations: Dict[str, int] = {}
+
+    async def get_snapshot(self, doc_name: str) -> Optional[DocumentTreeSnapshot]:
+        """Retorna o snapshot do documento, carregando-o na primeira chamada.
+
+        Retorna ``None`` se o documento não possui nós indexados.
+        """
+        snapshot = self._snapshots.get(doc_name)
+        if snapshot is not None:
+            return snapshot
+
+        lock = self._locks.setdefault(doc_name, asyncio.Lock())
+        async with lock:
+            snapshot = self._snapshots.get(doc_name)
+            if snapshot is not None:
+                return snapshot
+            generation = self._generations.get(doc_name, 0)
+            nodes = await self._tree_repo.get_document_nodes(doc_name)
+            if not nodes:
+                return None
+            snapshot = DocumentTreeSnapshot(doc_name, nodes)
+            # Invalidado durante a carga — serve o resultado sem cachear
+            if self._generations.get(doc_name, 0) == generation:
+                self._snapshots[doc_name] = snapshot
+            self._logger.info(
+                "Snapshot da árvore carregado",
+                doc_name=doc_name,
+                total_nodes=len(snapshot),
+            )
+            return snapshot
+
+    def invalidate(self, doc_name: Optional[str] = None) -> None:
+        """Descarta o snapshot de ``doc_name`` (ou de todos, se ``None``)."""
+        names = list(self._locks) if doc_name is None else [doc_name]
+        for name in names:
+            self._snapshots.pop(name, None)
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+    def get_stats(self) -> dict:
+        """Documentos carregados e total de nós em memória."""
+        return {
+            "documents": len(self._snapshots),
+            "total_nodes": sum(len(s) for s in self._snapshots.values()),
+        }
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Type
 
+from src.application.services.model_factory_service import model_cache_key
 from src.domain.ports import ILogger
+from src.domain.ports.model_cache_port import IModelCache
 
 
 class EmbedderModelFactory:
@@ -30,8 +32,9 @@ class EmbedderModelFactory:
         ),
     }
 
-    def __init__(self, logger: ILogger) -> None:
+    def __init__(self, logger: ILogger, *, cache: Optional[IModelCache] = None) -> None:
         self._logger = logger
+        self._cache = cache
 
     # ── public ──────────────────────────────────────────────────────
 
@@ -39,15 +42,15 @@ class EmbedderModelFactory:
         """Cria uma instância do embedder."""
         ft = self._normalize(factory_ia_model)
         self._validate_inputs(ft, model_id)
-        model_class = self._get_model_class(ft)
-        api_key = kwargs.get("api_key") or os.getenv(f"{ft.upper()}_API_KEY")
-
-        filtered = {k: v for k, v in kwargs.items() if k != "api_key"}
-        if ft == "ollama":
-            return model_class(id=model_id, **filtered)
-        if not api_key:
-            raise ValueError(f"{ft.upper()}_API_KEY não configurado")
-        return model_class(id=model_id, api_key=api_key, **filtered)
+        if self._cache is None:
+            return self._build(ft, model_id, kwargs)
+        return self._cache.get_or_create_sync(
+            model_cache_key("embedder", ft, model_id, kwargs),
+            self._build,
+            ft,
+            model_id,
+            kwargs,
+        )
 
     @staticmethod
     def get_supported_models() -> List[str]:
@@ -72,6 +75,17 @@ class EmbedderModelFactory:
         if not model_id or not model_id.strip():
             raise ValueError("ID do embedder não pode estar vazio")
 
+    def _build(self, ft: str, model_id: str, kwargs: Dict[str, Any]) -> Any:
+        model_class = self._get_model_class(ft)
+        api_key = kwargs.get("api_key") or os.getenv(f"{ft.upper()}_API_KEY")
+
+        filtered = {k: v for k, v in kwargs.items() if k != "api_key"}
+        if ft == "ollama":
+            return model_class(id=model_id, **filtered)
+        if not api_key:
+            raise ValueError(f"{ft.upper()}_API_KEY não configurado")
+        return model_class(id=model_id, api_key=api_key, **filtered)
+
     def _get_model_class(self, factory_type: str) -> Type:
         if factory_type == "gemini" and not os.getenv("GEMINI_API_KEY"):
             raise ValueError("GEMINI_API_KEY não configurado")
@@ -0,0 +1,111 @@
+"""Pipeline assíncrono de embeddings em lote."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Sequence
+
+from src.domain.ports.logger_port import ILogger
+
+_DEFAULT_BATCH_SIZE = 32
+_DEFAULT_MAX_WORKERS = 4
+_BATCH_METHOD = "async_get_embeddings_batch_and_usage"
+
+
+class BatchEmbeddingPipeline:
+    """Computa embeddings em lotes sem bloquear o event loop.
+
+    Para cada lote de até ``batch_size`` textos:
+
+    - se o embedder expõe API de lote assíncrona
+      (``async_get_embeddings_batch_and_usage`` no agno), faz uma única
+      chamada por lote;
+    - caso contrário, distribui ``get_embedding`` (síncrono) em um
+      thread pool dedicado de ``max_workers`` threads.
+
+    A latência de cada lote é registrada no logger.
+    """
+
+    def __init__(
+        self,
+        *,
+        logger: ILogger,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size deve ser >= 1")
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser >= 1")
+        self._logger = logger
+        self._batch_size = batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="embedding"
+        )
+
+    async def embed(
+        self, texts: Sequence[str], embedder: Any
+    ) -> List[Optional[List[float]]]:
+        """Retorna um embedding por texto (``None`` onde a chamada falhou)."""
+        results: List[Optional[List[float]]] = []
+        total_batches = (len(texts) + self._batch_size - 1) // self._batch_size
+        for number, start in enumerate(range(0, len(texts), self._batch_size), 1):
+            batch = list(texts[start : start + self._batch_size])
+            began = time.perf_counter()
+            embeddings = await self._embed_batch(batch, embedder)
+            results.extend(embeddings)
+            self._logger.info(
+                "Lote de embeddings concluído",
+                batch=number,
+                total_batches=total_batches,
+                batch_size=len(batch),
+                failed=sum(1 for e in embeddings if e is None),
+                elapsed_ms=round((time.perf_counter() - began) * 1000, 2),
+            )
+        return results
+
+    def shutdown(self) -> None:
+        """Libera as threads do pool."""
+        self._executor.shutdown(wait=False)
+
+    # ── private ─────────────────────────────────────────────────────
+
+    async def _embed_batch(
+        self, batch: List[str], embedder: Any
+    ) -> List[Optional[List[float]]]:
+        batch_fn = getattr(embedder, _BATCH_METHOD, None)
+        if asyncio.iscoroutinefunction(batch_fn):
+            try:
+                embeddings, _usage = await batch_fn(batch)
+                return [
+                    _valid(embeddings[i] if i < len(embeddings) else None)
+                    for i in range(len(batch))
+                ]
+            except Exception as exc:
+                self._logger.warning(
+                    "Falha na API de lote — usando chamadas individuais",
+                    error=str(exc),
+                )
+        return list(
+            await asyncio.gather(
+                *(self._embed_one(text, embedder) for text in batch)
+            )
+        )
+
+    async def _embed_one(self, text: str, embedder: Any) -> Optional[List[float]]:
+        loop = asyncio.get_running_loop()
+        try:
+            embedding = await loop.run_in_executor(
+                self._executor, embedder.get_embedding, text
+            )
+            return _valid(embedding)
+        except Exception as exc:
+            self._logger.warning("Erro ao computar embedding", error=str(exc))
+            return None
+
+
+def _valid(embedding: Any) -> Optional[List[float]]:
+    """Normaliza respostas vazias/inválidas do provider para ``None``."""
+    return embedding if isinstance(embedding, list) and embedding else None
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
+from src.application.services.document_tree_index import DocumentTreeIndex
 from src.domain.entities.rag_config import RagConfig, SearchStrategy
 from src.domain.ports.document_tree_repository_port import IDocumentTreeRepository
 from src.domain.ports.knowledge_search_port import IKnowledgeSearchStrategy
 from src.domain.ports.logger_port import ILogger
+from src.domain.ports.query_embedding_cache_port import IQueryEmbeddingCache
 from src.application.services.search_strategies.semantic_search_strategy import (
     SemanticSearchStrategy,
 )
@@ -20,7 +22,8 @@ class KnowledgeSearchFactory:
     """Cria a estratégia de busca adequada baseado na configuração RAG.
 
     Implementa o padrão *Factory* para desacoplar a criação da
-    estratégia de busca do serviço que a consome.
+    estratégia de busca do serviço que a consome.  O ``embedding_cache``
+    (opcional) é compartilhado por todas as estratégias criadas.
     """
 
     def __init__(
@@ -28,9 +31,13 @@ class KnowledgeSearchFactory:
         *,
         tree_repository: IDocumentTreeRepository,
         logger: ILogger,
+        tree_index: Optional[DocumentTreeIndex] = None,
+        embedding_cache: Optional[IQueryEmbeddingCache] = None,
     ) -> None:
         self._tree_repository = tree_repository
         self._logger = logger
+        self._tree_index = tree_index
+        self._embedding_cache = embedding_cache
 
     def create_strategy(
         self,
@@ -70,6 +77,8 @@ class KnowledgeSearchFactory:
                 embedder=embedder,
                 doc_name=rag_config.doc_name,
                 logger=self._logger,
+                tree_index=self._tree_index,
+                embedding_cache=self._embedding_cache,
             )
 
         # Default: SEMANTIC
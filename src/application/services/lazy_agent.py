@@ -0,0 +1,96 @@
+"""Agente materializado sob demanda para o AgentOS."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AbstractSet, Awaitable, Callable, List, Optional
+
+from agno.agent import Agent
+from agno.agent.factory import AgentFactory
+
+from src.domain.entities.agent_config import AgentConfig
+
+
+class LazyAgent(AgentFactory):
+    """Stub leve registrado no AgentOS no lugar do ``Agent``.
+
+    Só guarda a config, o db de sessões e metadados de listagem; modelo,
+    tools e knowledge são criados por ``build`` na primeira execução (ou
+    no pré-aquecimento).  O AgentOS chama o stub a cada request — como
+    faz com agentes comuns, cada request recebe uma cópia isolada do
+    agente materializado.
+    """
+
+    def __init__(
+        self,
+        config: AgentConfig,
+        *,
+        db: Any,
+        build: Callable[[AgentConfig], Awaitable[Agent]],
+    ) -> None:
+        super().__init__(
+            id=config.id,
+            db=db,
+            factory=self._produce,
+            name=config.nome,
+            description=config.descricao or None,
+        )
+        self.config = config
+        self._build = build
+        self._agent: Optional[Agent] = None
+        self._lock = asyncio.Lock()
+        self.run_count = 0
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._agent is not None
+
+    async def materialize(self) -> Agent:
+        """Cria o agente uma única vez; falhas são repetidas na próxima chamada."""
+        if self._agent is None:
+            async with self._lock:
+                if self._agent is None:
+                    self._agent = await self._build(self.config)
+        return self._agent
+
+    # ── private ─────────────────────────────────────────────────────
+
+    async def _produce(self, ctx: Any) -> Agent:
+        agent = await self.materialize()
+        self.run_count += 1
+        fresh = agent.deep_copy()
+        fresh.team_id = None
+        fresh.workflow_id = None
+        return fresh
+
+
+async def materialize_members(
+    agents: List[Any], member_ids: AbstractSet[str]
+) -> List[Any]:
+    """Troca stubs que são membros de teams pelos agentes materializados.
+
+    Teams do agno precisam de instâncias reais de ``Agent`` como membros.
+    Stubs que falham ao materializar ficam fora da lista — o team é
+    criado sem eles, como acontece com membros inexistentes.
+    """
+    targets = [
+        agent
+        for agent in agents
+        if isinstance(agent, LazyAgent) and agent.id in member_ids
+    ]
+    if not targets:
+        return agents
+    results = await asyncio.gather(
+        *(agent.materialize() for agent in targets), return_exceptions=True
+    )
+    resolved = {
+        stub.id: result
+        for stub, result in zip(targets, results)
+        if not isinstance(result, BaseException)
+    }
+    failed = {stub.id for stub in targets} - resolved.keys()
+    return [
+        resolved.get(agent.id, agent)
+        for agent in agents
+        if agent.id not in failed
+    ]
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Type
 
 from agno.models.ollama import Ollama
 
 from src.domain.ports import ILogger
+from src.domain.ports.model_cache_port import IModelCache
 
 
 class ModelFactory:
@@ -23,8 +25,9 @@ class ModelFactory:
         "azure": ("agno.models.azure.openai_chat", "AzureOpenAI", "openai", "Azure OpenAI"),
     }
 
-    def __init__(self, logger: ILogger) -> None:
+    def __init__(self, logger: ILogger, *, cache: Optional[IModelCache] = None) -> None:
         self._logger = logger
+        self._cache = cache
 
     # ── public ──────────────────────────────────────────────────────
 
@@ -32,9 +35,15 @@ class ModelFactory:
         """Cria uma instância do modelo baseado no tipo especificado."""
         factory_type = self._normalize(factory_ia_model)
         self._validate_inputs(factory_type, model_id)
-        model_class = self._get_model_class(factory_type)
-        api_key = kwargs.get("api_key") or os.getenv(f"{factory_type.upper()}_API_KEY")
-        return self._instantiate(factory_type, model_class, model_id, api_key, kwargs)
+        if self._cache is None:
+            return self._build(factory_type, model_id, kwargs)
+        return self._cache.get_or_create_sync(
+            model_cache_key("model", factory_type, model_id, kwargs),
+            self._build,
+            factory_type,
+            model_id,
+            kwargs,
+        )
 
     def validate_model_config(self, factory_ia_model: str, model_id: str) -> Dict[str, Any]:
         """Valida a configuração sem criar a instância."""
@@ -99,6 +108,11 @@ class ModelFactory:
         if not model_id or not model_id.strip():
             raise ValueError("ID do modelo não pode estar vazio")
 
+    def _build(self, factory_type: str, model_id: str, kwargs: Dict[str, Any]) -> Any:
+        model_class = self._get_model_class(factory_type)
+        api_key = kwargs.get("api_key") or os.getenv(f"{factory_type.upper()}_API_KEY")
+        return self._instantiate(factory_type, model_class, model_id, api_key, kwargs)
+
     def _get_model_class(self, factory_type: str) -> Type:
         if factory_type == "ollama":
             return Ollama
@@ -153,3 +167,18 @@ class ModelFactory:
         if not api_key:
             raise ValueError(f"{factory_type.upper()}_API_KEY não configurado")
         return model_class(id=model_id, api_key=api_key, **filtered)
+
+
+def model_cache_key(
+    kind: str, factory_type: str, model_id: str, kwargs: Dict[str, Any]
+) -> str:
+    """Chave de cache ``kind:factory:model[:digest]``.
+
+    Os kwargs extras (que podem conter ``api_key``) entram apenas como
+    digest, para que a chave possa ser exposta em ``/metrics/cache``.
+    """
+    key = f"{kind}:{factory_type}:{model_id}"
+    if kwargs:
+        extra = repr(sorted(kwargs.items())).encode("utf-8")
+        key += ":" + hashlib.sha256(extra).hexdigest()[:12]
+    return key
@@ -0,0 +1,104 @@
+"""Pool de recursos compartilhados entre agentes, indexado por chave."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class ResourcePool:
+    """Deduplica instâncias idênticas (db, knowledge, toolkits).
+
+    Cada recurso é identificado por uma chave hashable — tipicamente uma
+    tupla ``(tipo, provider, modelo)``.  A primeira chamada para uma
+    chave executa a factory e as seguintes recebem a mesma instância.
+
+    - ``get`` recebe uma factory síncrona; como ela roda sem ceder o
+      event loop, não há corrida entre agentes construídos em paralelo.
+    - ``aget`` recebe uma factory assíncrona; chamadas concorrentes para
+      a mesma chave aguardam a mesma execução (single-flight).
+
+    Se a factory falhar, nada é guardado e a próxima chamada tenta de
+    novo.  Acima de ``max_entries`` recursos, o usado há mais tempo é
+    descartado — chaves de configurações antigas (tool editada,
+    documento reindexado) não ficam presas ao processo.  Modelos e
+    embedders não passam por aqui: o ``ModelCacheService`` é o único
+    cache deles (TTL/LRU).
+    """
+
+    def __init__(self, *, max_entries: int = 256) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries deve ser >= 1")
+        self._max_entries = max_entries
+        self._resources: OrderedDict[Hashable, Any] = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Retorna o recurso de ``key``, criando-o com ``factory`` se preciso."""
+        if key in self._resources:
+            self._hits += 1
+            self._resources.move_to_end(key)
+            return self._resources[key]
+        self._misses += 1
+        resource = factory()
+        self._store(key, resource)
+        return resource
+
+    async def aget(
+        self, key: Hashable, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Versão assíncrona de ``get`` com deduplicação de chamadas em voo."""
+        if key in self._resources:
+            self._hits += 1
+            self._resources.move_to_end(key)
+            return self._resources[key]
+        pending = self._pending.get(key)
+        if pending is not None:
+            self._hits += 1
+            return await asyncio.shield(pending)
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            resource = await factory()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Evita "exception was never retrieved" quando ninguém aguardava
+                future.exception()
+            raise
+        else:
+            self._store(key, resource)
+            future.set_result(resource)
+            return resource
+        finally:
+            self._pending.pop(key, None)
+
+    def clear(self) -> None:
+        """Descarta os recursos guardados (chamadas em voo não são afetadas)."""
+        self._resources.clear()
+
+    def get_stats(self) -> dict:
+        """Recursos em pool e contadores de hit/miss."""
+        return {
+            "resources": len(self._resources),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _store(self, key: Hashable, resource: Any) -> None:
+        self._resources[key] = resource
+        self._resources.move_to_end(key)
+        while len(self._resources) > self._max_entries:
+            self._resources.popitem(last=False)
+            self._evictions += 1
@@ -3,13 +3,32 @@
 from __future__ import annotations
 
 import math
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
+import numpy as np
+
+from src.application.services.search_strategies.embedding_matrix import (
+    EmbeddingMatrix,
+    QueryVector,
+    select_top_k,
+)
 from src.domain.entities.document_node import DocumentNode
 from src.domain.entities.search_result import SearchResult
 from src.domain.ports.document_tree_repository_port import IDocumentTreeRepository
 from src.domain.ports.knowledge_search_port import IKnowledgeSearchStrategy
 from src.domain.ports.logger_port import ILogger
+from src.domain.ports.query_embedding_cache_port import IQueryEmbeddingCache
+from src.infrastructure.telemetry.run_breakdown import (
+    COMPONENT_RAG_EMBED,
+    COMPONENT_RAG_LEVEL,
+    component_span,
+)
+
+if TYPE_CHECKING:
+    from src.application.services.document_tree_index import (
+        DocumentTreeIndex,
+        DocumentTreeSnapshot,
+    )
 
 _HIGH_CONFIDENCE_THRESHOLD = 0.85
 _BEAM_WIDTH = 2  # nós explorados por nível
@@ -26,6 +45,16 @@ class HierarchicalSearchStrategy(IKnowledgeSearchStrategy):
     5. Desce recursivamente para os filhos do(s) melhor(es) nó(s).
     6. Repete até chegar a nós folha.
     7. Retorna chunks finais como ``List[SearchResult]``.
+
+    Com um ``tree_index`` injetado, a árvore do documento é servida da
+    memória (snapshot carregado uma vez) e a travessia não faz I/O no
+    MongoDB; sem ele, cada nível consulta o repositório.  Com um
+    ``embedding_cache``, queries repetidas não são re-embeddadas.
+
+    O embedding da query e cada nível da travessia geram um span
+    (``rag.embed_query``, ``rag.level`` com o atributo ``level``); o
+    span do nível cobre o ranqueamento e a busca dos filhos, não a
+    descida aos níveis seguintes.
     """
 
     def __init__(
@@ -37,6 +66,8 @@ class HierarchicalSearchStrategy(IKnowledgeSearchStrategy):
         logger: ILogger,
         beam_width: int = _BEAM_WIDTH,
         confidence_threshold: float = _HIGH_CONFIDENCE_THRESHOLD,
+        tree_index: Optional[DocumentTreeIndex] = None,
+        embedding_cache: Optional[IQueryEmbeddingCache] = None,
     ) -> None:
         self._tree_repo = tree_repository
         self._embedder = embedder
@@ -44,24 +75,43 @@ class HierarchicalSearchStrategy(IKnowledgeSearchStrategy):
         self._logger = logger
         self._beam_width = beam_width
         self._confidence_threshold = confidence_threshold
+        self._tree_index = tree_index
+        self._embedding_cache = embedding_cache
+        self._embedder_provider = type(embedder).__name__
+        self._embedder_model_id = str(getattr(embedder, "id", ""))
 
     # ── public ──────────────────────────────────────────────────────
 
     async def search(self, query: str, *, top_k: int = 5) -> List[SearchResult]:
         """Executa busca top-down na árvore hierárquica."""
-        query_embedding = self._compute_embedding(query)
+        with component_span(
+            COMPONENT_RAG_EMBED, "rag.embed_query", doc_name=self._doc_name
+        ):
+            query_embedding = self._compute_embedding(query)
         if query_embedding is None:
             self._logger.warning("Falha ao computar embedding da query")
             return []
 
-        root_nodes = await self._tree_repo.get_root_nodes(self._doc_name)
-        if not root_nodes:
-            self._logger.warning(
-                "Nenhum nó raiz encontrado", doc_name=self._doc_name
+        query_vector = QueryVector(query_embedding)
+        if self._tree_index is not None:
+            snapshot = await self._tree_index.get_snapshot(self._doc_name)
+            if snapshot is None or len(snapshot.roots) == 0:
+                self._logger.warning(
+                    "Nenhum nó raiz encontrado", doc_name=self._doc_name
+                )
+                return []
+            scores = snapshot.embeddings.scores(query_vector)
+            leaf_results = self._traverse_snapshot(
+                snapshot, snapshot.roots, scores
             )
-            return []
-
-        leaf_results = await self._traverse(root_nodes, query_embedding)
+        else:
+            root_nodes = await self._tree_repo.get_root_nodes(self._doc_name)
+            if not root_nodes:
+                self._logger.warning(
+                    "Nenhum nó raiz encontrado", doc_name=self._doc_name
+                )
+                return []
+            leaf_results = await self._traverse(root_nodes, query_vector)
         leaf_results.sort(key=lambda r: r.score, reverse=True)
         return leaf_results[:top_k]
 
@@ -70,69 +120,82 @@ class HierarchicalSearchStrategy(IKnowledgeSearchStrategy):
     async def _traverse(
         self,
         nodes: List[DocumentNode],
-        query_embedding: List[float],
+        query_vector: QueryVector,
+        level: int = 0,
     ) -> List[SearchResult]:
         """Desce recursivamente pela árvore, selecionando os melhores nós."""
-        scored = self._rank_nodes(nodes, query_embedding)
-        best = scored[: self._beam_width]
+        # Por nó do beam: o resultado (folha) ou os filhos a explorar
+        expansions: List[tuple[DocumentNode, float, List[DocumentNode]]] = []
+        with self._level_span(level) as span:
+            span.set_attribute("candidates", len(nodes))
+            best = self._rank_nodes(nodes, query_vector, self._beam_width)
+            for node, score in best:
+                children = (
+                    [] if node.is_leaf else await self._tree_repo.get_children(node.id)
+                )
+                expansions.append((node, score, children))
 
         results: List[SearchResult] = []
-        for node, score in best:
-            if node.is_leaf:
-                results.append(
-                    SearchResult(
-                        content=node.content,
-                        score=score,
-                        node_id=node.id,
-                        metadata={
-                            "strategy": "hierarchical",
-                            "level": str(node.level),
-                            "title": node.title,
-                        },
-                    )
+        for node, score, children in expansions:
+            if children:
+                results.extend(
+                    await self._traverse(children, query_vector, level + 1)
                 )
             else:
-                if score >= self._confidence_threshold:
-                    children = await self._tree_repo.get_children(node.id)
-                    if children:
-                        child_results = await self._traverse(
-                            children, query_embedding
-                        )
-                        results.extend(child_results)
-                    else:
-                        results.append(self._node_to_result(node, score))
-                else:
-                    children = await self._tree_repo.get_children(node.id)
-                    if children:
-                        child_results = await self._traverse(
-                            children, query_embedding
-                        )
-                        results.extend(child_results)
-                    else:
-                        results.append(self._node_to_result(node, score))
+                results.append(self._node_to_result(node, score))
         return results
 
+    def _traverse_snapshot(
+        self,
+        snapshot: DocumentTreeSnapshot,
+        candidates: np.ndarray,
+        scores: np.ndarray,
+        level: int = 0,
+    ) -> List[SearchResult]:
+        """Travessia em memória — ``scores`` cobre todos os nós do snapshot."""
+        with self._level_span(level) as span:
+            span.set_attribute("candidates", len(candidates))
+            beam = candidates[select_top_k(scores[candidates], self._beam_width)]
+
+        results: List[SearchResult] = []
+        for idx in beam:
+            node = snapshot.nodes[idx]
+            score = float(scores[idx])
+            children = snapshot.children[idx]
+            if node.is_leaf or len(children) == 0:
+                results.append(self._node_to_result(node, score))
+            else:
+                results.extend(
+                    self._traverse_snapshot(snapshot, children, scores, level + 1)
+                )
+        return results
+
+    def _level_span(self, level: int):
+        return component_span(
+            COMPONENT_RAG_LEVEL, "rag.level", doc_name=self._doc_name, level=level
+        )
+
     # ── scoring ─────────────────────────────────────────────────────
 
     def _rank_nodes(
         self,
         nodes: List[DocumentNode],
-        query_embedding: List[float],
+        query_vector: QueryVector,
+        limit: int,
     ) -> List[tuple[DocumentNode, float]]:
-        """Ordena nós por similaridade cosseno com a query."""
-        scored: List[tuple[DocumentNode, float]] = []
-        for node in nodes:
-            if node.embedding is None:
-                scored.append((node, 0.0))
-                continue
-            sim = self._cosine_similarity(query_embedding, node.embedding)
-            scored.append((node, sim))
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored
+        """Retorna os ``limit`` nós mais similares à query, em ordem decrescente.
+
+        Todos os irmãos são pontuados de uma vez via ``EmbeddingMatrix``
+        (um produto matriz-vetor) e o beam é isolado com ``argpartition``.
+        """
+        scores = EmbeddingMatrix.from_nodes(nodes).scores(query_vector)
+        return [
+            (nodes[i], float(scores[i])) for i in select_top_k(scores, limit)
+        ]
 
     @staticmethod
     def _cosine_similarity(vec_a: List[float], vec_b: List[float]) -> float:
-        """Similaridade cosseno entre dois vetores."""
+        """Similaridade cosseno escalar entre dois vetores (implementação de referência)."""
         if len(vec_a) != len(vec_b) or not vec_a:
             return 0.0
         dot = sum(a * b for a, b in zip(vec_a, vec_b))
@@ -145,10 +208,23 @@ class HierarchicalSearchStrategy(IKnowledgeSearchStrategy):
     # ── helpers ─────────────────────────────────────────────────────
 
     def _compute_embedding(self, text: str) -> Optional[List[float]]:
-        """Computa embedding via embedder injetado."""
+        """Computa embedding via embedder injetado (consultando o cache)."""
+        cache = self._embedding_cache
+        if cache is not None:
+            cached = cache.get(
+                self._embedder_provider, self._embedder_model_id, text
+            )
+            if cached is not None:
+                return cached
         try:
             result = self._embedder.get_embedding(text)
-            return result if isinstance(result, list) else None
+            if not isinstance(result, list):
+                return None
+            if cache is not None and result:
+                cache.put(
+                    self._embedder_provider, self._embedder_model_id, text, result
+                )
+            return result
         except Exception as exc:
             self._logger.warning("Erro ao computar embedding", error=str(exc))
             return None
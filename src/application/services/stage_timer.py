@@ -0,0 +1,44 @@
+"""Cronômetro de etapas para detalhar o tempo de construção de agentes."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class StageTimer:
+    """Acumula a duração (ms) de cada etapa nomeada.
+
+    Uso::
+
+        timer = StageTimer()
+        with timer.stage("tools"):
+            tools = await build_tools()
+        timer.as_dict()  # {"tools": 12.34}
+
+    Etapas repetidas somam; a ordem de inserção é preservada.
+    """
+
+    __slots__ = ("_stages",)
+
+    def __init__(self) -> None:
+        self._stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - began) * 1000
+            self._stages[name] = self._stages.get(name, 0.0) + elapsed
+
+    def merge(self, other: StageTimer) -> None:
+        """Soma as etapas de ``other`` nesta instância."""
+        for name, elapsed in other._stages.items():
+            self._stages[name] = self._stages.get(name, 0.0) + elapsed
+
+    def as_dict(self) -> Dict[str, float]:
+        """Duração de cada etapa em milissegundos, arredondada."""
+        return {name: round(ms, 2) for name, ms in self._stages.items()}
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Sequence, Union
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Union
 
 from agno.agent import Agent
 from agno.db.mongo import MongoDb as MongoAgentDb
 from agno.team import Team
 from agno.team.mode import TeamMode
+from pymongo import MongoClient
 
+from src.application.services.resource_pool import ResourcePool
 from src.domain.entities.team_config import TeamConfig
 from src.domain.ports import ILogger, IModelFactory
 
@@ -30,11 +33,15 @@ class TeamFactoryService:
         db_name: str = "agno",
         logger: ILogger,
         model_factory: IModelFactory,
+        resource_pool: Optional[ResourcePool] = None,
+        mongo_client: Optional[MongoClient] = None,
     ) -> None:
         self._db_url = db_url
         self._db_name = db_name
+        self._mongo_client = mongo_client
         self._logger = logger
         self._model_factory = model_factory
+        self._pool = resource_pool or ResourcePool()
 
     def create_team(
         self,
@@ -43,11 +50,21 @@ class TeamFactoryService:
     ) -> Team:
         """Cria um Team usando os agentes fornecidos como membros."""
         members: Sequence[Union[Agent, Team]] = self._resolve_members(config, agents)
+        # Modelo compartilhado via ModelCacheService; db com a mesma chave
+        # de AgentFactoryService
         model = self._model_factory.create_model(
             config.factory_ia_model, config.model
         )
         mode = _MODE_MAP.get(config.mode, TeamMode.route)
-        db = MongoAgentDb(db_url=self._db_url, db_name=self._db_name)
+        db = self._pool.get(
+            ("db", self._db_url, self._db_name),
+            partial(
+                MongoAgentDb,
+                db_url=self._db_url,
+                db_name=self._db_name,
+                db_client=self._mongo_client,
+            ),
+        )
 
         team = Team(
             id=config.id,
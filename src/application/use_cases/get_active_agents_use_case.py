@@ -3,31 +3,68 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List
+import time
+from typing import AbstractSet, Dict, List, Optional, Sequence, Set, Tuple
 
 from agno.agent import Agent
 
 from src.application.services.agent_factory_service import AgentFactoryService
+from src.application.services.lazy_agent import LazyAgent
+from src.domain.entities.agent_config import AgentConfig
+from src.domain.ports import ILogger
 from src.domain.repositories.agent_config_repository import IAgentConfigRepository
+from src.domain.repositories.agent_usage_repository import IAgentUsageRepository
 
 
 class GetActiveAgentsUseCase:
-    """Busca configurações ativas e cria os agentes."""
+    """Busca configurações ativas e cria os agentes.
+
+    Com ``lazy=True`` devolve ``LazyAgent`` — stubs que só criam modelo,
+    tools e knowledge na primeira execução — e, se ``prewarm_top_n > 0``,
+    materializa em segundo plano os agentes mais usados (segundo
+    ``usage_repository``; na falta dele, os primeiros da lista).  Stubs
+    cuja config não mudou são reaproveitados entre recargas, mantendo o
+    agente já materializado.
+    """
 
     def __init__(
         self,
         agent_factory_service: AgentFactoryService,
         agent_config_repository: IAgentConfigRepository,
+        logger: Optional[ILogger] = None,
+        *,
+        lazy: bool = False,
+        prewarm_top_n: int = 0,
+        usage_repository: Optional[IAgentUsageRepository] = None,
     ) -> None:
         self._factory = agent_factory_service
         self._repository = agent_config_repository
+        self._logger = logger
+        self._lazy = lazy
+        self._prewarm_top_n = prewarm_top_n
+        self._usage_repository = usage_repository
+        self._prewarm_task: Optional[asyncio.Task] = None
+        # Configs dos agentes publicados — base para o rebuild incremental
+        self._configs: Dict[str, AgentConfig] = {}
+        # Stubs publicados (modo sob demanda), reaproveitados nas recargas
+        self._stubs: Dict[str, LazyAgent] = {}
 
     async def execute(self) -> List[Agent]:
         """Busca configs e cria agentes em paralelo."""
         configs = await self._repository.get_active_agents()
+        self._configs = {cfg.id: cfg for cfg in configs}
         if not configs:
+            self._stubs = {}
             return []
 
+        start = time.perf_counter()
+        # Recursos da rodada anterior (toolkits de tools editadas,
+        # documentos reindexados) não ficam retidos
+        self._factory.reset_shared_resources()
+        # Uma consulta de tools para todos os agentes, em vez de uma por agente
+        await self._factory.preload_tools(configs)
+        if self._lazy:
+            return self._register_lazy(configs, start)
         tasks = [self._factory.create_agent(cfg) for cfg in configs]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -37,4 +74,130 @@ class GetActiveAgentsUseCase:
                 # Log já ocorre dentro de AgentFactoryService
                 continue
             agents.append(result)
-        return agents
\ No newline at end of file
+
+        if self._logger:
+            # stages_ms soma todos os agentes; compare com elapsed_s
+            # (wall clock) para ver o ganho do paralelismo + pool
+            self._logger.info(
+                "Agentes ativos criados",
+                total=len(configs),
+                created=len(agents),
+                elapsed_s=round(time.perf_counter() - start, 3),
+                **self._factory.get_build_stats(),
+            )
+        return agents
+
+    async def rebuild(
+        self,
+        agent_ids: AbstractSet[str],
+        tool_ids: AbstractSet[str] = frozenset(),
+    ) -> Tuple[Dict[str, Agent], Set[str]]:
+        """Recria apenas os agentes alterados ou que usam tools alteradas.
+
+        Returns:
+            ``(novos agentes por ID, IDs removidos ou desativados)``.
+            Agentes cuja criação falha ficam fora de ambos — a versão
+            anterior continua publicada.
+        """
+        affected = set(agent_ids) | {
+            cfg.id for cfg in self._configs.values() if tool_ids & set(cfg.tools_ids or ())
+        }
+        if not affected:
+            return {}, set()
+
+        configs = await self._repository.get_active_agents_by_ids(sorted(affected))
+        removed = affected - {cfg.id for cfg in configs}
+        self._factory.reset_shared_resources()
+        await self._factory.preload_tools(configs)
+        if self._lazy:
+            built_lazy: Dict[str, Agent] = {}
+            for cfg in configs:
+                stub = self._factory.create_lazy_agent(cfg)
+                built_lazy[cfg.id] = self._stubs[cfg.id] = stub
+                self._configs[cfg.id] = cfg
+            for agent_id in removed:
+                self._configs.pop(agent_id, None)
+                self._stubs.pop(agent_id, None)
+            return built_lazy, removed
+        results = await asyncio.gather(
+            *(self._factory.create_agent(cfg) for cfg in configs),
+            return_exceptions=True,
+        )
+
+        built: Dict[str, Agent] = {}
+        for cfg, result in zip(configs, results):
+            if isinstance(result, Exception):
+                continue
+            built[cfg.id] = result
+            self._configs[cfg.id] = cfg
+        for agent_id in removed:
+            self._configs.pop(agent_id, None)
+        return built, removed
+
+    async def stop_prewarm(self) -> None:
+        if self._prewarm_task is not None and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+            try:
+                await self._prewarm_task
+            except asyncio.CancelledError:
+                pass
+        self._prewarm_task = None
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _register_lazy(
+        self, configs: Sequence[AgentConfig], start: float
+    ) -> List[Agent]:
+        # Tools alteradas chegam pelo rebuild incremental, que troca o stub
+        stubs: List[LazyAgent] = []
+        reused = 0
+        for cfg in configs:
+            stub = self._stubs.get(cfg.id)
+            if stub is not None and stub.config == cfg:
+                reused += 1
+            else:
+                stub = self._factory.create_lazy_agent(cfg)
+            stubs.append(stub)
+        self._stubs = {stub.id: stub for stub in stubs}
+        if self._logger:
+            self._logger.info(
+                "Agentes registrados sob demanda",
+                total=len(stubs),
+                reused=reused,
+                prewarm_top_n=self._prewarm_top_n,
+                elapsed_s=round(time.perf_counter() - start, 3),
+            )
+        if self._prewarm_top_n > 0:
+            if self._prewarm_task is not None:
+                self._prewarm_task.cancel()
+            self._prewarm_task = asyncio.create_task(self._prewarm(stubs))
+        return stubs
+
+    async def _prewarm(self, stubs: List[LazyAgent]) -> None:
+        start = time.perf_counter()
+        by_id = {stub.id: stub for stub in stubs}
+        ranked: List[str] = []
+        if self._usage_repository is not None:
+            try:
+                ranked = await self._usage_repository.get_most_used_agent_ids(
+                    self._prewarm_top_n
+                )
+            except Exception as exc:
+                if self._logger:
+                    self._logger.warning(
+                        "Uso dos agentes indisponível para o pré-aquecimento",
+                        error=str(exc),
+                    )
+        # Completa com a ordem das configs quando há pouco histórico
+        order = [i for i in ranked if i in by_id] + [s.id for s in stubs]
+        targets = [by_id[i] for i in dict.fromkeys(order)][: self._prewarm_top_n]
+        results = await asyncio.gather(
+            *(stub.materialize() for stub in targets), return_exceptions=True
+        )
+        if self._logger:
+            self._logger.info(
+                "Pré-aquecimento de agentes concluído",
+                agent_ids=[stub.id for stub in targets],
+                failed=sum(isinstance(r, BaseException) for r in results),
+                elapsed_s=round(time.perf_counter() - start, 3),
+            )
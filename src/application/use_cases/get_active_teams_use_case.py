@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import AbstractSet, Dict, List, Set, Tuple
 
 from agno.agent import Agent
 from agno.team import Team
 
+from src.application.services.lazy_agent import materialize_members
 from src.application.services.team_factory_service import TeamFactoryService
+from src.domain.entities.team_config import TeamConfig
 from src.domain.ports import ILogger
 from src.domain.repositories.team_config_repository import ITeamConfigRepository
 
@@ -24,6 +26,8 @@ class GetActiveTeamsUseCase:
         self._factory = team_factory_service
         self._repository = team_config_repository
         self._logger = logger
+        # Configs dos teams publicados — base para o rebuild incremental
+        self._configs: Dict[str, TeamConfig] = {}
 
     async def execute(self, agents: List[Agent]) -> List[Team]:
         """Busca configs de teams e cria instâncias usando os agentes fornecidos.
@@ -35,9 +39,13 @@ class GetActiveTeamsUseCase:
             Lista de Teams agno prontos para montar no AgentOS.
         """
         configs = await self._repository.get_active_teams()
+        self._configs = {cfg.id: cfg for cfg in configs}
         if not configs:
             return []
 
+        agents = await materialize_members(
+            agents, {mid for cfg in configs for mid in cfg.member_ids}
+        )
         teams: List[Team] = []
         for config in configs:
             try:
@@ -50,3 +58,40 @@ class GetActiveTeamsUseCase:
                     error=str(exc),
                 )
         return teams
+
+    async def rebuild(
+        self,
+        team_ids: AbstractSet[str],
+        agent_ids: AbstractSet[str],
+        agents: List[Agent],
+    ) -> Tuple[Dict[str, Team], Set[str]]:
+        """Recria os teams alterados e os que têm membros em ``agent_ids``.
+
+        Returns:
+            ``(novos teams por ID, IDs removidos ou desativados)``.
+        """
+        affected = set(team_ids) | {
+            cfg.id for cfg in self._configs.values() if agent_ids & set(cfg.member_ids)
+        }
+        if not affected:
+            return {}, set()
+
+        configs = await self._repository.get_active_teams_by_ids(sorted(affected))
+        removed = affected - {cfg.id for cfg in configs}
+        agents = await materialize_members(
+            agents, {mid for cfg in configs for mid in cfg.member_ids}
+        )
+        built: Dict[str, Team] = {}
+        for config in configs:
+            try:
+                built[config.id] = self._factory.create_team(config, agents)
+                self._configs[config.id] = config
+            except Exception as exc:
+                self._logger.error(
+                    "Erro ao criar team",
+                    team_id=config.id,
+                    error=str(exc),
+                )
+        for team_id in removed:
+            self._configs.pop(team_id, None)
+        return built, removed
@@ -6,6 +6,7 @@ from src.domain.entities.rag_config import RagConfig, SearchStrategy
 from src.domain.entities.search_result import SearchResult
 from src.domain.entities.team_config import TeamConfig
 from src.domain.entities.tool import HttpMethod, ParameterType, Tool, ToolParameter
+from src.domain.entities.tool_http_config import ToolHttpConfig
 
 __all__ = [
     "AgentConfig",
@@ -17,5 +18,6 @@ __all__ = [
     "SearchStrategy",
     "TeamConfig",
     "Tool",
+    "ToolHttpConfig",
     "ToolParameter",
 ]
@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
+from src.domain.entities.tool_http_config import ToolHttpConfig
+
 
 class HttpMethod(Enum):
     """Métodos HTTP suportados."""
@@ -10,6 +12,7 @@ class HttpMethod(Enum):
     PUT = "PUT"
     DELETE = "DELETE"
     PATCH = "PATCH"
+    HEAD = "HEAD"
 
 
 class ParameterType(Enum):
@@ -51,6 +54,7 @@ class Tool:
     instructions: Optional[str] = None
     headers: Optional[Dict[str, str]] = None
     active: bool = True
+    http_config: ToolHttpConfig = field(default_factory=ToolHttpConfig)
 
     def __post_init__(self):
         if not self.id:
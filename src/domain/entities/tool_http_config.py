@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class ToolHttpConfig:
+    """Configuração do cliente HTTP usado por uma tool.
+
+    Tools que apontam para o mesmo host e usam os mesmos limites
+    compartilham o mesmo pool de conexões (keep-alive).
+    """
+
+    timeout_s: Optional[float] = None
+    connect_timeout_s: Optional[float] = None
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_s: float = 30.0
+    http2: bool = True
+    # Cache de respostas GET/HEAD — desativado enquanto ``cache_ttl_s`` for None
+    cache_ttl_s: Optional[float] = None
+    cache_max_bytes: int = 1_048_576
+    # Coalescência de chamadas idênticas concorrentes — None: só GET/HEAD
+    coalesce_requests: Optional[bool] = None
+    # Bulkhead da tool: chamadas simultâneas e fila de espera (0 = fail-fast)
+    max_concurrency: int = 10
+    max_queue: int = 50
+    # Circuit breaker por tool e timeout adaptativo (p99 observado)
+    circuit_breaker: bool = True
+    breaker_error_rate: float = 0.5
+    breaker_min_calls: int = 10
+    breaker_open_s: float = 30.0
+    slow_call_s: Optional[float] = None
+    adaptive_timeout: bool = True
+    # Resposta: bytes lidos do upstream e campos mantidos (caminhos JSONPath)
+    max_response_bytes: int = 262_144
+    response_fields: Optional[List[str]] = None
+
+    def __post_init__(self):
+        if self.timeout_s is not None and self.timeout_s <= 0:
+            raise ValueError("timeout_s deve ser positivo")
+        if self.connect_timeout_s is not None and self.connect_timeout_s <= 0:
+            raise ValueError("connect_timeout_s deve ser positivo")
+        if self.max_connections < 1:
+            raise ValueError("max_connections deve ser >= 1")
+        if self.max_keepalive_connections < 0:
+            raise ValueError("max_keepalive_connections não pode ser negativo")
+        if self.keepalive_expiry_s < 0:
+            raise ValueError("keepalive_expiry_s não pode ser negativo")
+        if self.cache_ttl_s is not None and self.cache_ttl_s <= 0:
+            raise ValueError("cache_ttl_s deve ser positivo")
+        if self.cache_max_bytes < 1:
+            raise ValueError("cache_max_bytes deve ser >= 1")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency deve ser >= 1")
+        if self.max_queue < 0:
+            raise ValueError("max_queue não pode ser negativo")
+        if not 0 < self.breaker_error_rate <= 1:
+            raise ValueError("breaker_error_rate deve estar em (0, 1]")
+        if self.breaker_min_calls < 1:
+            raise ValueError("breaker_min_calls deve ser >= 1")
+        if self.breaker_open_s <= 0:
+            raise ValueError("breaker_open_s deve ser positivo")
+        if self.slow_call_s is not None and self.slow_call_s <= 0:
+            raise ValueError("slow_call_s deve ser positivo")
+        if self.max_response_bytes < 1:
+            raise ValueError("max_response_bytes deve ser >= 1")
@@ -0,0 +1,41 @@
+"""Port para observar alterações nas configurações de agentes, teams e tools."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Set
+
+
+@dataclass
+class ConfigChanges:
+    """IDs de configurações alteradas (inseridas, editadas ou removidas)."""
+
+    agent_ids: Set[str] = field(default_factory=set)
+    team_ids: Set[str] = field(default_factory=set)
+    tool_ids: Set[str] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        return not (self.agent_ids or self.team_ids or self.tool_ids)
+
+    def merge(self, other: ConfigChanges) -> None:
+        self.agent_ids |= other.agent_ids
+        self.team_ids |= other.team_ids
+        self.tool_ids |= other.tool_ids
+
+
+ConfigChangeHandler = Callable[[ConfigChanges], Awaitable[None]]
+
+
+class IConfigWatcher(ABC):
+    """Interface para notificação de alterações de configuração."""
+
+    @abstractmethod
+    async def start(self, on_change: ConfigChangeHandler) -> None:
+        """Começa a observar; ``on_change`` recebe lotes de alterações."""
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Interrompe a observação."""
+        ...
@@ -12,8 +12,14 @@ class IDocumentTreeRepository(ABC):
     """Interface para armazenar e consultar nós da árvore de documentos."""
 
     @abstractmethod
-    async def save_nodes(self, nodes: List[DocumentNode]) -> None:
-        """Persiste uma lista de nós (insert em lote)."""
+    async def save_nodes(
+        self, nodes: List[DocumentNode], *, checksum: Optional[str] = None
+    ) -> None:
+        """Persiste uma lista de nós (insert em lote).
+
+        Com ``checksum``, os nós já são gravados marcados com a versão do
+        conteúdo.
+        """
         ...
 
     @abstractmethod
@@ -26,6 +32,11 @@ class IDocumentTreeRepository(ABC):
         """Retorna os filhos diretos de um nó."""
         ...
 
+    @abstractmethod
+    async def get_document_nodes(self, doc_name: str) -> List[DocumentNode]:
+        """Retorna todos os nós de um documento, na ordem de indexação."""
+        ...
+
     @abstractmethod
     async def get_node(self, node_id: str) -> Optional[DocumentNode]:
         """Retorna um nó pelo ID."""
@@ -35,3 +46,18 @@ class IDocumentTreeRepository(ABC):
     async def exists(self, doc_name: str) -> bool:
         """Verifica se já existem nós indexados para o documento."""
         ...
+
+    @abstractmethod
+    async def get_checksum(self, doc_name: str) -> Optional[str]:
+        """Retorna o checksum do conteúdo indexado (``None`` se ausente)."""
+        ...
+
+    @abstractmethod
+    async def delete_document(
+        self, doc_name: str, *, keep_checksum: Optional[str] = None
+    ) -> None:
+        """Remove os nós de um documento.
+
+        Com ``keep_checksum``, remove só os nós de outras versões.
+        """
+        ...
@@ -0,0 +1,25 @@
+"""Port para armazenamento endereçado por conteúdo de sumários e embeddings."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+
+class IEmbeddingStore(ABC):
+    """Interface para reaproveitar sumários/embeddings entre indexações.
+
+    As chaves são hashes do conteúdo do nó combinado com o ID do modelo
+    que produziu o valor; se o texto de uma seção não muda, o valor
+    armazenado continua válido e não precisa ser recomputado.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Retorna ``{chave: valor}`` para as chaves encontradas."""
+        ...
+
+    @abstractmethod
+    async def put_many(self, entries: Dict[str, Any], *, kind: str) -> None:
+        """Armazena os valores (``kind`` = ``"summary"`` ou ``"embedding"``)."""
+        ...
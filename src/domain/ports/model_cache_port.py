@@ -0,0 +1,26 @@
+"""Port para cache de instâncias de modelos (LLM e embedders)."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+
+class IModelCache(ABC):
+    """Interface para reaproveitar instâncias de modelos já criadas.
+
+    Usada pelas factories de modelo: a criação só ocorre em cache miss e
+    chamadas concorrentes para a mesma chave aguardam a mesma criação.
+    """
+
+    @abstractmethod
+    def get_or_create_sync(
+        self, cache_key: str, factory_func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Retorna o modelo em cache ou cria com ``factory_func(*args, **kwargs)``."""
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        """Estatísticas do cache (tamanho, hits, misses)."""
+        ...
@@ -0,0 +1,27 @@
+"""Port para cache de embeddings de queries."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class IQueryEmbeddingCache(ABC):
+    """Interface para reaproveitar embeddings de queries já computadas.
+
+    A chave é composta pelo provider do embedder, o ID do modelo e o
+    texto da query — a normalização do texto fica a cargo da
+    implementação.
+    """
+
+    @abstractmethod
+    def get(self, provider: str, model_id: str, query: str) -> Optional[List[float]]:
+        """Retorna o embedding em cache ou ``None``."""
+        ...
+
+    @abstractmethod
+    def put(
+        self, provider: str, model_id: str, query: str, embedding: List[float]
+    ) -> None:
+        """Armazena o embedding da query."""
+        ...
@@ -12,3 +12,8 @@ class ISummaryGenerator(ABC):
     async def generate_summary(self, content: str) -> str:
         """Gera um resumo conciso do conteúdo fornecido."""
         ...
+
+    @property
+    def model_key(self) -> str:
+        """Identifica o modelo gerador (compõe a chave de cache de sumários)."""
+        return type(self).__name__
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Sequence
 from src.domain.entities.agent_config import AgentConfig
 
 
@@ -15,3 +15,10 @@ class IAgentConfigRepository(ABC):
     async def get_agent_by_id(self, agent_id: str) -> AgentConfig:
         """Retorna um agente por ID."""
         ...
+
+    @abstractmethod
+    async def get_active_agents_by_ids(
+        self, agent_ids: Sequence[str]
+    ) -> List[AgentConfig]:
+        """Retorna os agentes ativos dentre ``agent_ids``."""
+        ...
@@ -0,0 +1,15 @@
+"""Interface para estatísticas de uso dos agentes."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class IAgentUsageRepository(ABC):
+    """Ranking de agentes por uso — base do pré-aquecimento."""
+
+    @abstractmethod
+    async def get_most_used_agent_ids(self, limit: int) -> List[str]:
+        """IDs dos ``limit`` agentes mais usados, do mais ao menos usado."""
+        ...
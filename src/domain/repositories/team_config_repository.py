@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from src.domain.entities.team_config import TeamConfig
 
@@ -20,3 +20,10 @@ class ITeamConfigRepository(ABC):
     async def get_team_by_id(self, team_id: str) -> Optional[TeamConfig]:
         """Retorna um team por ID."""
         ...
+
+    @abstractmethod
+    async def get_active_teams_by_ids(
+        self, team_ids: Sequence[str]
+    ) -> List[TeamConfig]:
+        """Retorna os teams ativos dentre ``team_ids``."""
+        ...
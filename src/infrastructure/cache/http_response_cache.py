@@ -0,0 +1,192 @@
+"""Cache de respostas de tools HTTP idempotentes (GET/HEAD)."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+
+from src.infrastructure.telemetry.metrics import TelemetryMetrics
+
+_CACHE_NAME = "http_responses"
+
+
+class CachedResponse:
+    """Resposta serializada + validadores para revalidação condicional."""
+
+    __slots__ = ("body", "etag", "last_modified", "expires_at", "size")
+
+    def __init__(
+        self,
+        body: str,
+        *,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        expires_at: float,
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.size = len(body.encode("utf-8"))
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Cabeçalhos ``If-None-Match``/``If-Modified-Since`` da entrada."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpResponseCache:
+    """Cache LRU limitado em bytes, com TTL e respeito a ``Cache-Control``.
+
+    Uma instância por tool (opt-in via ``ToolHttpConfig.cache_ttl_s``).
+    A chave é a URL resolvida + parâmetros de query.  O tempo de vida de
+    uma entrada é o ``max-age`` do upstream (limitado ao TTL da tool) ou
+    o próprio TTL; ``no-store`` impede o armazenamento e ``no-cache``
+    força revalidação a cada uso.  Entradas vencidas com ``ETag`` ou
+    ``Last-Modified`` são mantidas para revalidação condicional — um
+    ``304`` renova a entrada sem transferir o corpo de novo.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_bytes: int) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds deve ser positivo")
+        if max_bytes < 1:
+            raise ValueError("max_bytes deve ser >= 1")
+        self._ttl = ttl_seconds
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]]) -> str:
+        """Chave estável para URL + parâmetros (ordem dos parâmetros irrelevante)."""
+        if not params:
+            return url
+        return url + "?" + json.dumps(params, sort_keys=True, default=str)
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """Entrada de ``key`` (fresca ou revalidável) ou ``None``.
+
+        Entradas vencidas sem validadores são descartadas.  Só entradas
+        frescas contam como hit.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._record_miss()
+            return None
+        if entry.is_fresh():
+            self._entries.move_to_end(key)
+            self._hits += 1
+            TelemetryMetrics.record_cache_hit(_CACHE_NAME)
+            return entry
+        if not entry.can_revalidate():
+            self._remove(key)
+            self._record_miss()
+            return None
+        self._record_miss()
+        return entry
+
+    def store(self, key: str, body: str, headers: Mapping[str, str]) -> None:
+        """Armazena a resposta conforme os cabeçalhos de cache do upstream."""
+        lifetime = self._lifetime(headers)
+        if lifetime is None:
+            self._remove(key)
+            return
+        entry = CachedResponse(
+            body,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            expires_at=time.monotonic() + lifetime,
+        )
+        if entry.size > self._max_bytes:
+            self._remove(key)
+            return
+        if lifetime <= 0 and not entry.can_revalidate():
+            self._remove(key)
+            return
+        self._remove(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+    def revalidated(self, key: str, headers: Mapping[str, str]) -> Optional[str]:
+        """Renova a entrada após um ``304`` e retorna o corpo em cache."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        lifetime = self._lifetime(headers)
+        entry.expires_at = time.monotonic() + (lifetime or 0.0)
+        if headers.get("etag"):
+            entry.etag = headers["etag"]
+        self._entries.move_to_end(key)
+        self._revalidations += 1
+        return entry.body
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> dict:
+        total = self._hits + self._misses
+        return {
+            "cache_size": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "total_hits": self._hits,
+            "total_misses": self._misses,
+            "revalidations": self._revalidations,
+            "hit_rate_percent": round(self._hits / total * 100, 2) if total else 0,
+        }
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _lifetime(self, headers: Mapping[str, str]) -> Optional[float]:
+        """Segundos de frescor; ``None`` se a resposta não pode ser guardada."""
+        directives = _parse_cache_control(headers.get("cache-control", ""))
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return 0.0
+        max_age = directives.get("max-age")
+        if max_age is not None:
+            try:
+                return max(0.0, min(float(max_age), self._ttl))
+            except ValueError:
+                pass
+        return self._ttl
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _record_miss(self) -> None:
+        self._misses += 1
+        TelemetryMetrics.record_cache_miss(_CACHE_NAME)
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """``"max-age=60, no-cache"`` → ``{"max-age": "60", "no-cache": None}``."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
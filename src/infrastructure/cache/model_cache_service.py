@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict, Optional
 
 from src.domain.ports import ILogger
+from src.domain.ports.model_cache_port import IModelCache
 
 
 class ModelCacheEntry:
@@ -30,22 +33,50 @@ class ModelCacheEntry:
         return self.model
 
 
-class ModelCacheService:
-    """Serviço de cache otimizado para modelos de IA."""
+class _KeyLock:
+    """Lock de uma chave + quantas threads o seguram ou aguardam."""
 
-    def __init__(self, logger: ILogger, ttl_minutes: int = 30):
-        self._cache: Dict[str, ModelCacheEntry] = {}
-        self._cache_lock: Optional[asyncio.Lock] = None
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class ModelCacheService(IModelCache):
+    """Serviço de cache otimizado para modelos de IA.
+
+    - LRU: ao exceder ``max_size`` a entrada acessada há mais tempo é
+      descartada.
+    - Single-flight por chave: misses concorrentes da mesma chave
+      aguardam uma única criação; chaves distintas são criadas em
+      paralelo (não há lock global durante a factory).
+    - Expiração: entradas vencidas são ignoradas na leitura e removidas
+      periodicamente por ``start_cleanup_task``.
+    """
+
+    def __init__(
+        self,
+        logger: ILogger,
+        ttl_minutes: int = 30,
+        *,
+        max_size: int = 128,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size deve ser >= 1")
+        self._cache: "OrderedDict[str, ModelCacheEntry]" = OrderedDict()
         self._ttl_minutes = ttl_minutes
+        self._max_size = max_size
         self._total_hits = 0
         self._total_misses = 0
+        self._evictions = 0
         self._logger = logger
-
-    def _get_cache_lock(self) -> asyncio.Lock:
-        """Obtém o lock de cache, criando-o se necessário."""
-        if self._cache_lock is None:
-            self._cache_lock = asyncio.Lock()
-        return self._cache_lock
+        # Protege apenas leituras/escritas do dict — nunca a factory
+        self._state_lock = threading.Lock()
+        # Só existem enquanto há criação em andamento para a chave
+        self._key_locks: Dict[str, _KeyLock] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._cleanup_task: Optional[asyncio.Task] = None
 
     async def get_or_create(
         self,
@@ -62,38 +93,82 @@ class ModelCacheService:
             factory_func: Função para criar o modelo em caso de cache miss
             *args, **kwargs: Argumentos para a factory function
         """
-        async with self._get_cache_lock():
-            # Verificar cache hit
-            if cache_key in self._cache:
-                entry = self._cache[cache_key]
-                if not entry.is_expired():
-                    self._total_hits += 1
-                    return entry.access()
-                else:
-                    # Cache expirado - remover
-                    del self._cache[cache_key]
-
-            # Cache miss - criar novo modelo
-            self._total_misses += 1
+        model = self._lookup(cache_key)
+        if model is not None:
+            return model
 
-            try:
-                # Se a factory for async, aguardar diretamente; caso contrário, offload para thread.
-                # Obs.: para operações CPU-bound considere usar ProcessPoolExecutor e/ou tornar a factory assíncrona.
-                if asyncio.iscoroutinefunction(factory_func):
-                    model = await factory_func(*args, **kwargs)
-                else:
-                    # asyncio.to_thread preserva kwargs corretamente e usa o ThreadPool padrão
-                    model = await asyncio.to_thread(factory_func, *args, **kwargs)
+        if not asyncio.iscoroutinefunction(factory_func):
+            # Factory síncrona: roda em thread, com single-flight por chave
+            return await asyncio.to_thread(
+                self.get_or_create_sync, cache_key, factory_func, *args, **kwargs
+            )
 
-                # Adicionar ao cache
-                self._cache[cache_key] = ModelCacheEntry(model, self._ttl_minutes)
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
 
-                return model
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            self._record_miss()
+            model = await factory_func(*args, **kwargs)
+        except Exception as e:
+            self._logger.error("Erro ao criar modelo",
+                               cache_key=cache_key, error=str(e))
+            future.set_exception(e)
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            self._store(cache_key, model)
+            future.set_result(model)
+            return model
+        finally:
+            self._inflight.pop(cache_key, None)
 
-            except Exception as e:
-                self._logger.error("Erro ao criar modelo",
-                                   cache_key=cache_key, error=str(e))
-                raise
+    def get_or_create_sync(
+        self,
+        cache_key: str,
+        factory_func: Callable,
+        *args,
+        **kwargs
+    ) -> Any:
+        """Versão síncrona de ``get_or_create`` para factories síncronas.
+
+        Threads concorrentes com a mesma chave serializam em um lock
+        daquela chave; a segunda encontra o modelo já em cache.
+        """
+        model = self._lookup(cache_key)
+        if model is not None:
+            return model
+
+        with self._state_lock:
+            key_lock = self._key_locks.get(cache_key)
+            if key_lock is None:
+                key_lock = self._key_locks[cache_key] = _KeyLock()
+            key_lock.users += 1
+        try:
+            with key_lock.lock:
+                model = self._lookup(cache_key, count_hit=False)
+                if model is not None:
+                    self._record_hit()
+                    return model
+                self._record_miss()
+                try:
+                    model = factory_func(*args, **kwargs)
+                except Exception as e:
+                    self._logger.error("Erro ao criar modelo",
+                                       cache_key=cache_key, error=str(e))
+                    raise
+                self._store(cache_key, model)
+                return model
+        finally:
+            with self._state_lock:
+                key_lock.users -= 1
+                if key_lock.users == 0:
+                    del self._key_locks[cache_key]
 
     async def invalidate(self, cache_key: Optional[str] = None) -> None:
         """
@@ -102,16 +177,15 @@ class ModelCacheService:
         Args:
             cache_key: Chave específica para invalidar ou None para invalidar tudo
         """
-        async with self._get_cache_lock():
+        with self._state_lock:
             if cache_key:
-                if cache_key in self._cache:
-                    del self._cache[cache_key]
+                self._cache.pop(cache_key, None)
             else:
                 self._cache.clear()
 
     async def cleanup_expired(self) -> int:
         """Remove entradas expiradas do cache."""
-        async with self._get_cache_lock():
+        with self._state_lock:
             expired_keys = [
                 key for key, entry in self._cache.items()
                 if entry.is_expired()
@@ -122,15 +196,38 @@ class ModelCacheService:
 
             return len(expired_keys)
 
+    def start_cleanup_task(self, interval_seconds: float = 60.0) -> None:
+        """Agenda ``cleanup_expired`` a cada ``interval_seconds`` no event loop atual."""
+        if self._cleanup_task and not self._cleanup_task.done():
+            return
+        self._cleanup_task = asyncio.get_running_loop().create_task(
+            self._cleanup_loop(interval_seconds)
+        )
+
+    async def stop_cleanup_task(self) -> None:
+        """Cancela a limpeza periódica, se ativa."""
+        task, self._cleanup_task = self._cleanup_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
     def get_stats(self) -> dict:
         """Retorna estatísticas do cache."""
         total_requests = self._total_hits + self._total_misses
         hit_rate = (self._total_hits / total_requests * 100) if total_requests > 0 else 0
 
+        with self._state_lock:
+            items = list(self._cache.items())
         return {
-            "cache_size": len(self._cache),
+            "cache_size": len(items),
+            "max_size": self._max_size,
             "total_hits": self._total_hits,
             "total_misses": self._total_misses,
+            "evictions": self._evictions,
             "hit_rate_percent": round(hit_rate, 2),
             "entries": [
                 {
@@ -140,7 +237,7 @@ class ModelCacheService:
                     "last_access": entry.last_access.isoformat(),
                     "is_expired": entry.is_expired()
                 }
-                for key, entry in self._cache.items()
+                for key, entry in items
             ]
         }
 
@@ -162,3 +259,49 @@ class ModelCacheService:
             await asyncio.gather(*tasks, return_exceptions=True)
         except Exception as e:
             self._logger.warning("Erro durante warmup do cache", error=str(e))
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _lookup(self, cache_key: str, *, count_hit: bool = True) -> Any:
+        """Retorna o modelo válido em cache (marcando-o como recente) ou ``None``."""
+        with self._state_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            if entry.is_expired():
+                del self._cache[cache_key]
+                return None
+            self._cache.move_to_end(cache_key)
+            if count_hit:
+                self._total_hits += 1
+            return entry.access()
+
+    def _store(self, cache_key: str, model: Any) -> None:
+        with self._state_lock:
+            self._cache[cache_key] = ModelCacheEntry(model, self._ttl_minutes)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def _record_hit(self) -> None:
+        with self._state_lock:
+            self._total_hits += 1
+
+    def _record_miss(self) -> None:
+        with self._state_lock:
+            self._total_misses += 1
+
+    async def _cleanup_loop(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = await self.cleanup_expired()
+                if removed:
+                    self._logger.debug(
+                        "Modelos expirados removidos do cache", removed=removed
+                    )
+            except Exception as e:
+                self._logger.warning(
+                    "Erro na limpeza do cache de modelos", error=str(e)
+                )
@@ -0,0 +1,74 @@
+"""Cache LRU/TTL de embeddings de queries de busca."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from src.domain.ports.query_embedding_cache_port import IQueryEmbeddingCache
+from src.infrastructure.telemetry.metrics import TelemetryMetrics
+
+_CACHE_NAME = "query_embeddings"
+
+_CacheKey = Tuple[str, str, str]
+
+
+class QueryEmbeddingCache(IQueryEmbeddingCache):
+    """Cache em memória, limitado em tamanho (LRU) e com TTL.
+
+    Compartilhado entre todas as estratégias criadas pelo
+    ``KnowledgeSearchFactory``: agentes que usam o mesmo embedder
+    reaproveitam embeddings de queries repetidas.  Queries são
+    normalizadas (espaços colapsados, *casefold*) antes de compor a
+    chave.  Hits e misses são exportados via ``TelemetryMetrics``.
+    """
+
+    def __init__(self, *, max_size: int = 1024, ttl_seconds: float = 3600.0) -> None:
+        if max_size < 1:
+            raise ValueError("max_size deve ser >= 1")
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[_CacheKey, Tuple[float, List[float]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, provider: str, model_id: str, query: str) -> Optional[List[float]]:
+        key = self._key(provider, model_id, query)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self._hits += 1
+            TelemetryMetrics.record_cache_hit(_CACHE_NAME)
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self._misses += 1
+        TelemetryMetrics.record_cache_miss(_CACHE_NAME)
+        return None
+
+    def put(
+        self, provider: str, model_id: str, query: str, embedding: List[float]
+    ) -> None:
+        key = self._key(provider, model_id, query)
+        self._entries[key] = (time.monotonic() + self._ttl, embedding)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        total = self._hits + self._misses
+        return {
+            "cache_size": len(self._entries),
+            "max_size": self._max_size,
+            "total_hits": self._hits,
+            "total_misses": self._misses,
+            "hit_rate_percent": round(self._hits / total * 100, 2) if total else 0,
+        }
+
+    @staticmethod
+    def _key(provider: str, model_id: str, query: str) -> _CacheKey:
+        return provider, model_id, " ".join(query.split()).casefold()
@@ -20,11 +20,60 @@ class AppConfig:
     ollama_base_url: str
     openai_api_key: Optional[str] = None
 
+    # ── Pool de conexões MongoDB (compartilhado) ─────────────────────
+    mongo_max_pool_size: int = 50
+    mongo_min_pool_size: int = 5
+    mongo_max_idle_time_ms: int = 30_000
+    mongo_timeout_ms: int = 5_000
+
     # ── OpenTelemetry / Observabilidade ──────────────────────────────
     otel_enabled: bool = True
     otel_exporter_endpoint: str = "http://localhost:4317"
     otel_service_name: str = "orquestrador-ia"
 
+    # ── Indexação hierárquica ────────────────────────────────────────
+    embedding_batch_size: int = 32
+    embedding_max_workers: int = 4
+    rag_reindex_if_changed: bool = False
+    query_embedding_cache_size: int = 1024
+    query_embedding_cache_ttl_s: float = 3600.0
+
+    # ── Cache de modelos ─────────────────────────────────────────────
+    model_cache_max_size: int = 128
+    model_cache_ttl_minutes: int = 30
+    model_cache_cleanup_interval_s: float = 60.0
+
+    # ── Tools HTTP ───────────────────────────────────────────────────
+    http_host_max_concurrency: int = 32
+    http_host_max_queue: int = 128
+
+    # ── Cache de agentes/teams ───────────────────────────────────────
+    agent_cache_ttl_minutes: int = 5
+    agent_cache_stale_grace_minutes: float = 10.0
+
+    # ── Criação de agentes sob demanda ───────────────────────────────
+    # Stubs sob demanda não ganham interface AG-UI (só rotas REST do AgentOS)
+    agent_lazy_loading: bool = False
+    agent_prewarm_top_n: int = 0
+
+    # ── Recarga incremental de configurações ─────────────────────────
+    config_watch_enabled: bool = True
+    config_watch_poll_interval_s: float = 10.0
+    config_watch_debounce_s: float = 1.0
+
+    # ── Envio de logs em segundo plano ───────────────────────────────
+    log_async_enabled: bool = False
+    log_queue_size: int = 10_000
+    log_batch_size: int = 256
+    log_flush_interval_s: float = 0.5
+    log_drop_policy: str = "drop_newest"
+
+    # ── Amostragem de logs (debug/info) ──────────────────────────────
+    log_sample_ratios: str = ""
+    log_rate_limit_per_s: float = 0.0
+    log_rate_limit_burst: int = 20
+    log_suppressed_summary_interval_s: float = 60.0
+
     @classmethod
     def load(cls) -> AppConfig:
         """Carrega e valida configurações a partir de variáveis de ambiente."""
@@ -40,11 +89,73 @@ class AppConfig:
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             ollama_base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
             openai_api_key=os.getenv("OPENAI_API_KEY"),
+            mongo_max_pool_size=int(os.getenv("MONGO_MAX_POOL_SIZE", "50")),
+            mongo_min_pool_size=int(os.getenv("MONGO_MIN_POOL_SIZE", "5")),
+            mongo_max_idle_time_ms=int(
+                os.getenv("MONGO_MAX_IDLE_TIME_MS", "30000")
+            ),
+            mongo_timeout_ms=int(os.getenv("MONGO_TIMEOUT_MS", "5000")),
             otel_enabled=os.getenv("OTEL_ENABLED", "true").lower() in ("true", "1", "yes"),
             otel_exporter_endpoint=os.getenv(
                 "OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317"
             ),
             otel_service_name=os.getenv("OTEL_SERVICE_NAME", "orquestrador-ia"),
+            embedding_batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", "32")),
+            embedding_max_workers=int(os.getenv("EMBEDDING_MAX_WORKERS", "4")),
+            rag_reindex_if_changed=os.getenv(
+                "RAG_REINDEX_IF_CHANGED", "false"
+            ).lower() in ("true", "1", "yes"),
+            query_embedding_cache_size=int(
+                os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024")
+            ),
+            query_embedding_cache_ttl_s=float(
+                os.getenv("QUERY_EMBEDDING_CACHE_TTL_S", "3600")
+            ),
+            model_cache_max_size=int(os.getenv("MODEL_CACHE_MAX_SIZE", "128")),
+            model_cache_ttl_minutes=int(
+                os.getenv("MODEL_CACHE_TTL_MINUTES", "30")
+            ),
+            model_cache_cleanup_interval_s=float(
+                os.getenv("MODEL_CACHE_CLEANUP_INTERVAL_S", "60")
+            ),
+            http_host_max_concurrency=int(
+                os.getenv("HTTP_HOST_MAX_CONCURRENCY", "32")
+            ),
+            http_host_max_queue=int(os.getenv("HTTP_HOST_MAX_QUEUE", "128")),
+            agent_cache_ttl_minutes=int(
+                os.getenv("AGENT_CACHE_TTL_MINUTES", "5")
+            ),
+            agent_cache_stale_grace_minutes=float(
+                os.getenv("AGENT_CACHE_STALE_GRACE_MINUTES", "10")
+            ),
+            agent_lazy_loading=os.getenv(
+                "AGENT_LAZY_LOADING", "false"
+            ).lower() in ("true", "1", "yes"),
+            agent_prewarm_top_n=int(os.getenv("AGENT_PREWARM_TOP_N", "0")),
+            config_watch_enabled=os.getenv(
+                "CONFIG_WATCH_ENABLED", "true"
+            ).lower() in ("true", "1", "yes"),
+            config_watch_poll_interval_s=float(
+                os.getenv("CONFIG_WATCH_POLL_INTERVAL_S", "10")
+            ),
+            config_watch_debounce_s=float(
+                os.getenv("CONFIG_WATCH_DEBOUNCE_S", "1")
+            ),
+            log_async_enabled=os.getenv(
+                "LOG_ASYNC_ENABLED", "false"
+            ).lower() in ("true", "1", "yes"),
+            log_queue_size=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+            log_batch_size=int(os.getenv("LOG_BATCH_SIZE", "256")),
+            log_flush_interval_s=float(
+                os.getenv("LOG_FLUSH_INTERVAL_S", "0.5")
+            ),
+            log_drop_policy=os.getenv("LOG_DROP_POLICY", "drop_newest"),
+            log_sample_ratios=os.getenv("LOG_SAMPLE_RATIOS", ""),
+            log_rate_limit_per_s=float(os.getenv("LOG_RATE_LIMIT_PER_S", "0")),
+            log_rate_limit_burst=int(os.getenv("LOG_RATE_LIMIT_BURST", "20")),
+            log_suppressed_summary_interval_s=float(
+                os.getenv("LOG_SUPPRESSED_SUMMARY_INTERVAL_S", "60")
+            ),
         )
         config._validate()
         return config
@@ -3,34 +3,50 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Optional
+import contextlib
+from typing import Any, ContextManager, Optional
 
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from src.application.services.agent_factory_service import AgentFactoryService
 from src.application.services.document_indexing_service import DocumentIndexingService
+from src.application.services.document_tree_index import DocumentTreeIndex
+from src.application.services.embedding_pipeline import BatchEmbeddingPipeline
 from src.application.services.embedder_model_factory_service import EmbedderModelFactory
 from src.application.services.knowledge_search_factory import KnowledgeSearchFactory
 from src.application.services.model_factory_service import ModelFactory
+from src.application.services.resource_pool import ResourcePool
 from src.application.services.team_factory_service import TeamFactoryService
 from src.application.use_cases.get_active_agents_use_case import GetActiveAgentsUseCase
 from src.application.use_cases.get_active_teams_use_case import GetActiveTeamsUseCase
 from src.domain.ports import ILogger
+from src.infrastructure.cache.model_cache_service import ModelCacheService
+from src.infrastructure.cache.query_embedding_cache import QueryEmbeddingCache
 from src.infrastructure.config.app_config import AppConfig
+from src.infrastructure.http.client_pool import HttpClientPool
 from src.infrastructure.http.http_tool_factory import HttpToolFactory
 from src.infrastructure.logging.logger_adapter import StructlogLoggerAdapter
+from src.infrastructure.logging.sampling import LogSampler, parse_ratios
+from src.infrastructure.logging.structlog_logger import sanitizer_engine
 from src.infrastructure.parsers.text_document_parser import TextDocumentParser
 from src.infrastructure.repositories.mongo_agent_config_repository import (
     MongoAgentConfigRepository,
 )
+from src.infrastructure.repositories.mongo_agent_usage_repository import (
+    MongoAgentUsageRepository,
+)
+from src.infrastructure.repositories.mongo_base import MongoClientFactory
+from src.infrastructure.repositories.mongo_config_watcher import MongoConfigWatcher
 from src.infrastructure.repositories.mongo_document_tree_repository import (
     MongoDocumentTreeRepository,
 )
+from src.infrastructure.repositories.mongo_embedding_store import MongoEmbeddingStore
 from src.infrastructure.repositories.mongo_team_config_repository import (
     MongoTeamConfigRepository,
 )
 from src.infrastructure.repositories.mongo_tool_repository import MongoToolRepository
 from src.infrastructure.services.llm_summary_generator import LLMSummaryGenerator
+from src.infrastructure.telemetry.startup_profiler import StartupProfiler
 from src.presentation.controllers.orquestrador_controller import OrquestradorController
 
 
@@ -105,29 +121,52 @@ class HealthService:
 class DependencyContainer:
     """Composition Root — cria e fornece todas as dependências."""
 
-    def __init__(self, config: AppConfig) -> None:
+    def __init__(
+        self, config: AppConfig, profiler: Optional[StartupProfiler] = None
+    ) -> None:
         self.config = config
+        self._profiler = profiler
         self._logger: ILogger = StructlogLoggerAdapter("app")
         self._mongo_client: Optional[AsyncIOMotorClient] = None
         self._health_service: Optional[HealthService] = None
         self._controller: Optional[OrquestradorController] = None
+        self._embedding_pipeline: Optional[BatchEmbeddingPipeline] = None
+        self._model_cache: Optional[ModelCacheService] = None
+        self._http_client_pool: Optional[HttpClientPool] = None
+        self._agents_use_case: Optional[GetActiveAgentsUseCase] = None
+        self._agent_factory: Optional[AgentFactoryService] = None
 
     @classmethod
-    async def create_async(cls, config: AppConfig) -> DependencyContainer:
-        container = cls(config)
+    async def create_async(
+        cls, config: AppConfig, profiler: Optional[StartupProfiler] = None
+    ) -> DependencyContainer:
+        container = cls(config, profiler)
         await container._initialize()
         return container
 
     async def _initialize(self) -> None:
-        self._mongo_client = AsyncIOMotorClient(
-            self.config.mongo_connection_string,
-            maxPoolSize=50,
-            minPoolSize=5,
-            connectTimeoutMS=5000,
-            serverSelectionTimeoutMS=5000,
+        StructlogLoggerAdapter.configure_sampling(
+            LogSampler(
+                ratios=parse_ratios(self.config.log_sample_ratios),
+                rate_per_s=self.config.log_rate_limit_per_s,
+                burst=self.config.log_rate_limit_burst,
+                summary_interval_s=self.config.log_suppressed_summary_interval_s,
+            )
+        )
+
+        # Um único pool para repositórios, watcher e agno (db/vector db)
+        MongoClientFactory.configure(
+            max_pool_size=self.config.mongo_max_pool_size,
+            min_pool_size=self.config.mongo_min_pool_size,
+            max_idle_time_ms=self.config.mongo_max_idle_time_ms,
+            timeout_ms=self.config.mongo_timeout_ms,
+        )
+        self._mongo_client = MongoClientFactory.get_client(
+            self.config.mongo_connection_string
         )
         try:
-            await self._mongo_client.admin.command("ping")
+            with self._phase("mongo_connect"):
+                await self._mongo_client.admin.command("ping")
         except Exception as exc:
             self._logger.warning(
                 "MongoDB não disponível na inicialização", error=str(exc)
@@ -139,9 +178,25 @@ class DependencyContainer:
         conn = self.config.mongo_connection_string
         db = self.config.mongo_database_name
 
-        model_factory = ModelFactory(logger=self._logger)
-        embedder_factory = EmbedderModelFactory(logger=self._logger)
-        tool_factory = HttpToolFactory(logger=self._logger)
+        self._model_cache = ModelCacheService(
+            self._logger,
+            ttl_minutes=self.config.model_cache_ttl_minutes,
+            max_size=self.config.model_cache_max_size,
+        )
+        self._model_cache.start_cleanup_task(
+            self.config.model_cache_cleanup_interval_s
+        )
+        model_factory = ModelFactory(logger=self._logger, cache=self._model_cache)
+        embedder_factory = EmbedderModelFactory(
+            logger=self._logger, cache=self._model_cache
+        )
+        self._http_client_pool = HttpClientPool(self._logger)
+        tool_factory = HttpToolFactory(
+            logger=self._logger,
+            client_pool=self._http_client_pool,
+            host_max_concurrency=self.config.http_host_max_concurrency,
+            host_max_queue=self.config.http_host_max_queue,
+        )
 
         agent_config_repo = MongoAgentConfigRepository(
             connection_string=conn, database_name=db, logger=self._logger
@@ -156,30 +211,55 @@ class DependencyContainer:
             connection_string=conn, database_name=db, logger=self._logger
         )
         try:
-            await tree_repo.ensure_indexes()
+            with self._phase("index_creation"):
+                await tree_repo.ensure_indexes()
         except Exception as exc:
             self._logger.warning(
                 "Não foi possível criar índices da árvore de documentos",
                 error=str(exc),
             )
 
+        tree_index = DocumentTreeIndex(
+            tree_repository=tree_repo, logger=self._logger
+        )
+
         summary_generator = LLMSummaryGenerator(
             model_factory=model_factory, logger=self._logger
         )
+        self._embedding_pipeline = BatchEmbeddingPipeline(
+            logger=self._logger,
+            batch_size=self.config.embedding_batch_size,
+            max_workers=self.config.embedding_max_workers,
+        )
         indexing_service = DocumentIndexingService(
             parser=doc_parser,
             tree_repository=tree_repo,
             summary_generator=summary_generator,
             embedder_factory=embedder_factory,
             logger=self._logger,
+            tree_index=tree_index,
+            embedding_pipeline=self._embedding_pipeline,
+            embedding_store=MongoEmbeddingStore(
+                connection_string=conn, database_name=db, logger=self._logger
+            ),
+            reindex_if_changed=self.config.rag_reindex_if_changed,
         )
         search_factory = KnowledgeSearchFactory(
-            tree_repository=tree_repo, logger=self._logger
+            tree_repository=tree_repo,
+            logger=self._logger,
+            tree_index=tree_index,
+            embedding_cache=QueryEmbeddingCache(
+                max_size=self.config.query_embedding_cache_size,
+                ttl_seconds=self.config.query_embedding_cache_ttl_s,
+            ),
         )
 
+        resource_pool = ResourcePool()
+        sync_client = MongoClientFactory.get_sync_client(conn)
         agent_factory = AgentFactoryService(
             db_url=conn,
             db_name=db,
+            mongo_client=sync_client,
             logger=self._logger,
             model_factory=model_factory,
             embedder_factory=embedder_factory,
@@ -187,28 +267,62 @@ class DependencyContainer:
             tool_repository=tool_repo,
             indexing_service=indexing_service,
             search_factory=search_factory,
+            resource_pool=resource_pool,
         )
+        self._agent_factory = agent_factory
 
         team_factory = TeamFactoryService(
             db_url=conn,
             db_name=db,
+            mongo_client=sync_client,
             logger=self._logger,
             model_factory=model_factory,
+            resource_pool=resource_pool,
         )
 
         team_config_repo = MongoTeamConfigRepository(
             connection_string=conn, database_name=db, logger=self._logger
         )
 
-        agents_use_case = GetActiveAgentsUseCase(agent_factory, agent_config_repo)
+        agents_use_case = GetActiveAgentsUseCase(
+            agent_factory,
+            agent_config_repo,
+            self._logger,
+            lazy=self.config.agent_lazy_loading,
+            prewarm_top_n=self.config.agent_prewarm_top_n,
+            usage_repository=MongoAgentUsageRepository(
+                connection_string=conn, database_name=db, logger=self._logger
+            ),
+        )
+        self._agents_use_case = agents_use_case
         teams_use_case = GetActiveTeamsUseCase(
             team_factory, team_config_repo, self._logger
         )
 
+        config_watcher = (
+            MongoConfigWatcher(
+                connection_string=conn,
+                database_name=db,
+                logger=self._logger,
+                poll_interval_s=self.config.config_watch_poll_interval_s,
+                debounce_s=self.config.config_watch_debounce_s,
+            )
+            if self.config.config_watch_enabled
+            else None
+        )
+
         self._controller = OrquestradorController(
             get_active_agents_use_case=agents_use_case,
             get_active_teams_use_case=teams_use_case,
             logger=self._logger,
+            cache_stats_providers={
+                "models": self._model_cache.get_stats,
+                "mongo_pool": MongoClientFactory.get_pool_stats,
+                "log_sanitizer": sanitizer_engine.get_stats,
+            },
+            config_watcher=config_watcher,
+            cache_ttl_minutes=self.config.agent_cache_ttl_minutes,
+            stale_grace_minutes=self.config.agent_cache_stale_grace_minutes,
         )
 
     def get_orquestrador_controller(self) -> OrquestradorController:
@@ -219,11 +333,29 @@ class DependencyContainer:
     def health_service(self) -> Optional[HealthService]:
         return self._health_service
 
+    def get_agent_build_times(self) -> dict:
+        """Início/fim e etapas da construção de cada agente (ver AgentFactoryService)."""
+        if self._agent_factory is None:
+            return {}
+        return self._agent_factory.get_build_times()
+
     async def cleanup(self) -> None:
+        if self._controller:
+            await self._controller.stop_config_watch()
+        if self._agents_use_case:
+            await self._agents_use_case.stop_prewarm()
+        if self._model_cache:
+            await self._model_cache.stop_cleanup_task()
+        if self._embedding_pipeline:
+            self._embedding_pipeline.shutdown()
+        if self._http_client_pool:
+            await self._http_client_pool.aclose()
         if self._mongo_client:
-            try:
-                result: Any = self._mongo_client.close()
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception:
-                pass
+            await MongoClientFactory.close_all()
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _phase(self, name: str) -> ContextManager[Any]:
+        if self._profiler is None:
+            return contextlib.nullcontext()
+        return self._profiler.phase(name)
@@ -0,0 +1,81 @@
+"""Limitadores de concorrência (bulkheads) para chamadas HTTP de tools."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+
+class BulkheadFullError(Exception):
+    """Todas as vagas e a fila de espera do bulkhead estão ocupadas."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"capacidade esgotada para '{name}'")
+        self.name = name
+
+
+class Bulkhead:
+    """Semáforo com fila de espera limitada e rejeição imediata.
+
+    Até ``max_concurrent`` chamadas executam ao mesmo tempo; até
+    ``max_queue`` aguardam uma vaga.  Além disso, ``acquire`` falha na
+    hora com ``BulkheadFullError`` — um upstream lento não acumula
+    tarefas indefinidamente no event loop.
+    """
+
+    def __init__(self, name: str, *, max_concurrent: int, max_queue: int) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent deve ser >= 1")
+        if max_queue < 0:
+            raise ValueError("max_queue não pode ser negativo")
+        self.name = name
+        self._max_concurrent = max_concurrent
+        self._max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+        self._rejected = 0
+
+    async def acquire(self) -> float:
+        """Ocupa uma vaga e retorna o tempo de espera na fila (s)."""
+        if self._semaphore.locked() and self._waiting >= self._max_queue:
+            self._rejected += 1
+            raise BulkheadFullError(self.name)
+        began = time.perf_counter()
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        return time.perf_counter() - began
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+    def get_stats(self) -> dict:
+        return {
+            "max_concurrent": self._max_concurrent,
+            "max_queue": self._max_queue,
+            "waiting": self._waiting,
+            "rejected": self._rejected,
+        }
+
+
+@asynccontextmanager
+async def acquire_all(*bulkheads: Bulkhead) -> AsyncIterator[float]:
+    """Ocupa uma vaga em cada bulkhead (em ordem) e libera todas ao sair.
+
+    Retorna o tempo total de espera.  Se algum estiver cheio, as vagas
+    já obtidas são devolvidas antes de propagar ``BulkheadFullError``.
+    """
+    acquired: List[Bulkhead] = []
+    waited = 0.0
+    try:
+        for bulkhead in bulkheads:
+            waited += await bulkhead.acquire()
+            acquired.append(bulkhead)
+        yield waited
+    finally:
+        for bulkhead in reversed(acquired):
+            bulkhead.release()
@@ -0,0 +1,163 @@
+"""Circuit breaker e timeout adaptativo para chamadas HTTP de tools."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Optional
+
+# Janela deslizante de resultados/latências considerada pelo breaker
+_WINDOW = 50
+# Amostras de latência necessárias antes de adaptar o timeout
+_MIN_LATENCY_SAMPLES = 20
+# Timeout adaptativo = p99 × multiplicador, nunca abaixo do piso
+_TIMEOUT_MULTIPLIER = 3.0
+_MIN_TIMEOUT_S = 1.0
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Breaker por tool: abre quando a taxa de falhas da janela é alta.
+
+    Falhas são erros de upstream (conexão, timeout, 5xx) e, se
+    ``slow_call_s`` for definido, chamadas mais lentas que esse limite.
+    Aberto, rejeita tudo por ``open_duration_s``; depois passa a
+    meio-aberto e libera uma única chamada de teste — sucesso fecha o
+    circuito, falha o reabre.
+
+    ``allow`` devolve uma permissão (inteiro crescente, ``None`` se
+    rejeitada) que deve ser repassada a ``record``/``abort``.  Só a
+    permissão do teste decide o meio-aberto, e resultados de chamadas
+    liberadas antes da última mudança de estado não contam — uma chamada
+    lenta iniciada antes da abertura não fecha nem reabre o circuito.
+
+    Também mantém as latências das chamadas bem-sucedidas para derivar
+    um timeout a partir do p99 observado (``timeout``).
+    """
+
+    def __init__(
+        self,
+        *,
+        error_rate_threshold: float = 0.5,
+        min_calls: int = 10,
+        open_duration_s: float = 30.0,
+        slow_call_s: Optional[float] = None,
+    ) -> None:
+        if not 0 < error_rate_threshold <= 1:
+            raise ValueError("error_rate_threshold deve estar em (0, 1]")
+        if min_calls < 1:
+            raise ValueError("min_calls deve ser >= 1")
+        self._threshold = error_rate_threshold
+        self._min_calls = min_calls
+        self._open_duration = open_duration_s
+        self._slow_call_s = slow_call_s
+        self._outcomes: Deque[bool] = deque(maxlen=_WINDOW)
+        self._latencies: Deque[float] = deque(maxlen=_WINDOW)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._last_permit = 0
+        # Permissões <= ``_epoch`` foram emitidas antes da última transição
+        self._epoch = 0
+        self._probe_permit: Optional[int] = None
+        self._short_circuited = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self._open_duration
+        ):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def allow(self) -> Optional[int]:
+        """Permissão para seguir ao upstream, ou ``None`` se o circuito rejeitar.
+
+        Em meio-aberto, a permissão emitida é a da chamada de teste.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return self._issue()
+        if state is CircuitState.HALF_OPEN and self._probe_permit is None:
+            self._probe_permit = self._issue()
+            return self._probe_permit
+        self._short_circuited += 1
+        return None
+
+    def record(
+        self, duration_s: float, *, failed: bool, permit: Optional[int] = None
+    ) -> None:
+        """Registra o resultado da chamada liberada com ``permit``."""
+        if not failed:
+            self._latencies.append(duration_s)
+            if self._slow_call_s is not None and duration_s > self._slow_call_s:
+                failed = True
+
+        if self._state is CircuitState.HALF_OPEN:
+            if permit is None or permit != self._probe_permit:
+                return
+            self._probe_permit = None
+            if failed:
+                self._open()
+            else:
+                self._state = CircuitState.CLOSED
+                self._outcomes.clear()
+                self._epoch = self._last_permit
+            return
+        if permit is not None and permit <= self._epoch:
+            # Liberada antes da última transição: não reflete o estado atual
+            return
+
+        self._outcomes.append(failed)
+        if len(self._outcomes) >= self._min_calls:
+            error_rate = sum(self._outcomes) / len(self._outcomes)
+            if error_rate >= self._threshold:
+                self._open()
+
+    def abort(self, permit: Optional[int] = None) -> None:
+        """Devolve a permissão de uma chamada que não chegou ao upstream."""
+        if permit is not None and permit == self._probe_permit:
+            self._probe_permit = None
+
+    def timeout(self, ceiling: float) -> float:
+        """Timeout derivado do p99 observado, limitado a ``ceiling``."""
+        if len(self._latencies) < _MIN_LATENCY_SAMPLES:
+            return ceiling
+        adaptive = max(_MIN_TIMEOUT_S, self.p99() * _TIMEOUT_MULTIPLIER)
+        return min(ceiling, adaptive)
+
+    def p99(self) -> float:
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(0.99 * len(ordered)) - 1)]
+
+    def get_stats(self) -> dict:
+        failures = sum(self._outcomes)
+        return {
+            "state": self.state.value,
+            "calls": len(self._outcomes),
+            "failures": failures,
+            "short_circuited": self._short_circuited,
+            "p99_s": round(self.p99(), 4),
+        }
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _issue(self) -> int:
+        self._last_permit += 1
+        return self._last_permit
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._probe_permit = None
+        self._epoch = self._last_permit
@@ -0,0 +1,110 @@
+"""Pool de ``httpx.AsyncClient`` persistentes por host de destino."""
+
+from __future__ import annotations
+
+import importlib.util
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Tuple, Union
+
+import httpx
+
+from src.domain.entities.tool_http_config import ToolHttpConfig
+from src.domain.ports import ILogger
+
+# HTTP/2 exige o extra ``httpx[http2]`` (pacote ``h2``)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_ClientKey = Tuple[str, str, int, int, int, float, bool]
+
+
+class _NoCookiesPolicy(DefaultCookiePolicy):
+    """Nunca guarda nem envia cookies — o cliente é compartilhado."""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+    def return_ok(self, cookie, request) -> bool:
+        return False
+
+
+class HttpClientPool:
+    """Mantém um ``httpx.AsyncClient`` por (origem, limites de conexão).
+
+    Chamadas de tools para o mesmo host reutilizam conexões abertas
+    (keep-alive), evitando um handshake TCP+TLS por chamada.  HTTP/2 é
+    negociado quando ``h2`` está instalado e a tool não o desabilita.
+    Os clientes vivem até ``aclose`` — chamado no shutdown da aplicação.
+    Como são compartilhados entre tools, agentes e usuários, não guardam
+    cookies: um ``Set-Cookie`` vale só para a resposta que o trouxe.
+    """
+
+    def __init__(self, logger: ILogger, *, default_timeout: float = 30.0) -> None:
+        self._logger = logger
+        self._default_timeout = default_timeout
+        self._clients: Dict[_ClientKey, httpx.AsyncClient] = {}
+
+    def get_client(self, url: str, config: ToolHttpConfig) -> httpx.AsyncClient:
+        """Retorna o cliente compartilhado para o host de ``url``."""
+        key = self._key(url, config)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = self._create_client(config)
+            self._clients[key] = client
+            self._logger.debug(
+                "Cliente HTTP criado",
+                origin=f"{key[0]}://{key[1]}:{key[2]}",
+                http2=key[6],
+                max_connections=config.max_connections,
+            )
+        return client
+
+    def timeout_for(self, config: ToolHttpConfig) -> Union[float, httpx.Timeout]:
+        """Timeout da requisição conforme ``config`` (ou o default do pool)."""
+        total = config.timeout_s or self._default_timeout
+        if config.connect_timeout_s is None:
+            return total
+        return httpx.Timeout(total, connect=config.connect_timeout_s)
+
+    async def aclose(self) -> None:
+        """Fecha todos os clientes e suas conexões."""
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as exc:
+                self._logger.warning("Erro ao fechar cliente HTTP", error=str(exc))
+
+    def get_stats(self) -> dict:
+        return {
+            "clients": len(self._clients),
+            "hosts": sorted({f"{k[0]}://{k[1]}:{k[2]}" for k in self._clients}),
+        }
+
+    # ── private ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def _key(url: str, config: ToolHttpConfig) -> _ClientKey:
+        parsed = httpx.URL(url)
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        return (
+            parsed.scheme,
+            parsed.host,
+            port,
+            config.max_connections,
+            config.max_keepalive_connections,
+            config.keepalive_expiry_s,
+            config.http2 and _HTTP2_AVAILABLE,
+        )
+
+    def _create_client(self, config: ToolHttpConfig) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            verify=True,
+            cookies=CookieJar(policy=_NoCookiesPolicy()),
+            http2=config.http2 and _HTTP2_AVAILABLE,
+            timeout=self._default_timeout,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry_s,
+            ),
+        )
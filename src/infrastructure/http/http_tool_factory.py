@@ -2,22 +2,62 @@
 
 from __future__ import annotations
 
-import ast
-from typing import Any, Dict, List, Tuple
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
 from agno.tools import Toolkit
 
 from src.domain.entities.tool import HttpMethod, Tool
 from src.domain.ports import ILogger, IToolFactory
+from src.infrastructure.cache.http_response_cache import (
+    CachedResponse,
+    HttpResponseCache,
+)
+from src.infrastructure.http.bulkhead import (
+    Bulkhead,
+    BulkheadFullError,
+    acquire_all,
+)
+from src.infrastructure.http.circuit_breaker import CircuitBreaker
+from src.infrastructure.http.client_pool import HttpClientPool
+from src.infrastructure.http.json_projection import JsonProjection
+from src.infrastructure.http.route_template import RouteTemplate
+from src.infrastructure.http.single_flight import SingleFlight
+from src.infrastructure.telemetry.metrics import TelemetryMetrics
+from src.infrastructure.telemetry.run_breakdown import (
+    COMPONENT_TOOL,
+    annotate_span,
+    component_span,
+)
+
+# Métodos cujos argumentos vão na query string
+_QUERY_METHODS = (HttpMethod.GET, HttpMethod.DELETE, HttpMethod.HEAD)
+# Métodos somente-leitura: elegíveis ao cache e coalescidos por padrão
+_CACHEABLE_METHODS = (HttpMethod.GET, HttpMethod.HEAD)
 
 
 class HttpToolFactory(IToolFactory):
     """Cria ``Toolkit`` agno a partir de ``Tool`` configs usando httpx async."""
 
-    def __init__(self, logger: ILogger, *, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        logger: ILogger,
+        *,
+        timeout: float = 30.0,
+        client_pool: Optional[HttpClientPool] = None,
+        host_max_concurrency: int = 32,
+        host_max_queue: int = 128,
+    ) -> None:
         self._logger = logger
         self._timeout = timeout
+        self._client_pool = client_pool or HttpClientPool(
+            logger, default_timeout=timeout
+        )
+        self._host_max_concurrency = host_max_concurrency
+        self._host_max_queue = host_max_queue
+        self._host_bulkheads: Dict[str, Bulkhead] = {}
 
     # ── IToolFactory ────────────────────────────────────────────────
 
@@ -39,52 +79,242 @@ class HttpToolFactory(IToolFactory):
 
     def _create_toolkit(self, tool: Tool) -> Toolkit:
         logger = self._logger
-        timeout = self._timeout
+        client_pool = self._client_pool
+        timeout = client_pool.timeout_for(tool.http_config)
+        route = RouteTemplate(tool.route, tool.parameters)
+        response_cache = self._build_response_cache(tool)
+        single_flight = self._build_single_flight(tool)
+        tool_bulkhead = Bulkhead(
+            f"tool:{tool.id}",
+            max_concurrent=tool.http_config.max_concurrency,
+            max_queue=tool.http_config.max_queue,
+        )
+        host_bulkhead = self._host_bulkhead
+        breaker = self._build_circuit_breaker(tool)
+        adaptive_timeout = breaker is not None and tool.http_config.adaptive_timeout
+        max_response_bytes = tool.http_config.max_response_bytes
+        projection = self._build_projection(tool)
 
         async def http_function(**kwargs: Any) -> str:
             """Executa a requisição HTTP para o tool."""
+            with component_span(COMPONENT_TOOL, "tool.http", tool_id=tool.id):
+                return await execute(kwargs)
+
+        async def execute(kwargs: Dict[str, Any]) -> str:
             headers = (tool.headers or {}).copy()
             headers.setdefault("Content-Type", "application/json")
-            url, remaining = _resolve_url(tool.route, kwargs)
-            req_kwargs = _build_request_kwargs(tool, url, headers, remaining, timeout)
+            try:
+                url, remaining = route.resolve(kwargs)
+            except ValueError as exc:
+                logger.warning("Parâmetros inválidos", tool_id=tool.id, error=str(exc))
+                annotate_span(tool_status="invalid_params")
+                return f"Erro nos parâmetros: {exc}"
+            request_timeout = (
+                _scale_timeout(timeout, breaker.timeout) if adaptive_timeout else timeout
+            )
+            req_kwargs = _build_request_kwargs(
+                tool, url, headers, remaining, request_timeout
+            )
+
+            cache_key = cached = None
+            if response_cache is not None:
+                cache_key = response_cache.key(url, req_kwargs.get("params"))
+                cached = response_cache.lookup(cache_key)
+                if cached is not None and cached.is_fresh():
+                    logger.debug("HTTP cache hit", tool_id=tool.id)
+                    annotate_span(tool_status="cache_hit")
+                    return cached.body
+                if cached is not None:
+                    headers.update(cached.conditional_headers())
+
+            if single_flight is None:
+                return await send(req_kwargs, cache_key, cached)
+            return await single_flight.do(
+                _request_key(req_kwargs),
+                lambda: send(req_kwargs, cache_key, cached),
+            )
 
+        async def send(
+            req_kwargs: Dict[str, Any],
+            cache_key: Optional[str],
+            cached: Optional[CachedResponse],
+        ) -> str:
+            permit = breaker.allow() if breaker is not None else None
+            if breaker is not None and permit is None:
+                logger.warning("Circuito aberto", tool_id=tool.id)
+                TelemetryMetrics.record_tool_call(tool.id, 0.0, "rejected")
+                annotate_span(tool_status="circuit_open")
+                return f"Erro na requisição: circuito aberto para '{tool.id}'"
+
+            bulkheads = (tool_bulkhead, host_bulkhead(req_kwargs["url"]))
+            completed = False
             try:
-                async with httpx.AsyncClient(verify=True) as client:
-                    response = await client.request(**req_kwargs)
-                    response.raise_for_status()
+                async with acquire_all(*bulkheads) as queue_wait_s:
+                    began = time.perf_counter()
+                    result, status, failed = await perform(
+                        req_kwargs, cache_key, cached
+                    )
+                    duration_s = time.perf_counter() - began
+                    completed = True
+            except BulkheadFullError as exc:
+                logger.warning("Tool HTTP saturada", tool_id=tool.id, bulkhead=exc.name)
+                TelemetryMetrics.record_tool_call(tool.id, 0.0, "rejected")
+                annotate_span(tool_status="rejected")
+                return f"Erro: {exc}; tente novamente mais tarde"
+            finally:
+                if breaker is not None and not completed:
+                    breaker.abort(permit)
+
+            if breaker is not None:
+                breaker.record(duration_s, failed=failed, permit=permit)
+            TelemetryMetrics.record_tool_call(
+                tool.id, duration_s, status, queue_wait_s=queue_wait_s
+            )
+            annotate_span(tool_status=status, queue_wait_s=queue_wait_s)
+            return result
+
+        async def perform(
+            req_kwargs: Dict[str, Any],
+            cache_key: Optional[str],
+            cached: Optional[CachedResponse],
+        ) -> Tuple[str, str, bool]:
+            """Resultado, status de telemetria e se foi falha do upstream."""
+            url = req_kwargs["url"]
+            try:
+                client = client_pool.get_client(url, tool.http_config)
+                request = client.build_request(**req_kwargs)
+                response = await client.send(request, stream=True)
+                evicted = False
+                try:
+                    if cached is not None and response.status_code == 304:
+                        body = response_cache.revalidated(cache_key, response.headers)
+                        if body is not None:
+                            logger.debug("HTTP cache revalidado", tool_id=tool.id)
+                            return body, "success", False
+                        # Entrada descartada entre o lookup e o 304
+                        evicted = True
+                    else:
+                        raw, truncated = await _read_capped(
+                            response, max_response_bytes
+                        )
+                finally:
+                    await response.aclose()
+                if evicted:
+                    logger.debug(
+                        "HTTP cache descartado durante a revalidação", tool_id=tool.id
+                    )
+                    return await perform(
+                        _without_validators(req_kwargs), cache_key, None
+                    )
+                if not response.is_success:
+                    logger.error(
+                        "HTTP error",
+                        tool_id=tool.id,
+                        status=response.status_code,
+                    )
+                    return (
+                        _format_http_error(response, raw),
+                        "error",
+                        response.status_code >= 500,
+                    )
                 logger.info(
                     "HTTP OK",
                     tool_id=tool.id,
                     status=response.status_code,
                 )
-                return _serialize(response)
-            except httpx.HTTPStatusError as exc:
-                logger.error(
-                    "HTTP error",
-                    tool_id=tool.id,
-                    status=getattr(exc.response, "status_code", None),
-                )
-                return _format_http_error(exc)
+                if truncated:
+                    logger.warning(
+                        "Resposta HTTP truncada",
+                        tool_id=tool.id,
+                        max_bytes=max_response_bytes,
+                    )
+                    return (
+                        _truncated(_decode(response, raw), max_response_bytes),
+                        "success",
+                        False,
+                    )
+                result = _serialize(raw, encoding=response.encoding, projection=projection)
+                if response_cache is not None:
+                    response_cache.store(cache_key, result, response.headers)
+                return result, "success", False
             except httpx.RequestError as exc:
                 logger.error(
                     "Request error",
                     tool_id=tool.id,
                     error=str(exc),
                 )
-                return f"Erro na requisição: {exc}"
+                return f"Erro na requisição: {exc}", "error", True
             except Exception as exc:
                 logger.error(
                     "Erro inesperado",
                     tool_id=tool.id,
                     error=str(exc),
                 )
-                return f"Erro inesperado: {exc}"
+                return f"Erro inesperado: {exc}", "error", False
 
         description = self._build_description(tool)
         toolkit = Toolkit(name=tool.id, instructions=description)
         toolkit.register(function=http_function, name=tool.id)
         return toolkit
 
+    def _host_bulkhead(self, url: str) -> Bulkhead:
+        """Bulkhead compartilhado por todas as tools do mesmo host upstream."""
+        parsed = httpx.URL(url)
+        host = f"{parsed.host}:{parsed.port or parsed.scheme}"
+        bulkhead = self._host_bulkheads.get(host)
+        if bulkhead is None:
+            bulkhead = self._host_bulkheads[host] = Bulkhead(
+                f"host:{host}",
+                max_concurrent=self._host_max_concurrency,
+                max_queue=self._host_max_queue,
+            )
+        return bulkhead
+
+    @staticmethod
+    def _build_response_cache(tool: Tool) -> Optional[HttpResponseCache]:
+        """Cache de respostas da tool, se habilitado e o método for idempotente."""
+        config = tool.http_config
+        if config.cache_ttl_s is None or tool.http_method not in _CACHEABLE_METHODS:
+            return None
+        return HttpResponseCache(
+            ttl_seconds=config.cache_ttl_s, max_bytes=config.cache_max_bytes
+        )
+
+    @staticmethod
+    def _build_circuit_breaker(tool: Tool) -> Optional[CircuitBreaker]:
+        config = tool.http_config
+        if not config.circuit_breaker:
+            return None
+        return CircuitBreaker(
+            error_rate_threshold=config.breaker_error_rate,
+            min_calls=config.breaker_min_calls,
+            open_duration_s=config.breaker_open_s,
+            slow_call_s=config.slow_call_s,
+        )
+
+    def _build_projection(self, tool: Tool) -> Optional[JsonProjection]:
+        """Projeção da resposta; caminhos inválidos desativam só a projeção."""
+        fields = tool.http_config.response_fields
+        if not fields:
+            return None
+        try:
+            return JsonProjection(fields)
+        except ValueError as exc:
+            self._logger.warning(
+                "response_fields inválido — resposta sem projeção",
+                tool_id=tool.id,
+                error=str(exc),
+            )
+            return None
+
+    @staticmethod
+    def _build_single_flight(tool: Tool) -> Optional[SingleFlight[str]]:
+        """Coalescência habilitada por config ou, na ausência, para GET/HEAD."""
+        enabled = tool.http_config.coalesce_requests
+        if enabled is None:
+            enabled = tool.http_method in _CACHEABLE_METHODS
+        return SingleFlight() if enabled else None
+
     @staticmethod
     def _build_description(tool: Tool) -> str:
         parts = [tool.description]
@@ -107,7 +337,7 @@ def _build_request_kwargs(
     url: str,
     headers: Dict[str, str],
     remaining: Dict[str, Any],
-    timeout: float,
+    timeout: Union[float, httpx.Timeout],
 ) -> Dict[str, Any]:
     """Constrói o dicionário de kwargs para ``httpx.AsyncClient.request``."""
     req_kwargs: Dict[str, Any] = {
@@ -116,42 +346,84 @@ def _build_request_kwargs(
         "headers": headers,
         "timeout": timeout,
     }
-    if tool.http_method in (HttpMethod.GET, HttpMethod.DELETE):
+    if tool.http_method in _QUERY_METHODS:
         req_kwargs["params"] = remaining or None
     else:
         req_kwargs["json"] = remaining or None
     return req_kwargs
 
 
-def _format_http_error(exc: httpx.HTTPStatusError) -> str:
+def _without_validators(req_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Cópia de ``req_kwargs`` sem ``If-None-Match``/``If-Modified-Since``."""
+    headers = {
+        name: value
+        for name, value in req_kwargs["headers"].items()
+        if name.lower() not in ("if-none-match", "if-modified-since")
+    }
+    return {**req_kwargs, "headers": headers}
+
+
+def _request_key(req_kwargs: Dict[str, Any]) -> str:
+    """Identidade da requisição: método, URL, parâmetros e corpo."""
+    return json.dumps(
+        [
+            req_kwargs["method"],
+            req_kwargs["url"],
+            req_kwargs.get("params"),
+            req_kwargs.get("json"),
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _scale_timeout(
+    timeout: Union[float, httpx.Timeout], adapt: Callable[[float], float]
+) -> Union[float, httpx.Timeout]:
+    """Aplica ``adapt`` ao timeout total, preservando o de conexão."""
+    if isinstance(timeout, httpx.Timeout):
+        return httpx.Timeout(adapt(timeout.read), connect=timeout.connect)
+    return adapt(timeout)
+
+
+def _format_http_error(response: httpx.Response, raw: bytes) -> str:
     """Formata mensagem de erro para respostas HTTP com status de erro."""
-    resp = exc.response
-    code = resp.status_code if resp else "?"
-    text = resp.text if resp else ""
-    return f"Erro HTTP {code}: {text}"
-
-
-def _resolve_url(
-    route: str, kwargs: Dict[str, Any]
-) -> Tuple[str, Dict[str, Any]]:
-    url = route
-    remaining = kwargs.copy()
-    for key, value in kwargs.items():
-        try:
-            parsed = ast.literal_eval(value) if isinstance(value, str) else value
-        except (ValueError, SyntaxError):
-            parsed = value
-        if isinstance(parsed, dict) and parsed:
-            param_key = next(iter(parsed))
-            placeholder = f"{{{param_key}}}"
-            if placeholder in url:
-                url = url.replace(placeholder, str(parsed[param_key]))
-                remaining.pop(key, None)
-    return url, remaining
-
-
-def _serialize(response: httpx.Response) -> str:
+    return f"Erro HTTP {response.status_code}: {_decode(response, raw)}"
+
+
+async def _read_capped(response: httpx.Response, max_bytes: int) -> Tuple[bytes, bool]:
+    """Lê o corpo em streaming até ``max_bytes``; indica se houve corte."""
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        remaining = max_bytes - size
+        if len(chunk) > remaining:
+            chunks.append(chunk[:remaining])
+            return b"".join(chunks), True
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks), False
+
+
+def _decode(response: httpx.Response, raw: bytes) -> str:
+    return raw.decode(response.encoding or "utf-8", errors="replace")
+
+
+def _truncated(text: str, max_bytes: int) -> str:
+    return f"{text}\n…[resposta truncada em {max_bytes} bytes]"
+
+
+def _serialize(
+    raw: bytes,
+    *,
+    encoding: Optional[str] = None,
+    projection: Optional[JsonProjection] = None,
+) -> str:
+    """JSON compacto (projetado, se configurado) ou o texto da resposta."""
     try:
-        return str(response.json())
-    except (ValueError, httpx.DecodingError):
-        return response.text
+        document = json.loads(raw)
+    except ValueError:
+        return raw.decode(encoding or "utf-8", errors="replace")
+    if projection is not None:
+        document = projection.apply(document)
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,89 @@
+"""Projeção de campos de respostas JSON por caminhos no estilo JSONPath."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, List, Sequence, Tuple, Union
+
+# ``.campo`` | ``[0]`` | ``[*]`` | ``['campo com espaço']``
+_TOKEN = re.compile(
+    r"""\.?(?P<key>[^.\[\]'"]+)|\[(?P<index>\*|-?\d+)\]|\[['"](?P<quoted>[^'"]+)['"]\]"""
+)
+_WILDCARD = object()
+_MISSING = object()
+
+_Token = Union[str, int, object]
+
+
+class JsonProjection:
+    """Seleciona apenas os campos necessários de um documento JSON.
+
+    Suporta o subconjunto de JSONPath usado em configs de tools:
+    ``$.data.items[*].name``, ``items[0].id``, ``meta['total count']``
+    (o ``$`` inicial é opcional).  Com um único caminho o resultado é o
+    valor selecionado; com vários, um dict ``{caminho: valor}``.
+    Caminhos sem correspondência são omitidos.
+    """
+
+    def __init__(self, paths: Sequence[str]) -> None:
+        if not paths:
+            raise ValueError("Informe ao menos um caminho de projeção")
+        self._paths: List[Tuple[str, List[_Token]]] = [
+            (path, _parse(path)) for path in paths
+        ]
+
+    def apply(self, document: Any) -> Any:
+        if len(self._paths) == 1:
+            value = _select(document, self._paths[0][1])
+            return None if value is _MISSING else value
+        projected = {}
+        for path, tokens in self._paths:
+            value = _select(document, tokens)
+            if value is not _MISSING:
+                projected[path] = value
+        return projected
+
+
+def _parse(path: str) -> List[_Token]:
+    expr = path.strip()
+    if expr.startswith("$"):
+        expr = expr[1:]
+    tokens: List[_Token] = []
+    pos = 0
+    while pos < len(expr):
+        match = _TOKEN.match(expr, pos)
+        if match is None:
+            raise ValueError(f"Caminho de projeção inválido: {path!r}")
+        if match.group("key") is not None:
+            key = match.group("key")
+            tokens.append(_WILDCARD if key == "*" else key)
+        elif match.group("index") is not None:
+            index = match.group("index")
+            tokens.append(_WILDCARD if index == "*" else int(index))
+        else:
+            tokens.append(match.group("quoted"))
+        pos = match.end()
+    return tokens
+
+
+def _select(node: Any, tokens: List[_Token]) -> Any:
+    for position, token in enumerate(tokens):
+        if token is _WILDCARD:
+            if isinstance(node, list):
+                items = node
+            elif isinstance(node, dict):
+                items = list(node.values())
+            else:
+                return _MISSING
+            rest = tokens[position + 1 :]
+            values = (_select(item, rest) for item in items)
+            return [value for value in values if value is not _MISSING]
+        if isinstance(token, int):
+            if not isinstance(node, list) or not -len(node) <= token < len(node):
+                return _MISSING
+            node = node[token]
+        elif isinstance(node, dict) and token in node:
+            node = node[token]
+        else:
+            return _MISSING
+    return node
@@ -0,0 +1,144 @@
+"""Template de rota compilado para as tools HTTP."""
+
+from __future__ import annotations
+
+import ast
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+from src.domain.entities.tool import ParameterType, ToolParameter
+
+_PLACEHOLDER = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+_TRUE = frozenset({"true", "1", "yes", "sim"})
+_FALSE = frozenset({"false", "0", "no", "não", "nao"})
+
+
+def _to_bool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError(value)
+
+
+_COERCERS: Dict[ParameterType, Callable[[str], Any]] = {
+    ParameterType.INTEGER: int,
+    ParameterType.FLOAT: float,
+    ParameterType.BOOLEAN: _to_bool,
+}
+
+
+class RouteTemplate:
+    """``Tool.route`` pré-compilada: trechos literais + slots ``{nome}``.
+
+    Compilada uma vez por tool; a cada chamada só preenche os slots,
+    converte argumentos declarados como ``integer``/``float``/``boolean``
+    (o LLM costuma enviá-los como texto) e codifica os valores de path.
+
+    O valor de um slot vem do argumento de mesmo nome ou, por
+    compatibilidade com configs antigas, de um argumento objeto
+    (``{"user_id": "123"}``, também como JSON em texto) cuja primeira
+    chave é o nome do slot.
+    """
+
+    def __init__(
+        self, route: str, parameters: Sequence[ToolParameter] = ()
+    ) -> None:
+        self._literals: List[str] = _PLACEHOLDER.split(route)[::2]
+        self._slots: List[str] = _PLACEHOLDER.findall(route)
+        self._types: Dict[str, ParameterType] = {}
+        for parameter in parameters:
+            ptype = _parameter_type(parameter.type)
+            if ptype in _COERCERS:
+                self._types[parameter.name] = ptype
+
+    @property
+    def slots(self) -> List[str]:
+        return list(self._slots)
+
+    def resolve(self, kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """URL preenchida e os argumentos restantes (query/corpo).
+
+        Levanta ``ValueError`` se faltar um slot ou um valor não puder
+        ser convertido para o tipo declarado.
+        """
+        remaining = {
+            name: self._coerce(name, value) for name, value in kwargs.items()
+        }
+        if not self._slots:
+            return self._literals[0], remaining
+
+        values: Dict[str, Any] = {}
+        for slot in self._slots:
+            if slot in remaining:
+                values[slot] = remaining.pop(slot)
+        if len(values) < len(self._slots):
+            self._resolve_legacy(remaining, values)
+        missing = [slot for slot in self._slots if slot not in values]
+        if missing:
+            raise ValueError(f"parâmetros de rota ausentes: {', '.join(missing)}")
+
+        parts = [self._literals[0]]
+        for slot, literal in zip(self._slots, self._literals[1:]):
+            parts.append(quote(_path_value(values[slot]), safe=""))
+            parts.append(literal)
+        return "".join(parts), remaining
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _coerce(self, name: str, value: Any) -> Any:
+        ptype = self._types.get(name)
+        if ptype is None or not isinstance(value, str):
+            return value
+        try:
+            return _COERCERS[ptype](value.strip())
+        except ValueError:
+            raise ValueError(
+                f"parâmetro '{name}' deve ser {ptype.value}: {value!r}"
+            ) from None
+
+    def _resolve_legacy(
+        self, remaining: Dict[str, Any], values: Dict[str, Any]
+    ) -> None:
+        for key, value in list(remaining.items()):
+            parsed = _parse_object(value)
+            if not parsed:
+                continue
+            slot = next(iter(parsed))
+            if slot in self._slots and slot not in values:
+                values[slot] = self._coerce(slot, parsed[slot])
+                remaining.pop(key)
+
+
+def _parameter_type(raw: Any) -> Optional[ParameterType]:
+    if isinstance(raw, ParameterType):
+        return raw
+    try:
+        return ParameterType(raw)
+    except ValueError:
+        return None
+
+
+def _parse_object(value: Any) -> Optional[dict]:
+    """Argumento como dict — aceita JSON ou literal Python em texto."""
+    if isinstance(value, dict):
+        return value
+    if not isinstance(value, str) or not value.lstrip().startswith("{"):
+        return None
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        try:
+            parsed = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _path_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
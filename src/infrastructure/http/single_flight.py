@@ -0,0 +1,46 @@
+"""Deduplicação de chamadas assíncronas idênticas em andamento."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Compartilha uma única execução entre chamadas concorrentes da mesma chave.
+
+    A primeira chamada para ``key`` executa ``fn``; as que chegam antes
+    de ela terminar aguardam o mesmo resultado (ou exceção).  Nada é
+    guardado depois da conclusão — não é um cache.  O cancelamento de
+    um dos chamadores não cancela a execução compartilhada.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._inflight.get(key)
+        if future is not None:
+            self._shared += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(fn())
+        self._inflight[key] = future
+        future.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, done: asyncio.Future) -> None:
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    @property
+    def shared(self) -> int:
+        """Total de chamadas atendidas por uma execução já em andamento."""
+        return self._shared
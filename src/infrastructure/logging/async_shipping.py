@@ -0,0 +1,219 @@
+"""Envio de logs em lote numa thread dedicada, fora do event loop."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.infrastructure.telemetry import TelemetryMetrics
+
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+_DROP_POLICIES = (DROP_NEWEST, DROP_OLDEST)
+
+_Item = Tuple[Tuple[logging.Handler, ...], logging.LogRecord]
+
+
+class _ForwardHandler(logging.Handler):
+    """Enfileira o registro junto com os handlers originais do logger."""
+
+    def __init__(self, shipper: AsyncLogShipper, targets: Sequence[logging.Handler]):
+        super().__init__(logging.NOTSET)
+        self._shipper = shipper
+        self.targets = tuple(targets)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            # Resolve a mensagem agora: ``args`` podem mudar até o envio
+            record.msg = record.getMessage()
+            record.args = None
+        except Exception:
+            self.handleError(record)
+            return
+        self._shipper.enqueue((self.targets, record))
+
+
+class AsyncLogShipper:
+    """Move a escrita de logs (stdout, arquivos, OTel) para uma thread.
+
+    ``install`` troca os handlers do root e dos loggers que têm handlers
+    próprios por um handler que só enfileira; a thread de envio agrupa
+    até ``batch_size`` registros (ou o que chegar em
+    ``flush_interval_s``) e os entrega aos handlers originais, com um
+    ``flush`` por lote em vez de um por registro.
+
+    A fila tem no máximo ``queue_size`` registros.  Cheia, descarta o
+    registro novo (``drop_newest``) ou o mais antigo (``drop_oldest``)
+    e conta o descarte em ``get_stats`` e na métrica
+    ``log_records_dropped_total``.  ``shutdown`` esvazia a fila e
+    devolve os handlers originais.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int = 10_000,
+        batch_size: int = 256,
+        flush_interval_s: float = 0.5,
+        drop_policy: str = DROP_NEWEST,
+    ) -> None:
+        if queue_size < 1 or batch_size < 1:
+            raise ValueError("queue_size e batch_size devem ser >= 1")
+        if drop_policy not in _DROP_POLICIES:
+            raise ValueError(f"drop_policy inválida: {drop_policy!r}")
+        self._queue: queue.Queue[_Item] = queue.Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_s
+        self._drop_policy = drop_policy
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._installed: Dict[logging.Logger, List[logging.Handler]] = {}
+        self._lock = threading.Lock()
+        self._dropped = 0
+        self._reported_dropped = 0
+        self._shipped = 0
+        self._batches = 0
+
+    # ── public ──────────────────────────────────────────────────────
+
+    def install(self, loggers: Optional[Sequence[logging.Logger]] = None) -> None:
+        """Passa a enfileirar os logs de ``loggers`` (padrão: todos com handlers)."""
+        if self._thread is not None:
+            return
+        for logger in loggers if loggers is not None else _loggers_with_handlers():
+            originals = list(logger.handlers)
+            if not originals:
+                continue
+            self._installed[logger] = originals
+            logger.handlers = [_ForwardHandler(self, originals)]
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="log-shipper", daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(self, item: _Item) -> None:
+        try:
+            self._queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+        if self._drop_policy == DROP_OLDEST:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                pass
+        with self._lock:
+            self._dropped += 1
+
+    def shutdown(self, timeout_s: float = 5.0) -> None:
+        """Envia o que está na fila e restaura os handlers originais."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout_s)
+        self._thread = None
+        for logger, originals in self._installed.items():
+            logger.handlers = originals
+        self._installed.clear()
+        # Registros enfileirados entre o fim da thread e a restauração
+        self._drain()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            dropped = self._dropped
+        return {
+            "running": self._thread is not None,
+            "queued": self._queue.qsize(),
+            "capacity": self._queue.maxsize,
+            "shipped": self._shipped,
+            "batches": self._batches,
+            "dropped": dropped,
+            "drop_policy": self._drop_policy,
+        }
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                self._report_dropped()
+                continue
+            self._ship([first] + self._take(self._batch_size - 1))
+        self._drain()
+
+    def _take(self, limit: int) -> List[_Item]:
+        items: List[_Item] = []
+        while len(items) < limit:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _drain(self) -> None:
+        while True:
+            batch = self._take(self._batch_size)
+            if not batch:
+                break
+            self._ship(batch)
+        self._report_dropped()
+
+    def _ship(self, batch: List[_Item]) -> None:
+        touched: Dict[int, logging.Handler] = {}
+        for targets, record in batch:
+            for handler in targets:
+                if record.levelno >= handler.level:
+                    _emit_unflushed(handler, record)
+                    touched[id(handler)] = handler
+        for handler in touched.values():
+            try:
+                handler.flush()
+            except Exception:
+                pass
+        self._shipped += len(batch)
+        self._batches += 1
+        self._report_dropped()
+
+    def _report_dropped(self) -> None:
+        with self._lock:
+            delta = self._dropped - self._reported_dropped
+            self._reported_dropped = self._dropped
+        if delta:
+            TelemetryMetrics.record_logs_dropped(delta, self._drop_policy)
+
+
+def _emit_unflushed(handler: logging.Handler, record: logging.LogRecord) -> None:
+    """``handler.handle`` sem o flush por registro dos StreamHandlers.
+
+    ``RotatingFileHandler`` e afins precisam do próprio ``emit`` (rotação);
+    para o ``StreamHandler`` puro basta escrever — o lote faz um flush só.
+    """
+    if type(handler) is not logging.StreamHandler:
+        handler.handle(record)
+        return
+    if not handler.filter(record):
+        return
+    handler.acquire()
+    try:
+        handler.stream.write(handler.format(record) + handler.terminator)
+    except Exception:
+        handler.handleError(record)
+    finally:
+        handler.release()
+
+
+def _loggers_with_handlers() -> List[logging.Logger]:
+    loggers = [logging.getLogger()]
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(logger, logging.Logger) and logger.handlers:
+            loggers.append(logger)
+    return loggers
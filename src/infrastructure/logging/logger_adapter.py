@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
 from src.domain.ports import ILogger
+from src.infrastructure.logging.sampling import LogSampler
 from src.infrastructure.logging.structlog_logger import LoggerFactory
 
 
 class StructlogLoggerAdapter(ILogger):
-    """Wraps structlog para satisfazer a porta ILogger."""
+    """Wraps structlog para satisfazer a porta ILogger.
+
+    Com um ``LogSampler`` configurado (``configure_sampling``), logs de
+    ``debug``/``info`` passam pela amostragem e pelo limite de taxa;
+    warnings e erros são sempre emitidos.
+    """
+
+    _sampler: Optional[LogSampler] = None
 
     def __init__(self, name: str = "app") -> None:
         self._logger = LoggerFactory.get_logger(name)
 
+    @classmethod
+    def configure_sampling(cls, sampler: Optional[LogSampler]) -> None:
+        """Define o sampler compartilhado por todos os adapters (``None`` desliga)."""
+        cls._sampler = sampler if sampler is not None and sampler.enabled else None
+
     def info(self, msg: str, **kwargs: Any) -> None:
-        self._logger.info(msg, **kwargs)
+        if self._allow("info", msg):
+            self._logger.info(msg, **kwargs)
 
     def warning(self, msg: str, **kwargs: Any) -> None:
         self._logger.warning(msg, **kwargs)
@@ -24,4 +38,20 @@ class StructlogLoggerAdapter(ILogger):
         self._logger.error(msg, **kwargs)
 
     def debug(self, msg: str, **kwargs: Any) -> None:
-        self._logger.debug(msg, **kwargs)
+        if self._allow("debug", msg):
+            self._logger.debug(msg, **kwargs)
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _allow(self, level: str, msg: str) -> bool:
+        sampler = self._sampler
+        if sampler is None:
+            return True
+        allowed = sampler.allow(level, msg)
+        for event, count in sampler.pop_summaries():
+            self._logger.info(
+                "Logs suprimidos por amostragem/limite de taxa",
+                suppressed_event=event,
+                suppressed_count=count,
+            )
+        return allowed
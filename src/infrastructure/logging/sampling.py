@@ -0,0 +1,142 @@
+"""Amostragem e limite de taxa para eventos de log de alto volume."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+# Níveis que nunca são amostrados nem limitados
+_ALWAYS_LOGGED = frozenset({"warning", "error", "critical"})
+# Limite de mensagens distintas rastreadas (mensagens formatadas com
+# valores variáveis não devem fazer o estado crescer sem fim)
+_MAX_TRACKED_EVENTS = 4096
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+
+
+def parse_ratios(spec: str) -> Dict[str, float]:
+    """``"HTTP OK=0.1,Agente criado=0.5"`` → ``{"HTTP OK": 0.1, ...}``.
+
+    Levanta ``ValueError`` para entradas sem ``=`` ou fora de [0, 1].
+    """
+    ratios: Dict[str, float] = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        event, sep, value = item.rpartition("=")
+        if not sep or not event.strip():
+            raise ValueError(f"entrada de amostragem inválida: {item!r}")
+        ratio = float(value)
+        if not 0.0 <= ratio <= 1.0:
+            raise ValueError(f"proporção fora de [0, 1] para {event.strip()!r}: {ratio}")
+        ratios[event.strip()] = ratio
+    return ratios
+
+
+class LogSampler:
+    """Decide, por evento, se um log de ``debug``/``info`` é emitido.
+
+    - ``ratios``: fração mantida por mensagem (``0.1`` = 1 a cada 10).
+      A amostragem é determinística — conta as ocorrências e deixa
+      passar a cada ``1/ratio`` — para não depender de sorte em volumes
+      baixos.
+    - ``rate_per_s``/``burst``: token bucket por mensagem; acima da
+      taxa os eventos são suprimidos (``0`` desliga o limite).
+
+    Warnings e erros sempre passam.  Os eventos suprimidos são contados
+    e devolvidos por ``pop_summaries`` a cada ``summary_interval_s``,
+    para quem loga registrar "N suprimidos".
+    """
+
+    def __init__(
+        self,
+        *,
+        ratios: Optional[Mapping[str, float]] = None,
+        rate_per_s: float = 0.0,
+        burst: int = 20,
+        summary_interval_s: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate_per_s < 0 or burst < 1:
+            raise ValueError("rate_per_s deve ser >= 0 e burst >= 1")
+        self._ratios = dict(ratios or {})
+        self._rate = rate_per_s
+        self._burst = burst
+        self._summary_interval = summary_interval_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._seen: Dict[str, int] = {}
+        self._buckets: Dict[str, _Bucket] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._last_summary = clock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._ratios) or self._rate > 0
+
+    def allow(self, level: str, event: str) -> bool:
+        if level in _ALWAYS_LOGGED:
+            return True
+        with self._lock:
+            if self._sampled_in(event) and self._take_token(event):
+                return True
+            self._suppressed[event] = self._suppressed.get(event, 0) + 1
+            return False
+
+    def pop_summaries(self) -> List[Tuple[str, int]]:
+        """Suprimidos por evento desde o último resumo, se o intervalo passou."""
+        now = self._clock()
+        with self._lock:
+            if not self._suppressed or now - self._last_summary < self._summary_interval:
+                return []
+            summaries = sorted(self._suppressed.items())
+            self._suppressed.clear()
+            self._last_summary = now
+        return summaries
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "ratios": dict(self._ratios),
+                "rate_per_s": self._rate,
+                "burst": self._burst,
+                "pending_suppressed": dict(self._suppressed),
+            }
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _sampled_in(self, event: str) -> bool:
+        ratio = self._ratios.get(event)
+        if ratio is None:
+            return True
+        seen = self._seen.get(event, 0) + 1
+        self._seen[event] = seen
+        # Passa quando ceil(seen*ratio) avança: a 1ª ocorrência e depois
+        # uma a cada 1/ratio
+        return math.ceil(seen * ratio) > math.ceil((seen - 1) * ratio)
+
+    def _take_token(self, event: str) -> bool:
+        if self._rate <= 0:
+            return True
+        now = self._clock()
+        bucket = self._buckets.get(event)
+        if bucket is None:
+            if len(self._buckets) >= _MAX_TRACKED_EVENTS:
+                self._buckets.clear()
+            bucket = self._buckets[event] = _Bucket(float(self._burst), now)
+        else:
+            bucket.tokens = min(
+                float(self._burst), bucket.tokens + (now - bucket.updated) * self._rate
+            )
+            bucket.updated = now
+        if bucket.tokens < 1.0:
+            return False
+        bucket.tokens -= 1.0
+        return True
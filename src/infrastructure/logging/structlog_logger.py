@@ -8,12 +8,19 @@ import logging
 import re
 import traceback
 import os
+import random
 import sys
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Optional, List
 from datetime import datetime, timezone
 from enum import Enum
 from dataclasses import dataclass, asdict
 import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date, time as dt_time
+from decimal import Decimal
+from functools import lru_cache
+from uuid import UUID
 from pathlib import Path
 
 
@@ -251,6 +258,321 @@ def sanitize_log_data(logger, method_name, event_dict):
     return event_dict
 
 
+# ── fast path (produção) ────────────────────────────────────────────
+#
+# Mesmo resultado dos processors acima com menos trabalho por evento:
+# metadados estáticos calculados uma vez, import do OpenTelemetry
+# resolvido uma vez e os padrões sensíveis reunidos numa única
+# alternância que, precedida de um teste ainda mais barato, descarta
+# em uma só busca os textos sem dado sensível.  Os que casam passam
+# pelos padrões um a um, na ordem do caminho lento.
+
+_PROTECTED_FIELDS = frozenset({
+    'timestamp', 'level', 'logger', 'service', 'version', 'environment',
+    'aws_region', 'hostname', 'correlation_id', 'log_level', 'service_name',
+    'event', 'user_id', 'request_id', 'test_type', 'operation', 'status',
+    'records_processed', 'duration_seconds', 'error_type', 'error_message',
+    'action', 'kubernetes_pod', 'trace_id'
+})
+
+# Textos menores que o menor padrão "sem gatilho" (aws_secret_key, 40
+# caracteres) só podem casar se tiverem um destes caracteres/prefixos
+_MIN_UNTRIGGERED_LEN = 40
+_MAYBE_SENSITIVE = re.compile(r'[@=:\d]|AKIA')
+
+
+def _combine_patterns(patterns: Dict[str, "re.Pattern[str]"]) -> "re.Pattern[str]":
+    """Une os padrões numa alternância — usada só para detectar se há algo.
+
+    Flags inline (``(?i)``) viram grupos com flag local para não vazarem
+    para os outros padrões.  A alternância não serve para substituir:
+    um padrão pode consumir o início de outro (ex.: ``aws_secret_key``
+    engolindo as primeiras letras de ``password=``).
+    """
+    alternatives = []
+    for pattern in patterns.values():
+        source = pattern.pattern
+        if source.startswith('(?i)'):
+            source = f'(?i:{source[4:]})'
+        alternatives.append(f'(?:{source})')
+    return re.compile('|'.join(alternatives))
+
+
+_COMBINED_PATTERN = _combine_patterns(DataSanitizer.SENSITIVE_PATTERNS)
+
+
+def _masker(label: str):
+    def mask(match: "re.Match[str]") -> str:
+        prefix = (match.group(1) or '') if match.re.groups else ''
+        return f"{prefix}=***{label}_MASKED***"
+    return mask
+
+
+# Mesma ordem de ``DataSanitizer._sanitize_string``
+_PATTERN_MASKS = [
+    (pattern, _masker(name.upper()))
+    for name, pattern in DataSanitizer.SENSITIVE_PATTERNS.items()
+]
+
+
+@lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str) -> bool:
+    key_lower = key.lower()
+    return any(sensitive in key_lower for sensitive in DataSanitizer.SENSITIVE_FIELDS)
+
+
+def _sanitize_string_fast(text: str) -> str:
+    if not text:
+        return text
+    if len(text) > 5000:
+        text = text[:5000] + "...[TRUNCATED]"
+    if len(text) < _MIN_UNTRIGGERED_LEN and not _MAYBE_SENSITIVE.search(text):
+        return text
+    if not _COMBINED_PATTERN.search(text):
+        return text
+    for pattern, mask in _PATTERN_MASKS:
+        text = pattern.sub(mask, text)
+    return text
+
+
+def _mask_sensitive_value(value: Any) -> str:
+    if isinstance(value, str) and value:
+        return f"***MASKED***[hash:{DataSanitizer.hash_sensitive_data(value)}]"
+    return "***MASKED***"
+
+
+# Tipos cujo texto não carrega dado do usuário: não passam pelo regex
+_SAFE_SCALARS = (bool, int, float)
+_SAFE_STR_TYPES = (date, dt_time, UUID, Decimal, Enum)
+
+
+class _Budget:
+    __slots__ = ("remaining",)
+
+    def __init__(self, remaining: int) -> None:
+        self.remaining = remaining
+
+
+class SanitizerEngine:
+    """Sanitizador com cache para o fast path de produção.
+
+    - Textos de até ``max_cached_len`` caracteres têm o resultado guardado
+      num LRU limitado a ``cache_size`` entradas e ``max_cache_chars``
+      caracteres — o mesmo prompt logado de novo não é reescaneado.
+    - Números, datas, UUIDs, ``Decimal`` e enums não passam pelo regex.
+    - Cada evento escaneia no máximo ``max_event_chars`` caracteres
+      (acertos no cache não contam); textos que não cabem no que resta
+      são trocados por ``[NOT_SCANNED len:N]`` em vez de saírem sem
+      sanitização.
+    - ``register_schema(evento, campos)`` restringe o escaneamento de um
+      evento aos campos declarados como arriscados; os demais saem como
+      vieram.  Chaves com nome sensível são mascaradas sempre.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_size: int = 2048,
+        max_cached_len: int = 5000,
+        max_cache_chars: int = 2_000_000,
+        max_event_chars: int = 32_768,
+    ) -> None:
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_size = cache_size
+        self._max_cached_len = max_cached_len
+        self._max_cache_chars = max_cache_chars
+        self._cached_chars = 0
+        self._max_event_chars = max_event_chars
+        self._schemas: Dict[str, frozenset] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._not_scanned = 0
+
+    def register_schema(self, event: str, risky_fields: Iterable[str]) -> None:
+        """Só ``risky_fields`` (e chaves sensíveis) são sanitizados em ``event``."""
+        self._schemas[event] = frozenset(risky_fields)
+
+    def sanitize(
+        self, data: Any, max_depth: int = 5, budget: Optional[_Budget] = None
+    ) -> Any:
+        """Equivalente a ``DataSanitizer.sanitize_data``."""
+        if max_depth <= 0:
+            return {"_truncated": "max_depth_reached", "_type": type(data).__name__}
+        if data is None or isinstance(data, _SAFE_SCALARS):
+            return data
+        if isinstance(data, str):
+            return self._sanitize_string(data, budget)
+        if isinstance(data, dict):
+            return {
+                key: _mask_sensitive_value(value)
+                if _is_sensitive_key(key)
+                else self.sanitize(value, max_depth - 1, budget)
+                for key, value in data.items()
+            }
+        if isinstance(data, (list, tuple)):
+            items = [self.sanitize(item, max_depth - 1, budget) for item in data[:50]]
+            if len(data) > 50:
+                items.append({"_truncated": f"list_truncated_from_{len(data)}_items"})
+            return items
+        if isinstance(data, _SAFE_STR_TYPES):
+            return str(data)
+        return self._sanitize_string(str(data), budget)
+
+    def sanitize_event(self, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Sanitiza os campos de um evento structlog, no lugar."""
+        schema = self._schemas.get(event_dict.get("event"))
+        budget = _Budget(self._max_event_chars)
+        for key, value in event_dict.items():
+            if key in _PROTECTED_FIELDS:
+                continue
+            if _is_sensitive_key(key):
+                event_dict[key] = _mask_sensitive_value(value)
+            elif schema is not None and key not in schema:
+                continue
+            elif not (value is None or isinstance(value, _SAFE_SCALARS)):
+                event_dict[key] = self.sanitize(value, budget=budget)
+        return event_dict
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._cache),
+                "cached_chars": self._cached_chars,
+                "not_scanned": self._not_scanned,
+                "schemas": len(self._schemas),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._cached_chars = 0
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _sanitize_string(self, text: str, budget: Optional[_Budget]) -> str:
+        if not text:
+            return text
+        cacheable = len(text) <= self._max_cached_len
+        if cacheable:
+            with self._lock:
+                cached = self._cache.get(text)
+                if cached is not None:
+                    self._cache.move_to_end(text)
+                    self._hits += 1
+                    return cached
+        if budget is not None:
+            cost = min(len(text), 5000)
+            if cost > budget.remaining:
+                with self._lock:
+                    self._not_scanned += 1
+                return f"[NOT_SCANNED len:{len(text)}]"
+            budget.remaining -= cost
+        result = _sanitize_string_fast(text)
+        if cacheable:
+            self._store(text, result)
+        return result
+
+    def _store(self, text: str, result: str) -> None:
+        with self._lock:
+            self._misses += 1
+            if text in self._cache:
+                return
+            self._cache[text] = result
+            self._cached_chars += len(text)
+            while (
+                len(self._cache) > self._cache_size
+                or self._cached_chars > self._max_cache_chars
+            ):
+                evicted, _ = self._cache.popitem(last=False)
+                self._cached_chars -= len(evicted)
+
+
+# Eventos frequentes cujos campos são todos seguros (IDs, status, tempos)
+_DEFAULT_SCHEMAS: Dict[str, tuple] = {
+    "HTTP OK": (),
+    "HTTP cache hit": (),
+    "Agente criado": (),
+}
+
+sanitizer_engine = SanitizerEngine()
+for _event, _fields in _DEFAULT_SCHEMAS.items():
+    sanitizer_engine.register_schema(_event, _fields)
+
+
+def register_log_schema(event: str, risky_fields: Iterable[str]) -> None:
+    """Declara os campos de ``event`` que precisam ser escaneados."""
+    sanitizer_engine.register_schema(event, risky_fields)
+
+
+def sanitize_data_fast(data: Any, max_depth: int = 5) -> Any:
+    """Equivalente a ``DataSanitizer.sanitize_data`` usando o regex combinado."""
+    return sanitizer_engine.sanitize(data, max_depth)
+
+
+def add_correlation_id_fast(logger, method_name, event_dict):
+    """Como ``add_correlation_id``, sem formatar um uuid4 a cada evento."""
+    if 'correlation_id' not in event_dict:
+        event_dict['correlation_id'] = f"{random.getrandbits(32):08x}"
+    return event_dict
+
+
+_get_current_span = None
+
+
+def add_otel_trace_context_fast(logger, method_name, event_dict):
+    """Como ``add_otel_trace_context``, importando o OpenTelemetry uma vez."""
+    global _get_current_span
+    try:
+        if _get_current_span is None:
+            from opentelemetry.trace import get_current_span
+
+            _get_current_span = get_current_span
+        ctx = _get_current_span().get_span_context()
+        if ctx and ctx.trace_id:
+            event_dict["trace_id"] = format(ctx.trace_id, "032x")
+            event_dict["span_id"] = format(ctx.span_id, "016x")
+    except Exception as exc:
+        logging.getLogger(__name__).debug(
+            "Falha ao injetar contexto OTel nos logs: %s", exc, exc_info=True
+        )
+    return event_dict
+
+
+@lru_cache(maxsize=1)
+def _service_metadata() -> Dict[str, str]:
+    return {
+        'service': 'orquestrador-ia',
+        'version': '1.0.0',
+        'environment': os.getenv('ENVIRONMENT', 'development'),
+        'hostname': os.getenv('HOSTNAME', 'localhost'),
+        'aws_region': os.getenv('AWS_REGION', 'us-east-1'),
+    }
+
+
+def add_service_metadata_fast(logger, method_name, event_dict):
+    """Como ``add_service_metadata``, lendo o ambiente só na primeira vez."""
+    event_dict.update(_service_metadata())
+    event_dict['log_level'] = method_name
+    return event_dict
+
+
+def sanitize_log_data_fast(logger, method_name, event_dict):
+    """Como ``sanitize_log_data``, via ``sanitizer_engine`` (cache e schemas)."""
+    return sanitizer_engine.sanitize_event(event_dict)
+
+
+FAST_PROCESSORS = (
+    add_correlation_id_fast,
+    add_otel_trace_context_fast,
+    add_timestamp,
+    add_service_metadata_fast,
+    sanitize_log_data_fast,
+)
+
+
 def setup_structlog():
     """Configura structlog para ambiente cloud-ready."""
 
@@ -278,14 +600,10 @@ def setup_structlog():
         structlog.dev.ConsoleRenderer(colors=True)
     ]
 
-    # Procesadores para produção (cloud)
+    # Procesadores para produção (cloud) — fast path
     prod_processors = [
         structlog.contextvars.merge_contextvars,
-        add_correlation_id,
-        add_otel_trace_context,
-        add_timestamp,
-        add_service_metadata,
-        sanitize_log_data,
+        *FAST_PROCESSORS,
         structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
         structlog.processors.dict_tracebacks,
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Sequence
 
 from src.domain.entities.agent_config import AgentConfig
 from src.domain.entities.rag_config import RagConfig, SearchStrategy
 from src.domain.ports import ILogger
 from src.domain.repositories.agent_config_repository import IAgentConfigRepository
-from src.infrastructure.repositories.mongo_base import AsyncMongoRepository
+from src.infrastructure.repositories.mongo_base import (
+    AsyncMongoRepository,
+    traced_operation,
+)
+
+# Só os campos lidos por ``_map_to_entity`` (inclui aliases camelCase)
+_PROJECTION = {
+    "_id": 0,
+    **dict.fromkeys(
+        (
+            "id", "nome", "model", "factory_ia_model", "factoryIaModel",
+            "descricao", "prompt", "active", "tools_ids", "rag_config",
+            "user_memory_active", "summary_active",
+        ),
+        1,
+    ),
+}
 
 
 class MongoAgentConfigRepository(AsyncMongoRepository, IAgentConfigRepository):
@@ -29,17 +45,36 @@ class MongoAgentConfigRepository(AsyncMongoRepository, IAgentConfigRepository):
             logger=logger,
         )
 
+    @traced_operation
     async def get_active_agents(self) -> List[AgentConfig]:
         try:
-            cursor = self._collection.find({"active": True})
+            cursor = self._collection.find({"active": True}, _PROJECTION)
             return [self._map_to_entity(doc) async for doc in cursor]
         except Exception as exc:
             self._logger.error("Erro ao buscar agentes ativos", error=str(exc))
             raise
 
+    @traced_operation
+    async def get_active_agents_by_ids(
+        self, agent_ids: Sequence[str]
+    ) -> List[AgentConfig]:
+        if not agent_ids:
+            return []
+        try:
+            cursor = self._collection.find(
+                {"id": {"$in": list(agent_ids)}, "active": True}, _PROJECTION
+            )
+            return [self._map_to_entity(doc) async for doc in cursor]
+        except Exception as exc:
+            self._logger.error(
+                "Erro ao buscar agentes por IDs", agent_ids=list(agent_ids), error=str(exc)
+            )
+            raise
+
+    @traced_operation
     async def get_agent_by_id(self, agent_id: str) -> AgentConfig:
         try:
-            doc = await self._collection.find_one({"id": agent_id})
+            doc = await self._collection.find_one({"id": agent_id}, _PROJECTION)
             if not doc:
                 raise ValueError(f"Agente {agent_id} não encontrado")
             return self._map_to_entity(doc)
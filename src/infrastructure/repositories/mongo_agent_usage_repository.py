@@ -0,0 +1,48 @@
+"""Uso dos agentes a partir das sessões gravadas pelo agno — MongoDB async."""
+
+from __future__ import annotations
+
+from typing import List
+
+from src.domain.ports import ILogger
+from src.domain.repositories.agent_usage_repository import IAgentUsageRepository
+from src.infrastructure.repositories.mongo_base import (
+    AsyncMongoRepository,
+    traced_operation,
+)
+
+
+class MongoAgentUsageRepository(AsyncMongoRepository, IAgentUsageRepository):
+    """Conta sessões por ``agent_id`` na coleção de sessões do agno."""
+
+    def __init__(
+        self,
+        *,
+        connection_string: str,
+        database_name: str = "agno",
+        collection_name: str = "agno_sessions",
+        logger: ILogger,
+    ) -> None:
+        super().__init__(
+            connection_string=connection_string,
+            database_name=database_name,
+            collection_name=collection_name,
+            logger=logger,
+        )
+
+    @traced_operation
+    async def get_most_used_agent_ids(self, limit: int) -> List[str]:
+        if limit <= 0:
+            return []
+        pipeline = [
+            {"$match": {"agent_id": {"$nin": [None, ""]}}},
+            {"$group": {"_id": "$agent_id", "sessions": {"$sum": 1}}},
+            {"$sort": {"sessions": -1, "_id": 1}},
+            {"$limit": limit},
+        ]
+        try:
+            cursor = self._collection.aggregate(pipeline)
+            return [doc["_id"] async for doc in cursor]
+        except Exception as exc:
+            self._logger.error("Erro ao calcular uso dos agentes", error=str(exc))
+            raise
@@ -2,17 +2,61 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
+from typing import Any, Awaitable, Callable, TypeVar
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import MongoClient
 
 from src.domain.ports import ILogger
+from src.infrastructure.repositories.mongo_pool_monitor import MongoPoolMonitor
+from src.infrastructure.telemetry.run_breakdown import (
+    COMPONENT_MONGO,
+    component_span,
+)
+
+_Method = TypeVar("_Method", bound=Callable[..., Awaitable[Any]])
 
 
 class MongoClientFactory:
-    """Gerencia uma única instância de AsyncIOMotorClient por connection string."""
+    """Gerencia uma única instância de AsyncIOMotorClient por connection string.
+
+    É o único ponto que abre pools de conexão: repositórios usam o cliente
+    motor e as camadas do agno (db de sessões/memória e vector db) recebem
+    o ``MongoClient`` síncrono subjacente (``get_sync_client``) — o mesmo
+    pool.  ``configure`` define o tamanho do pool e os timeouts e deve ser
+    chamado antes do primeiro ``get_client``.
+    """
 
     _instances: dict[str, AsyncIOMotorClient] = {}
+    _pool_options: dict = {
+        "maxPoolSize": 50,
+        "minPoolSize": 1,
+        "maxIdleTimeMS": 30_000,
+        "serverSelectionTimeoutMS": 30_000,
+        "connectTimeoutMS": 30_000,
+    }
+    _monitor = MongoPoolMonitor()
+
+    @classmethod
+    def configure(
+        cls,
+        *,
+        max_pool_size: int,
+        min_pool_size: int,
+        max_idle_time_ms: int,
+        timeout_ms: int,
+    ) -> None:
+        """Define as opções de pool dos clientes criados a partir de agora."""
+        cls._pool_options = {
+            "maxPoolSize": max_pool_size,
+            "minPoolSize": min_pool_size,
+            "maxIdleTimeMS": max_idle_time_ms,
+            "serverSelectionTimeoutMS": timeout_ms,
+            "connectTimeoutMS": timeout_ms,
+        }
 
     @classmethod
     def get_client(cls, connection_string: str) -> AsyncIOMotorClient:
@@ -25,12 +69,9 @@ class MongoClientFactory:
             ).lower() == "true"
 
             opts: dict = {
-                "serverSelectionTimeoutMS": 30_000,
-                "connectTimeoutMS": 30_000,
+                **cls._pool_options,
                 "socketTimeoutMS": 30_000,
-                "maxPoolSize": 50,
-                "minPoolSize": 1,
-                "maxIdleTimeMS": 30_000,
+                "event_listeners": [cls._monitor],
             }
             if use_tls:
                 opts.update(
@@ -46,6 +87,33 @@ class MongoClientFactory:
             )
         return cls._instances[connection_string]
 
+    @classmethod
+    def get_sync_client(cls, connection_string: str) -> MongoClient:
+        """``MongoClient`` do pymongo por trás do cliente motor (mesmo pool)."""
+        return cls.get_client(connection_string).delegate
+
+    @classmethod
+    def get_pool_stats(cls) -> dict:
+        return {
+            "clients": len(cls._instances),
+            "max_pool_size": cls._pool_options["maxPoolSize"],
+            "min_pool_size": cls._pool_options["minPoolSize"],
+            **cls._monitor.get_stats(),
+        }
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Fecha todos os clientes; ``get_client`` volta a criar sob demanda."""
+        clients = list(cls._instances.values())
+        cls._instances.clear()
+        for client in clients:
+            try:
+                result: Any = client.close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                pass
+
 
 class AsyncMongoRepository:
     """Base para repositórios MongoDB async."""
@@ -61,6 +129,7 @@ class AsyncMongoRepository:
         self._logger = logger
         self._client = MongoClientFactory.get_client(connection_string)
         self._db = self._client[database_name]
+        self._collection_name = collection_name
         self._collection: AsyncIOMotorCollection = self._db[collection_name]
 
     async def ping(self) -> bool:
@@ -71,3 +140,24 @@ class AsyncMongoRepository:
         except Exception as exc:
             self._logger.error("MongoDB ping falhou", error=str(exc))
             return False
+
+
+def traced_operation(method: _Method) -> _Method:
+    """Span ``mongo.<método>`` (+ histograma) em volta de um método do repositório.
+
+    Os atributos ``collection`` e ``operation`` se somam aos do run
+    corrente (``agent_id``), separando o tempo gasto no MongoDB.
+    """
+    operation = method.__name__
+
+    @functools.wraps(method)
+    async def wrapper(self: AsyncMongoRepository, *args: Any, **kwargs: Any) -> Any:
+        with component_span(
+            COMPONENT_MONGO,
+            f"mongo.{operation}",
+            collection=getattr(self, "_collection_name", None),
+            operation=operation,
+        ):
+            return await method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,192 @@
+"""Observa alterações de configuração no MongoDB (change streams ou polling)."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any, Dict, Mapping, Optional
+
+from src.domain.ports import ILogger
+from src.domain.ports.config_watcher_port import (
+    ConfigChangeHandler,
+    ConfigChanges,
+    IConfigWatcher,
+)
+from src.infrastructure.repositories.mongo_base import MongoClientFactory
+
+# Coleção → campo de ``ConfigChanges`` que recebe os IDs alterados
+_DEFAULT_COLLECTIONS: Dict[str, str] = {
+    "agents_config": "agent_ids",
+    "teams_config": "team_ids",
+    "tools": "tool_ids",
+}
+_PROJECTION = {"_id": 1, "id": 1, "updated_at": 1}
+
+
+class MongoConfigWatcher(IConfigWatcher):
+    """Emite ``ConfigChanges`` quando agentes, teams ou tools mudam.
+
+    Usa change streams quando o MongoDB os suporta (replica set/Atlas);
+    eventos próximos são agrupados por ``debounce_s``.  Em servidores
+    standalone — ou se o stream falhar — passa a comparar, a cada
+    ``poll_interval_s``, o ``updated_at`` de cada documento com a última
+    leitura.  No modo polling, edições só são percebidas se quem altera
+    o documento atualizar ``updated_at``; inserções e remoções são
+    sempre detectadas.
+    """
+
+    def __init__(
+        self,
+        *,
+        connection_string: str,
+        database_name: str,
+        logger: ILogger,
+        poll_interval_s: float = 10.0,
+        debounce_s: float = 1.0,
+        collections: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self._db = MongoClientFactory.get_client(connection_string)[database_name]
+        self._logger = logger
+        self._poll_interval = poll_interval_s
+        self._debounce = debounce_s
+        self._collections = dict(collections or _DEFAULT_COLLECTIONS)
+        self._on_change: Optional[ConfigChangeHandler] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._pending = ConfigChanges()
+        # coleção → {_id: id} (resolve deletes) e {id: updated_at} (polling)
+        self._ids: Dict[str, Dict[Any, str]] = {}
+        self._versions: Dict[str, Dict[str, Any]] = {}
+        self.mode = "stopped"
+
+    # ── IConfigWatcher ──────────────────────────────────────────────
+
+    async def start(self, on_change: ConfigChangeHandler) -> None:
+        if self._task is not None:
+            return
+        self._on_change = on_change
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        for task in (self._task, self._flush_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._task = self._flush_task = None
+        self.mode = "stopped"
+
+    # ── private ─────────────────────────────────────────────────────
+
+    async def _run(self) -> None:
+        try:
+            await self._snapshot()
+            await self._watch_change_stream()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self._logger.info(
+                "Change streams indisponíveis — usando polling de updated_at",
+                error=str(exc),
+                interval_s=self._poll_interval,
+            )
+        self.mode = "polling"
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            try:
+                changes = await self._poll_once()
+            except Exception as exc:
+                self._logger.warning("Erro no polling de configurações", error=str(exc))
+                continue
+            if not changes.is_empty():
+                await self._emit(changes)
+
+    async def _snapshot(self) -> None:
+        for name in self._collections:
+            ids: Dict[Any, str] = {}
+            versions: Dict[str, Any] = {}
+            async for doc in self._db[name].find({}, _PROJECTION):
+                if doc.get("id"):
+                    ids[doc["_id"]] = doc["id"]
+                    versions[doc["id"]] = doc.get("updated_at")
+            self._ids[name] = ids
+            self._versions[name] = versions
+
+    async def _watch_change_stream(self) -> None:
+        pipeline = [{"$match": {"ns.coll": {"$in": list(self._collections)}}}]
+        async with self._db.watch(pipeline, full_document="updateLookup") as stream:
+            self.mode = "change_stream"
+            self._logger.info(
+                "Observando configurações via change streams",
+                collections=list(self._collections),
+            )
+            async for event in stream:
+                changes = self._changes_from_event(event)
+                if changes.is_empty():
+                    continue
+                self._pending.merge(changes)
+                if self._flush_task is None or self._flush_task.done():
+                    self._flush_task = asyncio.create_task(self._flush_later())
+
+    def _changes_from_event(self, event: Mapping[str, Any]) -> ConfigChanges:
+        changes = ConfigChanges()
+        name = event.get("ns", {}).get("coll")
+        field = self._collections.get(name)
+        if field is None:
+            return changes
+        known = self._ids.setdefault(name, {})
+        oid = event.get("documentKey", {}).get("_id")
+        document = event.get("fullDocument") or {}
+        config_id = document.get("id") or known.get(oid)
+        if event.get("operationType") == "delete":
+            known.pop(oid, None)
+        elif document.get("id"):
+            known[oid] = document["id"]
+        if config_id:
+            getattr(changes, field).add(config_id)
+        return changes
+
+    async def _poll_once(self) -> ConfigChanges:
+        changes = ConfigChanges()
+        for name, field in self._collections.items():
+            current: Dict[str, Any] = {}
+            async for doc in self._db[name].find({}, _PROJECTION):
+                if doc.get("id"):
+                    current[doc["id"]] = doc.get("updated_at")
+            previous = self._versions.get(name)
+            self._versions[name] = current
+            if previous is None:
+                # Snapshot inicial falhou: esta leitura vira a referência
+                continue
+            changed = {
+                config_id
+                for config_id, version in current.items()
+                if config_id not in previous or previous[config_id] != version
+            }
+            changed |= previous.keys() - current.keys()
+            getattr(changes, field).update(changed)
+        return changes
+
+    async def _flush_later(self) -> None:
+        # Eventos que chegam durante o ``_emit`` não agendam outro flush
+        # (esta task ainda não terminou): são emitidos na volta seguinte
+        while True:
+            await asyncio.sleep(self._debounce)
+            changes, self._pending = self._pending, ConfigChanges()
+            if changes.is_empty():
+                return
+            await self._emit(changes)
+
+    async def _emit(self, changes: ConfigChanges) -> None:
+        self._logger.info(
+            "Alterações de configuração detectadas",
+            agents=sorted(changes.agent_ids),
+            teams=sorted(changes.team_ids),
+            tools=sorted(changes.tool_ids),
+        )
+        try:
+            await self._on_change(changes)
+        except Exception as exc:
+            self._logger.error(
+                "Erro ao aplicar alterações de configuração", error=str(exc)
+            )
@@ -7,7 +7,10 @@ from typing import List, Optional
 from src.domain.entities.document_node import DocumentNode
 from src.domain.ports.document_tree_repository_port import IDocumentTreeRepository
 from src.domain.ports.logger_port import ILogger
-from src.infrastructure.repositories.mongo_base import AsyncMongoRepository
+from src.infrastructure.repositories.mongo_base import (
+    AsyncMongoRepository,
+    traced_operation,
+)
 
 
 class MongoDocumentTreeRepository(AsyncMongoRepository, IDocumentTreeRepository):
@@ -32,6 +35,7 @@ class MongoDocumentTreeRepository(AsyncMongoRepository, IDocumentTreeRepository)
             logger=logger,
         )
 
+    @traced_operation
     async def ensure_indexes(self) -> None:
         """Cria índices compostos para queries performáticas."""
         await self._collection.create_index(
@@ -48,11 +52,17 @@ class MongoDocumentTreeRepository(AsyncMongoRepository, IDocumentTreeRepository)
             unique=True,
         )
 
-    async def save_nodes(self, nodes: List[DocumentNode]) -> None:
-        """Persiste nós em lote (insert_many)."""
+    @traced_operation
+    async def save_nodes(
+        self, nodes: List[DocumentNode], *, checksum: Optional[str] = None
+    ) -> None:
+        """Persiste nós em lote (insert_many), marcados com ``checksum``."""
         if not nodes:
             return
         docs = [self._to_document(node, order=i) for i, node in enumerate(nodes)]
+        if checksum is not None:
+            for doc in docs:
+                doc["doc_checksum"] = checksum
         try:
             await self._collection.insert_many(docs, ordered=False)
             self._logger.info("Nós salvos", count=len(docs))
@@ -60,6 +70,7 @@ class MongoDocumentTreeRepository(AsyncMongoRepository, IDocumentTreeRepository)
             self._logger.error("Erro ao salvar nós", error=str(exc))
             raise
 
+    @traced_operation
     async def get_root_nodes(self, doc_name: str) -> List[DocumentNode]:
         """Retorna nós raiz (level 0) de um documento."""
         cursor = self._collection.find({"doc_name": doc_name, "level": 0}).sort(
@@ -67,21 +78,55 @@ class MongoDocumentTreeRepository(AsyncMongoRepository, IDocumentTreeRepository)
         )
         return [self._to_entity(doc) async for doc in cursor]
 
+    @traced_operation
     async def get_children(self, parent_id: str) -> List[DocumentNode]:
         """Retorna filhos diretos de um nó."""
         cursor = self._collection.find({"parent_id": parent_id}).sort("_order", 1)
         return [self._to_entity(doc) async for doc in cursor]
 
+    @traced_operation
+    async def get_document_nodes(self, doc_name: str) -> List[DocumentNode]:
+        """Retorna a árvore completa de um documento em uma única query."""
+        cursor = self._collection.find({"doc_name": doc_name}).sort("_order", 1)
+        return [self._to_entity(doc) async for doc in cursor]
+
+    @traced_operation
     async def get_node(self, node_id: str) -> Optional[DocumentNode]:
         """Busca um nó pelo ID."""
         doc = await self._collection.find_one({"id": node_id})
         return self._to_entity(doc) if doc else None
 
+    @traced_operation
     async def exists(self, doc_name: str) -> bool:
         """Verifica se o documento já está indexado."""
         count = await self._collection.count_documents({"doc_name": doc_name}, limit=1)
         return count > 0
 
+    @traced_operation
+    async def get_checksum(self, doc_name: str) -> Optional[str]:
+        """Checksum da versão mais antiga gravada (``None`` se ausente).
+
+        Durante uma reindexação a versão mais antiga é a única garantidamente
+        completa.
+        """
+        doc = await self._collection.find_one(
+            {"doc_name": doc_name}, {"doc_checksum": 1}, sort=[("_id", 1)]
+        )
+        return doc.get("doc_checksum") if doc else None
+
+    @traced_operation
+    async def delete_document(
+        self, doc_name: str, *, keep_checksum: Optional[str] = None
+    ) -> None:
+        """Remove os nós do documento (ou só os de versões != ``keep_checksum``)."""
+        query: dict = {"doc_name": doc_name}
+        if keep_checksum is not None:
+            query["doc_checksum"] = {"$ne": keep_checksum}
+        result = await self._collection.delete_many(query)
+        self._logger.info(
+            "Nós removidos", doc_name=doc_name, count=result.deleted_count
+        )
+
     # ── mappers ─────────────────────────────────────────────────────
 
     @staticmethod
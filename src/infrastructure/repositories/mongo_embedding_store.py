@@ -0,0 +1,71 @@
+"""Store MongoDB de sumários/embeddings endereçados por conteúdo."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from pymongo import UpdateOne
+
+from src.domain.ports.embedding_store_port import IEmbeddingStore
+from src.domain.ports.logger_port import ILogger
+from src.infrastructure.repositories.mongo_base import (
+    AsyncMongoRepository,
+    traced_operation,
+)
+
+
+class MongoEmbeddingStore(AsyncMongoRepository, IEmbeddingStore):
+    """Implementação async do store endereçado por conteúdo.
+
+    Cada entrada é um documento ``{_id: hash, kind, value, created_at}``
+    na collection ``embedding_store``; a busca usa o índice de ``_id``.
+    """
+
+    def __init__(
+        self,
+        *,
+        connection_string: str,
+        database_name: str = "agno",
+        collection_name: str = "embedding_store",
+        logger: ILogger,
+    ) -> None:
+        super().__init__(
+            connection_string=connection_string,
+            database_name=database_name,
+            collection_name=collection_name,
+            logger=logger,
+        )
+
+    @traced_operation
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if not keys:
+            return {}
+        try:
+            cursor = self._collection.find(
+                {"_id": {"$in": keys}}, {"value": 1}
+            )
+            return {doc["_id"]: doc["value"] async for doc in cursor}
+        except Exception as exc:
+            self._logger.warning("Erro ao consultar embedding store", error=str(exc))
+            return {}
+
+    @traced_operation
+    async def put_many(self, entries: Dict[str, Any], *, kind: str) -> None:
+        if not entries:
+            return
+        now = datetime.now(timezone.utc)
+        ops = [
+            UpdateOne(
+                {"_id": key},
+                {"$setOnInsert": {"kind": kind, "value": value, "created_at": now}},
+                upsert=True,
+            )
+            for key, value in entries.items()
+        ]
+        try:
+            await self._collection.bulk_write(ops, ordered=False)
+        except Exception as exc:
+            self._logger.warning(
+                "Erro ao gravar no embedding store", kind=kind, error=str(exc)
+            )
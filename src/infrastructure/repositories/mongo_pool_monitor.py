@@ -0,0 +1,114 @@
+"""Métricas de utilização do pool de conexões MongoDB."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Tuple
+
+from pymongo import monitoring
+
+from src.infrastructure.telemetry.metrics import TelemetryMetrics
+
+
+def _address(address: Tuple[str, int]) -> str:
+    host, port = address
+    return f"{host}:{port}"
+
+
+class MongoPoolMonitor(monitoring.ConnectionPoolListener):
+    """Acompanha conexões abertas, em uso e esperas de checkout.
+
+    O pymongo chama os métodos a partir de suas próprias threads — os
+    contadores são protegidos por lock e também exportados via
+    ``TelemetryMetrics``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._open: Dict[str, int] = {}
+        self._in_use: Dict[str, int] = {}
+        self._max_in_use = 0
+        self._checkouts = 0
+        self._failures = 0
+        self._wait_total_s = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "connections_open": sum(self._open.values()),
+                "connections_in_use": sum(self._in_use.values()),
+                "max_in_use": self._max_in_use,
+                "checkouts": self._checkouts,
+                "checkout_failures": self._failures,
+                "avg_checkout_wait_ms": round(
+                    self._wait_total_s / self._checkouts * 1000, 3
+                )
+                if self._checkouts
+                else 0.0,
+                "servers": sorted(self._open),
+            }
+
+    # ── ConnectionPoolListener ──────────────────────────────────────
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        self._adjust(_address(event.address), open_delta=1)
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        self._adjust(_address(event.address), open_delta=-1)
+
+    def connection_checked_out(
+        self, event: monitoring.ConnectionCheckedOutEvent
+    ) -> None:
+        address = _address(event.address)
+        wait_s = getattr(event, "duration", None)
+        with self._lock:
+            self._checkouts += 1
+            self._wait_total_s += wait_s or 0.0
+        self._adjust(address, in_use_delta=1)
+        TelemetryMetrics.record_mongo_checkout(address, wait_s)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        self._adjust(_address(event.address), in_use_delta=-1)
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        with self._lock:
+            self._failures += 1
+        TelemetryMetrics.record_mongo_checkout(
+            _address(event.address), getattr(event, "duration", None), failed=True
+        )
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        pass
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _adjust(self, address: str, *, open_delta: int = 0, in_use_delta: int = 0) -> None:
+        with self._lock:
+            if open_delta:
+                self._open[address] = self._open.get(address, 0) + open_delta
+            if in_use_delta:
+                in_use = self._in_use.get(address, 0) + in_use_delta
+                self._in_use[address] = in_use
+                self._max_in_use = max(self._max_in_use, sum(self._in_use.values()))
+        TelemetryMetrics.record_mongo_pool_connections(
+            address, open_delta=open_delta, in_use_delta=in_use_delta
+        )
@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from src.domain.entities.team_config import TeamConfig
 from src.domain.ports import ILogger
 from src.domain.repositories.team_config_repository import ITeamConfigRepository
-from src.infrastructure.repositories.mongo_base import AsyncMongoRepository
+from src.infrastructure.repositories.mongo_base import (
+    AsyncMongoRepository,
+    traced_operation,
+)
+
+# Só os campos lidos por ``_map_to_entity`` (inclui aliases camelCase)
+_PROJECTION = {
+    "_id": 0,
+    **dict.fromkeys(
+        (
+            "id", "nome", "model", "factory_ia_model", "factoryIaModel",
+            "mode", "descricao", "prompt", "member_ids", "memberIds",
+            "user_memory_active", "userMemoryActive", "summary_active",
+            "summaryActive", "active",
+        ),
+        1,
+    ),
+}
 
 
 class MongoTeamConfigRepository(AsyncMongoRepository, ITeamConfigRepository):
@@ -28,17 +45,36 @@ class MongoTeamConfigRepository(AsyncMongoRepository, ITeamConfigRepository):
             logger=logger,
         )
 
+    @traced_operation
     async def get_active_teams(self) -> List[TeamConfig]:
         try:
-            cursor = self._collection.find({"active": True})
+            cursor = self._collection.find({"active": True}, _PROJECTION)
             return [self._map_to_entity(doc) async for doc in cursor]
         except Exception as exc:
             self._logger.error("Erro ao buscar teams ativos", error=str(exc))
             raise
 
+    @traced_operation
+    async def get_active_teams_by_ids(
+        self, team_ids: Sequence[str]
+    ) -> List[TeamConfig]:
+        if not team_ids:
+            return []
+        try:
+            cursor = self._collection.find(
+                {"id": {"$in": list(team_ids)}, "active": True}, _PROJECTION
+            )
+            return [self._map_to_entity(doc) async for doc in cursor]
+        except Exception as exc:
+            self._logger.error(
+                "Erro ao buscar teams por IDs", team_ids=list(team_ids), error=str(exc)
+            )
+            raise
+
+    @traced_operation
     async def get_team_by_id(self, team_id: str) -> Optional[TeamConfig]:
         try:
-            doc = await self._collection.find_one({"id": team_id})
+            doc = await self._collection.find_one({"id": team_id}, _PROJECTION)
             if not doc:
                 return None
             return self._map_to_entity(doc)
@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
-from typing import List
+from dataclasses import fields
+from typing import List, Optional
 
 from src.domain.entities.tool import HttpMethod, ParameterType, Tool, ToolParameter
+from src.domain.entities.tool_http_config import ToolHttpConfig
 from src.domain.ports import ILogger
 from src.domain.repositories.tool_repository import IToolRepository
-from src.infrastructure.repositories.mongo_base import AsyncMongoRepository
+from src.infrastructure.repositories.mongo_base import (
+    AsyncMongoRepository,
+    traced_operation,
+)
+
+# Só os campos lidos por ``_map_to_entity``
+_PROJECTION = {
+    "_id": 0,
+    **dict.fromkeys(
+        (
+            "id", "name", "description", "route", "http_method", "parameters",
+            "instructions", "headers", "active", "http_config",
+        ),
+        1,
+    ),
+}
 
 
 class MongoToolRepository(AsyncMongoRepository, IToolRepository):
@@ -28,42 +45,45 @@ class MongoToolRepository(AsyncMongoRepository, IToolRepository):
             logger=logger,
         )
 
+    @traced_operation
     async def get_tools_by_ids(self, tool_ids: List[str]) -> List[Tool]:
         if not tool_ids:
             return []
         try:
             cursor = self._collection.find(
-                {"id": {"$in": tool_ids}, "active": True}
+                {"id": {"$in": tool_ids}, "active": True}, _PROJECTION
             )
-            return [self._map_to_entity(doc) async for doc in cursor]
+            return [self._map_to_entity(doc, self._logger) async for doc in cursor]
         except Exception as exc:
             self._logger.error(
                 "Erro ao buscar tools por IDs", tool_ids=tool_ids, error=str(exc)
             )
             raise
 
+    @traced_operation
     async def get_tool_by_id(self, tool_id: str) -> Tool:
         try:
-            doc = await self._collection.find_one({"id": tool_id})
+            doc = await self._collection.find_one({"id": tool_id}, _PROJECTION)
             if not doc:
                 raise ValueError(f"Tool {tool_id} não encontrada")
-            return self._map_to_entity(doc)
+            return self._map_to_entity(doc, self._logger)
         except Exception as exc:
             self._logger.error(
                 "Erro ao buscar tool", tool_id=tool_id, error=str(exc)
             )
             raise
 
+    @traced_operation
     async def get_all_active_tools(self) -> List[Tool]:
         try:
-            cursor = self._collection.find({"active": True})
-            return [self._map_to_entity(doc) async for doc in cursor]
+            cursor = self._collection.find({"active": True}, _PROJECTION)
+            return [self._map_to_entity(doc, self._logger) async for doc in cursor]
         except Exception as exc:
             self._logger.error("Erro ao listar tools ativas", error=str(exc))
             raise
 
     @staticmethod
-    def _map_to_entity(data: dict) -> Tool:
+    def _map_to_entity(data: dict, logger: Optional[ILogger] = None) -> Tool:
         parameters: List[ToolParameter] = []
         for p in data.get("parameters", []):
             raw_type = p.get("type")
@@ -97,4 +117,30 @@ class MongoToolRepository(AsyncMongoRepository, IToolRepository):
             instructions=data.get("instructions", ""),
             headers=data.get("headers", {}),
             active=data.get("active", True),
+            http_config=_map_http_config(
+                data.get("http_config"), tool_id=data.get("id", ""), logger=logger
+            ),
         )
+
+
+def _map_http_config(
+    raw: Optional[dict], *, tool_id: str = "", logger: Optional[ILogger] = None
+) -> ToolHttpConfig:
+    """Mapeia ``http_config`` do documento, ignorando chaves desconhecidas.
+
+    Um ``http_config`` inválido não derruba a consulta das demais tools:
+    a tool usa a configuração padrão e um warning é registrado.
+    """
+    if not raw:
+        return ToolHttpConfig()
+    known = {f.name for f in fields(ToolHttpConfig)}
+    try:
+        return ToolHttpConfig(**{k: v for k, v in raw.items() if k in known})
+    except (TypeError, ValueError) as exc:
+        if logger is not None:
+            logger.warning(
+                "http_config inválido — usando configuração padrão",
+                tool_id=tool_id,
+                error=str(exc),
+            )
+        return ToolHttpConfig()
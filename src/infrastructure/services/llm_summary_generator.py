@@ -38,6 +38,10 @@ class LLMSummaryGenerator(ISummaryGenerator):
         self._logger = logger
         self._model: Any = None
 
+    @property
+    def model_key(self) -> str:
+        return f"{self._factory_ia_model}:{self._model_id}"
+
     async def generate_summary(self, content: str) -> str:
         """Gera sumário conciso do conteúdo via LLM."""
         if not content or not content.strip():
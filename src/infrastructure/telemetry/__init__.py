@@ -7,9 +7,13 @@ Exporta traces, métricas e logs via OTLP para Grafana LGTM
 
 from .otel_setup import setup_telemetry, shutdown_telemetry
 from .metrics import TelemetryMetrics
+from .run_breakdown import annotate_span, bind_run, component_span
 
 __all__ = [
     "setup_telemetry",
     "shutdown_telemetry",
     "TelemetryMetrics",
+    "annotate_span",
+    "bind_run",
+    "component_span",
 ]
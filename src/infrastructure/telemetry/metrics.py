@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import time
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator, Mapping, Optional
 
 from opentelemetry import metrics
 
@@ -73,6 +73,12 @@ cache_misses_total = _meter.create_counter(
     unit="1",
 )
 
+cache_refresh_duration = _meter.create_histogram(
+    name="cache_refresh_duration_seconds",
+    description="Duração das recargas do cache de agentes/teams em segundos",
+    unit="s",
+)
+
 # ── Métricas de tools HTTP ──────────────────────────────────────────
 
 tool_calls_total = _meter.create_counter(
@@ -93,6 +99,60 @@ tool_call_errors_total = _meter.create_counter(
     unit="1",
 )
 
+tool_call_queue_wait = _meter.create_histogram(
+    name="tool_call_queue_wait_seconds",
+    description="Tempo de espera por vaga nos bulkheads de tools HTTP",
+    unit="s",
+)
+
+tool_call_rejections_total = _meter.create_counter(
+    name="tool_call_rejections_total",
+    description="Chamadas a tools HTTP rejeitadas por saturação",
+    unit="1",
+)
+
+# ── Decomposição de runs de agentes ─────────────────────────────────
+
+agent_run_component_duration = _meter.create_histogram(
+    name="agent_run_component_duration_seconds",
+    description="Duração de cada etapa de um run (tool, RAG, MongoDB)",
+    unit="s",
+)
+
+# ── Métricas do pool MongoDB ────────────────────────────────────────
+
+mongo_pool_connections = _meter.create_up_down_counter(
+    name="mongo_pool_connections",
+    description="Conexões abertas no pool MongoDB compartilhado",
+    unit="1",
+)
+
+mongo_pool_connections_in_use = _meter.create_up_down_counter(
+    name="mongo_pool_connections_in_use",
+    description="Conexões do pool MongoDB em uso (checked out)",
+    unit="1",
+)
+
+mongo_pool_checkout_wait = _meter.create_histogram(
+    name="mongo_pool_checkout_wait_seconds",
+    description="Tempo aguardando uma conexão livre no pool MongoDB",
+    unit="s",
+)
+
+mongo_pool_checkout_failures_total = _meter.create_counter(
+    name="mongo_pool_checkout_failures_total",
+    description="Falhas ao obter conexão do pool MongoDB",
+    unit="1",
+)
+
+# ── Métricas de logging ─────────────────────────────────────────────
+
+log_records_dropped_total = _meter.create_counter(
+    name="log_records_dropped_total",
+    description="Registros de log descartados com a fila de envio cheia",
+    unit="1",
+)
+
 # ── Métricas de startup ────────────────────────────────────────────
 
 startup_duration = _meter.create_histogram(
@@ -156,16 +216,73 @@ class TelemetryMetrics:
         """Registra um cache miss."""
         cache_misses_total.add(1, {"cache": cache_name})
 
+    @staticmethod
+    def record_cache_refresh(
+        cache_name: str, duration_s: float, status: str = "success"
+    ) -> None:
+        """Registra a duração de uma recarga de cache."""
+        cache_refresh_duration.record(
+            duration_s, {"cache": cache_name, "status": status}
+        )
+
     @staticmethod
     def record_tool_call(
-        tool_id: str, duration_s: float, status: str = "success"
+        tool_id: str,
+        duration_s: float,
+        status: str = "success",
+        queue_wait_s: Optional[float] = None,
     ) -> None:
-        """Registra uma chamada a tool HTTP."""
+        """Registra uma chamada a tool HTTP.
+
+        ``status="rejected"`` indica chamada recusada por saturação (sem
+        duração); ``queue_wait_s`` é o tempo aguardando vaga no bulkhead.
+        """
         tool_calls_total.add(1, {"tool_id": tool_id, "status": status})
+        if status == "rejected":
+            tool_call_rejections_total.add(1, {"tool_id": tool_id})
+            return
         tool_call_duration.record(duration_s, {"tool_id": tool_id})
+        if queue_wait_s is not None:
+            tool_call_queue_wait.record(queue_wait_s, {"tool_id": tool_id})
         if status == "error":
             tool_call_errors_total.add(1, {"tool_id": tool_id})
 
+    @staticmethod
+    def record_run_component(
+        component: str, duration_s: float, attributes: Mapping[str, Any]
+    ) -> None:
+        """Registra a duração de uma etapa de run (ver ``run_breakdown``)."""
+        agent_run_component_duration.record(
+            duration_s, {**attributes, "component": component}
+        )
+
+    @staticmethod
+    def record_mongo_pool_connections(
+        address: str, open_delta: int = 0, in_use_delta: int = 0
+    ) -> None:
+        """Ajusta os gauges de conexões abertas/em uso de um servidor."""
+        attrs = {"address": address}
+        if open_delta:
+            mongo_pool_connections.add(open_delta, attrs)
+        if in_use_delta:
+            mongo_pool_connections_in_use.add(in_use_delta, attrs)
+
+    @staticmethod
+    def record_mongo_checkout(
+        address: str, wait_s: Optional[float], failed: bool = False
+    ) -> None:
+        """Registra a espera por uma conexão do pool (ou a falha)."""
+        attrs = {"address": address}
+        if failed:
+            mongo_pool_checkout_failures_total.add(1, attrs)
+        if wait_s is not None:
+            mongo_pool_checkout_wait.record(wait_s, attrs)
+
+    @staticmethod
+    def record_logs_dropped(count: int, policy: str) -> None:
+        """Registra registros de log descartados pela fila de envio."""
+        log_records_dropped_total.add(count, {"policy": policy})
+
     @staticmethod
     def record_startup_duration(duration_s: float) -> None:
         """Registra a duração do startup."""
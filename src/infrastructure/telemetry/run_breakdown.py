@@ -0,0 +1,85 @@
+"""Spans e histogramas que decompõem a latência de um run de agente.
+
+``MetricsMiddleware`` mede o run de ponta a ponta e, com ``bind_run``,
+deixa ``agent_id``/``team_id`` no contexto da requisição.  Cada trecho
+instrumentado com ``component_span`` — tool HTTP, busca no knowledge
+base, nível da travessia hierárquica, consulta ao MongoDB — abre um
+span filho do span corrente com esses atributos e registra a duração em
+``agent_run_component_duration_seconds``.  O tempo do modelo é o que
+sobra do run (e os spans do ``AgnoInstrumentor``).
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Mapping
+
+from opentelemetry import trace
+from opentelemetry.trace import Span
+
+from .metrics import TelemetryMetrics
+
+COMPONENT_TOOL = "tool"
+COMPONENT_RAG = "rag"
+COMPONENT_RAG_EMBED = "rag_embed"
+COMPONENT_RAG_LEVEL = "rag_level"
+COMPONENT_MONGO = "mongo"
+
+_tracer = trace.get_tracer("orquestrador-ia")
+
+_run_attributes: ContextVar[Mapping[str, Any]] = ContextVar(
+    "run_attributes", default={}
+)
+
+
+@contextmanager
+def bind_run(**attributes: Any) -> Iterator[None]:
+    """Associa ``attributes`` (ex.: ``agent_id``) a tudo que rodar no bloco."""
+    token = _run_attributes.set(
+        {key: value for key, value in attributes.items() if value is not None}
+    )
+    try:
+        yield
+    finally:
+        _run_attributes.reset(token)
+
+
+def run_attributes() -> Mapping[str, Any]:
+    """Atributos do run corrente (vazio fora de uma requisição de agente)."""
+    return _run_attributes.get()
+
+
+@contextmanager
+def component_span(component: str, name: str, **attributes: Any) -> Iterator[Span]:
+    """Span ``name`` + duração no histograma, com os atributos do run.
+
+    Atributos ``None`` são omitidos.  Exceções marcam o span como erro e
+    entram no histograma com ``status="error"``.
+    """
+    attrs: Dict[str, Any] = dict(_run_attributes.get())
+    attrs["component"] = component
+    attrs.update(
+        (key, value) for key, value in attributes.items() if value is not None
+    )
+    status = "success"
+    began = time.perf_counter()
+    with _tracer.start_as_current_span(name, attributes=attrs) as span:
+        try:
+            yield span
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            TelemetryMetrics.record_run_component(
+                component, time.perf_counter() - began, {**attrs, "status": status}
+            )
+
+
+def annotate_span(**attributes: Any) -> None:
+    """Acrescenta atributos ao span corrente (ignora valores ``None``)."""
+    span = trace.get_current_span()
+    for key, value in attributes.items():
+        if value is not None:
+            span.set_attribute(key, value)
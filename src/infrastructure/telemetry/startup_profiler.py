@@ -0,0 +1,212 @@
+"""Perfil do startup: duração de cada fase do lifespan e dos imports."""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
+
+from opentelemetry import trace
+
+# Imports mais pesados do processo — medidos só sob demanda
+HEAVY_MODULES = (
+    "agno.os",
+    "agno.agent",
+    "agno.team",
+    "opentelemetry.sdk.trace",
+    "opentelemetry.exporter.otlp.proto.grpc.trace_exporter",
+    "motor.motor_asyncio",
+    "fastapi",
+)
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+@dataclass
+class _Phase:
+    name: str
+    start_ns: int
+    end_ns: int = 0
+    parent: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return round((self.end_ns - self.start_ns) / 1e6, 2)
+
+
+class StartupProfiler:
+    """Registra as fases do startup e as exporta como spans OpenTelemetry.
+
+    Fases aninhadas (``with profiler.phase(...)`` dentro de outra) viram
+    filhas da fase externa; ``record`` adiciona fases já medidas, como a
+    construção de cada agente.  Como o tracer só é configurado no meio do
+    startup, os spans são emitidos de uma vez por ``export_spans``, com
+    os timestamps originais.
+    """
+
+    def __init__(self) -> None:
+        self._start_ns = time.time_ns()
+        self._end_ns: Optional[int] = None
+        self._phases: List[_Phase] = []
+        self._stack: List[str] = []
+        self._imports: Optional[Dict[str, Any]] = None
+
+    @contextmanager
+    def phase(self, name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+        """Mede a fase ``name``; o dict devolvido aceita atributos extras."""
+        entry = _Phase(
+            name=name,
+            start_ns=time.time_ns(),
+            parent=self._stack[-1] if self._stack else None,
+            attributes=dict(attributes),
+        )
+        self._phases.append(entry)
+        self._stack.append(name)
+        try:
+            yield entry.attributes
+        except BaseException as exc:
+            entry.attributes["error"] = type(exc).__name__
+            raise
+        finally:
+            self._stack.pop()
+            entry.end_ns = time.time_ns()
+
+    def record(
+        self,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        *,
+        parent: Optional[str] = None,
+        **attributes: Any,
+    ) -> None:
+        self._phases.append(_Phase(name, start_ns, end_ns, parent, attributes))
+
+    def record_agent_builds(
+        self, builds: Mapping[str, Mapping[str, Any]], *, parent: str
+    ) -> None:
+        """Adiciona uma fase ``agent:<id>`` por agente (ver ``get_build_times``)."""
+        if not isinstance(builds, Mapping):
+            return
+        for agent_id, build in builds.items():
+            self.record(
+                f"agent:{agent_id}",
+                build["start_ns"],
+                build["end_ns"],
+                parent=parent,
+                **{f"stage.{k}_ms": v for k, v in build.get("stages_ms", {}).items()},
+            )
+
+    def finish(self) -> float:
+        """Marca o fim do startup; devolve a duração total em segundos."""
+        self._end_ns = time.time_ns()
+        return (self._end_ns - self._start_ns) / 1e9
+
+    def export_spans(self, tracer: Optional[trace.Tracer] = None) -> None:
+        """Emite ``startup`` e uma span filha por fase, com os tempos medidos."""
+        tracer = tracer or trace.get_tracer("orquestrador.startup")
+        root = tracer.start_span("startup", start_time=self._start_ns)
+        spans: Dict[str, trace.Span] = {}
+        # Pais antes dos filhos: fases registradas (``record``) podem
+        # começar antes da fase que as agrupa
+        for entry in sorted(self._phases, key=lambda p: (self._depth(p), p.start_ns)):
+            parent = spans.get(entry.parent, root) if entry.parent else root
+            span = tracer.start_span(
+                entry.name,
+                context=trace.set_span_in_context(parent),
+                start_time=entry.start_ns,
+                attributes=_span_attributes(entry.attributes),
+            )
+            spans.setdefault(entry.name, span)
+            span.end(end_time=entry.end_ns or entry.start_ns)
+        root.end(end_time=self._end_ns or time.time_ns())
+
+    def profile_imports(
+        self, modules: Sequence[str] = HEAVY_MODULES, top: int = 15
+    ) -> Dict[str, Any]:
+        """Tempo de import de ``modules`` num interpretador novo (cacheado)."""
+        if self._imports is None:
+            self._imports = profile_imports(modules, top=top)
+        return self._imports
+
+    def report(self) -> Dict[str, Any]:
+        end_ns = self._end_ns or time.time_ns()
+        return {
+            "status": "complete" if self._end_ns else "in_progress",
+            "total_ms": round((end_ns - self._start_ns) / 1e6, 2),
+            "phases": [
+                {
+                    "name": entry.name,
+                    "parent": entry.parent,
+                    "offset_ms": round((entry.start_ns - self._start_ns) / 1e6, 2),
+                    "duration_ms": entry.duration_ms,
+                    **({"attributes": entry.attributes} if entry.attributes else {}),
+                }
+                for entry in sorted(self._phases, key=lambda p: p.start_ns)
+            ],
+            **({"imports": self._imports} if self._imports is not None else {}),
+        }
+
+    # ── private ─────────────────────────────────────────────────────
+
+    def _depth(self, entry: _Phase) -> int:
+        parents = {p.name: p.parent for p in self._phases}
+        depth, parent = 0, entry.parent
+        while parent is not None and depth < len(parents):
+            depth, parent = depth + 1, parents.get(parent)
+        return depth
+
+
+def profile_imports(modules: Sequence[str], *, top: int = 15) -> Dict[str, Any]:
+    """Roda ``python -X importtime`` e resume o custo de cada módulo.
+
+    Um processo novo mede o import a frio, sem interferir no atual.
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    try:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        return {"status": "error", "error": str(exc)}
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), len(indent)))
+    if not entries:
+        return {"status": "error", "error": result.stderr.strip()[-500:]}
+
+    top_level_depth = min(depth for *_, depth in entries)
+    requested = {
+        name: round(cumulative / 1000, 2)
+        for name, _, cumulative, _ in entries
+        if name in modules
+    }
+    slowest = sorted(entries, key=lambda e: e[1], reverse=True)[:top]
+    return {
+        "status": "ok" if result.returncode == 0 else "error",
+        "total_ms": round(
+            sum(c for _, _, c, d in entries if d == top_level_depth) / 1000, 2
+        ),
+        "modules_ms": requested,
+        "slowest_self_ms": {name: round(s / 1000, 2) for name, s, _, _ in slowest},
+    }
+
+
+def _span_attributes(attributes: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value
+        for key, value in attributes.items()
+        if isinstance(value, (str, bool, int, float))
+    }
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from agno.tools import Toolkit
 
 from src.domain.ports.knowledge_search_port import IKnowledgeSearchStrategy
+from src.infrastructure.telemetry.run_breakdown import (
+    COMPONENT_RAG,
+    annotate_span,
+    component_span,
+)
 
 
 def create_hierarchical_search_tool(
     strategy: IKnowledgeSearchStrategy,
     *,
     top_k: int = 5,
+    doc_name: Optional[str] = None,
 ) -> Toolkit:
     """Cria um ``Toolkit`` agno com função async de busca hierárquica.
 
@@ -24,6 +32,8 @@ def create_hierarchical_search_tool(
         Estratégia de busca hierárquica já configurada.
     top_k:
         Número máximo de resultados.
+    doc_name:
+        Documento consultado — atributo dos spans/métricas da busca.
 
     Returns
     -------
@@ -40,10 +50,13 @@ def create_hierarchical_search_tool(
         Returns:
             Trechos relevantes encontrados no knowledge base.
         """
-        try:
-            results = await strategy.search(query, top_k=top_k)
-        except Exception as exc:
-            return f"Erro ao buscar no knowledge base: {exc}"
+        with component_span(COMPONENT_RAG, "rag.search", doc_name=doc_name):
+            try:
+                results = await strategy.search(query, top_k=top_k)
+            except Exception as exc:
+                annotate_span(rag_status="error", error=str(exc))
+                return f"Erro ao buscar no knowledge base: {exc}"
+            annotate_span(results=len(results))
 
         if not results:
             return "Nenhuma informação relevante encontrada no knowledge base."
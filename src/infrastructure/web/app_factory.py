@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from contextlib import asynccontextmanager
 from typing import Optional
@@ -10,14 +11,17 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.application.services.lazy_agent import LazyAgent
 from src.infrastructure.config.app_config import AppConfig
 from src.infrastructure.dependency_injection import DependencyContainer
+from src.infrastructure.logging.async_shipping import AsyncLogShipper
 from src.infrastructure.logging.logger_adapter import StructlogLoggerAdapter
 from src.infrastructure.telemetry import (
     setup_telemetry,
     shutdown_telemetry,
     TelemetryMetrics,
 )
+from src.infrastructure.telemetry.startup_profiler import StartupProfiler
 from src.infrastructure.web.metrics_middleware import MetricsMiddleware
 from agno.os import AgentOS
 from agno.os.interfaces.agui import AGUI
@@ -66,6 +70,8 @@ class AppFactory:
     def __init__(self) -> None:
         self._container: Optional[DependencyContainer] = None
         self._logger = StructlogLoggerAdapter("app_factory")
+        self._profiler = StartupProfiler()
+        self._log_shipper: Optional[AsyncLogShipper] = None
 
     def create_app(self) -> FastAPI:
         """Cria a aplicação FastAPI — **síncrono** (module-level safe)."""
@@ -122,6 +128,13 @@ class AppFactory:
                 return ctrl.get_cache_stats()
             return {"status": "no_cache"}
 
+        @app.get("/admin/startup-profile")
+        async def startup_profile(imports: bool = False):
+            # ``imports=true`` mede os imports pesados num processo separado
+            if imports:
+                await asyncio.to_thread(self._profiler.profile_imports)
+            return self._profiler.report()
+
         @app.post("/admin/refresh-cache")
         async def refresh_cache():
             if self._container:
@@ -137,20 +150,21 @@ class AppFactory:
         if self._container:
             return
         self._logger.info("Lifespan: carregando AppConfig...")
-        config = AppConfig.load()
+        with self._profiler.phase("config_load"):
+            config = AppConfig.load()
         self._logger.info(
             "Lifespan: criando DependencyContainer...",
             mongo_db=config.mongo_database_name,
         )
-        self._container = await DependencyContainer.create_async(config)
+        with self._profiler.phase("container"):
+            self._container = await DependencyContainer.create_async(
+                config, profiler=self._profiler
+            )
         self._logger.info("Lifespan: container criado com sucesso")
 
     async def _load_agents(self):
-        """Aquece cache e retorna lista de agentes ativos."""
+        """Carrega (e põe em cache) a lista de agentes ativos."""
         controller = self._container.get_orquestrador_controller()
-        self._logger.info("Lifespan: warm up cache...")
-        await controller.warm_up_cache()
-
         self._logger.info("Lifespan: carregando agentes...")
         agents = await controller.get_agents()
         self._logger.info(
@@ -161,8 +175,10 @@ class AppFactory:
         return agents
 
     async def _load_teams(self):
-        """Carrega teams ativos (dependem dos agentes em cache)."""
+        """Aquece o cache de teams (usa os agentes já em cache) e os retorna."""
         controller = self._container.get_orquestrador_controller()
+        self._logger.info("Lifespan: warm up cache...")
+        await controller.warm_up_cache()
         teams = await controller.get_teams()
         self._logger.info(
             "Lifespan: teams carregados",
@@ -187,7 +203,11 @@ class AppFactory:
 
     def _mount_agent_os(self, app: FastAPI, agents: list, teams: list) -> None:
         """Cria interfaces AG-UI e monta o AgentOS no app base."""
-        agent_interfaces = [AGUI(agent=agent) for agent in agents]
+        # AG-UI precisa de um Agent concreto; stubs sob demanda ficam só nas
+        # rotas REST do AgentOS
+        agent_interfaces = [
+            AGUI(agent=agent) for agent in agents if not isinstance(agent, LazyAgent)
+        ]
         team_interfaces = [AGUI(team=team) for team in teams]
         interfaces = agent_interfaces + team_interfaces
         self._logger.info(
@@ -218,16 +238,21 @@ class AppFactory:
         import time as _time
 
         startup_start = _time.perf_counter()
+        self._profiler = StartupProfiler()
         try:
             self._logger.info("Lifespan: iniciando...")
             await self._ensure_container()
 
             config = self._container.config
-            setup_telemetry(config)
-            self._instrument_fastapi(app)
+            with self._profiler.phase("telemetry_setup"):
+                setup_telemetry(config)
+                self._instrument_fastapi(app)
+            # Depois do setup de telemetria para incluir o handler OTel
+            self._start_log_shipping(config)
 
             agents, teams = await self._load_all_entities()
-            self._try_mount_agent_os(app, agents, teams)
+            with self._profiler.phase("agentos_mount"):
+                self._try_mount_agent_os(app, agents, teams)
 
             self._record_startup_metrics(startup_start, agents, teams)
             yield
@@ -239,14 +264,50 @@ class AppFactory:
             )
             raise
         finally:
+            self._stop_log_shipping()
             shutdown_telemetry()
             if self._container:
                 await self._container.cleanup()
 
+    def _start_log_shipping(self, config: AppConfig) -> None:
+        """Passa a escrever os logs numa thread, se habilitado."""
+        if not config.log_async_enabled:
+            return
+        self._log_shipper = AsyncLogShipper(
+            queue_size=config.log_queue_size,
+            batch_size=config.log_batch_size,
+            flush_interval_s=config.log_flush_interval_s,
+            drop_policy=config.log_drop_policy,
+        )
+        self._log_shipper.install()
+        self._logger.info(
+            "Logs enviados em segundo plano",
+            queue_size=config.log_queue_size,
+            drop_policy=config.log_drop_policy,
+        )
+
+    def _stop_log_shipping(self) -> None:
+        """Esvazia a fila de logs e volta à escrita síncrona."""
+        if self._log_shipper is None:
+            return
+        stats = self._log_shipper.get_stats()
+        self._log_shipper.shutdown()
+        self._log_shipper = None
+        self._logger.info(
+            "Envio de logs em segundo plano encerrado",
+            shipped=stats["shipped"],
+            dropped=stats["dropped"],
+        )
+
     async def _load_all_entities(self):
         """Carrega agentes e teams ativos."""
-        agents = await self._load_agents()
-        teams = await self._load_teams()
+        with self._profiler.phase("agents_build"):
+            agents = await self._load_agents()
+        self._profiler.record_agent_builds(
+            self._container.get_agent_build_times(), parent="agents_build"
+        )
+        with self._profiler.phase("teams_build"):
+            teams = await self._load_teams()
         return agents, teams
 
     def _try_mount_agent_os(self, app: FastAPI, agents, teams):
@@ -273,9 +334,16 @@ class AppFactory:
         TelemetryMetrics.record_startup_duration(startup_elapsed)
         TelemetryMetrics.record_agents_loaded(len(agents) if agents else 0)
         TelemetryMetrics.record_teams_loaded(len(teams) if teams else 0)
+        self._profiler.finish()
+        self._profiler.export_spans()
         self._logger.info(
             "Startup completo",
             startup_duration_s=round(startup_elapsed, 3),
+            phases_ms={
+                phase["name"]: phase["duration_ms"]
+                for phase in self._profiler.report()["phases"]
+                if phase["parent"] is None
+            },
         )
 
 
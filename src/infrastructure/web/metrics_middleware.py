@@ -2,7 +2,9 @@
 
 Intercepta requisições de agentes e teams (``/agents/*/runs``,
 ``/teams/*/runs``) e registra contadores, histogramas e gauges
-via :class:`TelemetryMetrics`.
+via :class:`TelemetryMetrics`.  Durante o request, ``agent_id`` (ou
+``team_id``) fica no contexto via ``bind_run`` para que os spans de
+tools, RAG e MongoDB do run carreguem o mesmo atributo.
 
 Posicionamento na stack de middlewares:
     CORS → MetricsMiddleware → PlaygroundPrefixMiddleware → rotas
@@ -21,6 +23,7 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from src.infrastructure.telemetry.metrics import TelemetryMetrics
+from src.infrastructure.telemetry.run_breakdown import bind_run
 
 # Padrões de URL que representam execução de agentes/teams
 _AGENT_RUN_RE = re.compile(r"^(?:/playground)?/agents/([^/]+)/runs")
@@ -70,9 +73,11 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         entity_id, is_agent = match
         self._record_start_metrics(entity_id, is_agent)
 
+        run_key = "agent_id" if is_agent else "team_id"
         start = time.perf_counter()
         try:
-            response = await call_next(request)
+            with bind_run(**{run_key: entity_id}):
+                response = await call_next(request)
             elapsed = time.perf_counter() - start
             self._record_end_metrics(entity_id, is_agent, elapsed, error=response.status_code >= 400)
             return response
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, TypeVar
 
 from agno.agent import Agent
 from agno.team import Team
 
+from src.application.services.lazy_agent import LazyAgent
 from src.application.use_cases.get_active_agents_use_case import GetActiveAgentsUseCase
 from src.application.use_cases.get_active_teams_use_case import GetActiveTeamsUseCase
 from src.domain.ports import ILogger
+from src.domain.ports.config_watcher_port import ConfigChanges, IConfigWatcher
 from src.infrastructure.telemetry.metrics import TelemetryMetrics
 
+_T = TypeVar("_T", Agent, Team)
+
 
 class AgentCacheEntry:
     """Cache de agentes com TTL."""
@@ -28,6 +33,10 @@ class AgentCacheEntry:
     def is_expired(self) -> bool:
         return datetime.now(timezone.utc) > (self.created_at + self.ttl)
 
+    def within_grace(self, grace: timedelta) -> bool:
+        """Expirado há menos de ``grace`` — ainda pode ser servido."""
+        return datetime.now(timezone.utc) <= (self.created_at + self.ttl + grace)
+
     def access(self) -> List[Agent]:
         self.hit_count += 1
         self.last_access = datetime.now(timezone.utc)
@@ -47,6 +56,10 @@ class TeamCacheEntry:
     def is_expired(self) -> bool:
         return datetime.now(timezone.utc) > (self.created_at + self.ttl)
 
+    def within_grace(self, grace: timedelta) -> bool:
+        """Expirado há menos de ``grace`` — ainda pode ser servido."""
+        return datetime.now(timezone.utc) <= (self.created_at + self.ttl + grace)
+
     def access(self) -> List[Team]:
         self.hit_count += 1
         self.last_access = datetime.now(timezone.utc)
@@ -54,55 +67,149 @@ class TeamCacheEntry:
 
 
 class OrquestradorController:
-    """Gerencia o orquestrador de agentes e teams com cache."""
+    """Gerencia o orquestrador de agentes e teams com cache.
+
+    O cache segue *stale-while-revalidate*: expirado o TTL, o snapshot
+    anterior continua sendo servido por até ``stale_grace_minutes``
+    enquanto uma única recarga roda em segundo plano.  Passada a
+    carência (ou com carência zero), quem chega aguarda a recarga —
+    também compartilhada entre chamadas concorrentes.  Se uma recarga
+    falha, o snapshot anterior é servido sem novas tentativas por
+    ``refresh_backoff_seconds``.
+    """
 
     def __init__(
         self,
         get_active_agents_use_case: GetActiveAgentsUseCase,
         get_active_teams_use_case: GetActiveTeamsUseCase,
         logger: ILogger,
+        cache_stats_providers: Optional[Dict[str, Callable[[], dict]]] = None,
+        config_watcher: Optional[IConfigWatcher] = None,
+        cache_ttl_minutes: int = 5,
+        stale_grace_minutes: float = 0,
+        refresh_backoff_seconds: float = 30,
     ) -> None:
         self._agents_use_case = get_active_agents_use_case
         self._teams_use_case = get_active_teams_use_case
         self._logger = logger
+        # Caches de outras camadas (ex.: modelos) expostos em get_cache_stats
+        self._cache_stats_providers = cache_stats_providers or {}
         self._cache: Optional[AgentCacheEntry] = None
         self._team_cache: Optional[TeamCacheEntry] = None
         self._lock = asyncio.Lock()
+        # Serializa recargas completas e incrementais
+        self._refresh_lock = asyncio.Lock()
+        self._config_watcher = config_watcher
+        self._ttl_minutes = cache_ttl_minutes
+        self._stale_grace = timedelta(minutes=stale_grace_minutes)
+        # Recarga em andamento por cache ("agents"/"teams")
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        # Instante (monotônico) da última recarga que falhou, por cache
+        self._refresh_backoff = refresh_backoff_seconds
+        self._failed_at: Dict[str, float] = {}
 
     async def get_agents(self) -> List[Agent]:
         """Retorna agentes com cache inteligente."""
         async with self._lock:
-            if self._cache and not self._cache.is_expired():
+            cache = self._cache
+            if cache and not cache.is_expired():
                 TelemetryMetrics.record_cache_hit("agents")
-                return self._cache.access()
+                return cache.access()
+            if cache and self._backing_off("agents"):
+                TelemetryMetrics.record_cache_hit("agents")
+                return cache.access()
+            if cache and cache.within_grace(self._stale_grace):
+                TelemetryMetrics.record_cache_hit("agents")
+                self._refresh("agents", self._refresh_agents)
+                return cache.access()
+            task = self._refresh("agents", self._refresh_agents)
         TelemetryMetrics.record_cache_miss("agents")
-        return await self._load_agents()
+        return await asyncio.shield(task)
 
     async def get_teams(self) -> List[Team]:
         """Retorna teams com cache inteligente."""
         async with self._lock:
-            if self._team_cache and not self._team_cache.is_expired():
+            cache = self._team_cache
+            if cache and not cache.is_expired():
                 TelemetryMetrics.record_cache_hit("teams")
-                return self._team_cache.access()
+                return cache.access()
+            if cache and self._backing_off("teams"):
+                TelemetryMetrics.record_cache_hit("teams")
+                return cache.access()
+            if cache and cache.within_grace(self._stale_grace):
+                TelemetryMetrics.record_cache_hit("teams")
+                self._refresh("teams", self._refresh_teams)
+                return cache.access()
+            task = self._refresh("teams", self._refresh_teams)
         TelemetryMetrics.record_cache_miss("teams")
-        # Teams dependem de agents — garante que agents existam
-        agents = await self.get_agents()
-        return await self._load_teams(agents)
+        return await asyncio.shield(task)
 
     async def warm_up_cache(self) -> None:
-        """Pre-aquece o cache de agentes e teams durante a inicialização."""
+        """Pre-aquece o cache de agentes e teams durante a inicialização.
+
+        Em seguida passa a observar alterações de configuração, se houver
+        um ``config_watcher``.
+        """
         agents = await self.get_agents()
         await self._load_teams(agents)
+        await self.start_config_watch()
 
     async def refresh_agents(self) -> None:
         """Força recarga do cache de agentes e teams."""
-        async with self._lock:
-            self._cache = None
-            self._team_cache = None
-        agents = await self._load_agents()
-        await self._load_teams(agents)
+        async with self._refresh_lock:
+            agents = await self._load_agents()
+            await self._load_teams(agents)
         self._logger.info("Cache de agentes e teams atualizado")
 
+    async def start_config_watch(self) -> None:
+        """Passa a aplicar alterações de configuração conforme acontecem."""
+        if self._config_watcher is not None:
+            await self._config_watcher.start(self.apply_config_changes)
+
+    async def stop_config_watch(self) -> None:
+        if self._config_watcher is not None:
+            await self._config_watcher.stop()
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+
+    async def apply_config_changes(self, changes: ConfigChanges) -> None:
+        """Recria só os agentes/teams afetados e troca-os no cache.
+
+        Agentes são afetados quando a própria config ou uma de suas tools
+        muda; teams, quando a config ou algum membro muda.  As listas em
+        cache são atualizadas in-place — quem guardou a referência
+        (AgentOS) passa a ver as novas instâncias.
+        """
+        start = time.perf_counter()
+        async with self._refresh_lock:
+            if self._cache is None:
+                # Nada publicado ainda: a próxima leitura carrega tudo
+                return
+            built, removed = await self._agents_use_case.rebuild(
+                changes.agent_ids, changes.tool_ids
+            )
+            agents = self._cache.agents
+            agents[:] = _swap(agents, built, removed)
+
+            teams_built: Dict[str, Team] = {}
+            teams_removed: Set[str] = set()
+            changed_agents = set(built) | removed
+            if self._team_cache is not None and (changes.team_ids or changed_agents):
+                teams_built, teams_removed = await self._teams_use_case.rebuild(
+                    changes.team_ids, changed_agents, agents
+                )
+                teams = self._team_cache.teams
+                teams[:] = _swap(teams, teams_built, teams_removed)
+
+        self._logger.info(
+            "Configurações recarregadas incrementalmente",
+            agents_rebuilt=sorted(built),
+            agents_removed=sorted(removed),
+            teams_rebuilt=sorted(teams_built),
+            teams_removed=sorted(teams_removed),
+            elapsed_s=round(time.perf_counter() - start, 3),
+        )
+
     def get_cache_stats(self) -> Dict[str, Any]:
         stats: Dict[str, Any] = {}
         if not self._cache:
@@ -114,7 +221,12 @@ class OrquestradorController:
                 "created_at": self._cache.created_at.isoformat(),
                 "last_access": self._cache.last_access.isoformat(),
                 "is_expired": self._cache.is_expired(),
+                "refreshing": self._is_refreshing("agents"),
                 "agent_count": len(self._cache.agents),
+                "materialized_count": sum(
+                    not isinstance(agent, LazyAgent) or agent.is_materialized
+                    for agent in self._cache.agents
+                ),
             }
         if not self._team_cache:
             stats["teams"] = {"status": "empty"}
@@ -125,38 +237,112 @@ class OrquestradorController:
                 "created_at": self._team_cache.created_at.isoformat(),
                 "last_access": self._team_cache.last_access.isoformat(),
                 "is_expired": self._team_cache.is_expired(),
+                "refreshing": self._is_refreshing("teams"),
                 "team_count": len(self._team_cache.teams),
             }
+        for name, provider in self._cache_stats_providers.items():
+            stats[name] = provider()
         return stats
 
     # ── private ─────────────────────────────────────────────────────
 
+    def _refresh(self, name: str, load: Callable[[], Awaitable[list]]) -> asyncio.Task:
+        """Recarga em andamento de ``name`` ou uma nova — nunca duas."""
+        task = self._refresh_tasks.get(name)
+        if task is None or task.done():
+            task = asyncio.create_task(load())
+            task.add_done_callback(self._on_refresh_done)
+            self._refresh_tasks[name] = task
+        return task
+
+    def _is_refreshing(self, name: str) -> bool:
+        task = self._refresh_tasks.get(name)
+        return task is not None and not task.done()
+
+    def _backing_off(self, name: str) -> bool:
+        failed_at = self._failed_at.get(name)
+        return (
+            failed_at is not None
+            and time.monotonic() - failed_at < self._refresh_backoff
+        )
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        # Recargas em segundo plano não têm quem aguarde a exceção
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error(
+                "Erro na recarga do cache em segundo plano",
+                error=str(task.exception()),
+            )
+
+    async def _refresh_agents(self) -> List[Agent]:
+        async with self._refresh_lock:
+            return await self._load_agents()
+
+    async def _refresh_teams(self) -> List[Team]:
+        # Teams dependem de agents — fora do lock, pois get_agents pode recarregar
+        agents = await self.get_agents()
+        async with self._refresh_lock:
+            return await self._load_teams(agents)
+
     async def _load_agents(self) -> List[Agent]:
+        start = time.perf_counter()
         try:
             agents = await self._agents_use_case.execute()
-            self._cache = AgentCacheEntry(agents)
+            if self._cache is not None:
+                # Mantém a identidade da lista publicada (ver apply_config_changes)
+                self._cache.agents[:] = agents
+                agents = self._cache.agents
+            self._cache = AgentCacheEntry(agents, self._ttl_minutes)
+            self._failed_at.pop("agents", None)
+            TelemetryMetrics.record_cache_refresh(
+                "agents", time.perf_counter() - start
+            )
             return agents
         except Exception as exc:
+            TelemetryMetrics.record_cache_refresh(
+                "agents", time.perf_counter() - start, "error"
+            )
             self._logger.error(
                 "Erro ao carregar agentes",
                 error=str(exc),
             )
             if self._cache:
+                self._failed_at["agents"] = time.monotonic()
                 self._logger.warning("Usando cache expirado como fallback")
                 return self._cache.access()
             raise
 
     async def _load_teams(self, agents: List[Agent]) -> List[Team]:
+        start = time.perf_counter()
         try:
             teams = await self._teams_use_case.execute(agents)
-            self._team_cache = TeamCacheEntry(teams)
+            if self._team_cache is not None:
+                self._team_cache.teams[:] = teams
+                teams = self._team_cache.teams
+            self._team_cache = TeamCacheEntry(teams, self._ttl_minutes)
+            self._failed_at.pop("teams", None)
+            TelemetryMetrics.record_cache_refresh(
+                "teams", time.perf_counter() - start
+            )
             return teams
         except Exception as exc:
+            TelemetryMetrics.record_cache_refresh(
+                "teams", time.perf_counter() - start, "error"
+            )
             self._logger.error(
                 "Erro ao carregar teams",
                 error=str(exc),
             )
             if self._team_cache:
+                self._failed_at["teams"] = time.monotonic()
                 self._logger.warning("Usando cache de teams expirado como fallback")
                 return self._team_cache.access()
             return []
+
+
+def _swap(current: List[_T], built: Dict[str, _T], removed: Set[str]) -> List[_T]:
+    """Substitui/remove itens por ``id`` preservando a ordem; novos vão ao fim."""
+    pending = dict(built)
+    updated = [pending.pop(item.id, item) for item in current if item.id not in removed]
+    updated.extend(pending.values())
+    return updated
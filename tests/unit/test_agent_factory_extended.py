@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.application.services.agent_factory_service import AgentFactoryService
 from src.domain.entities.agent_config import AgentConfig
-from src.domain.entities.rag_config import RagConfig
+from src.domain.entities.rag_config import RagConfig, SearchStrategy
 
 
 def _make_config(**overrides) -> AgentConfig:
@@ -157,3 +158,40 @@ class TestLoadDocument:
             path="docs/test.pdf",
             error="unknown error",
         )
+
+
+class TestHierarchicalDeduplication:
+    """Agentes com o mesmo documento HIERARCHICAL indexam uma única vez."""
+
+    @patch("src.application.services.agent_factory_service.create_hierarchical_search_tool")
+    @patch("src.application.services.agent_factory_service.Agent")
+    @patch("src.application.services.agent_factory_service.MongoAgentDb")
+    async def test_same_document_indexed_once(
+        self, mock_db, mock_agent, mock_create_tool, service, tmp_path, monkeypatch
+    ):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "manual.txt").write_text("conteúdo", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        service._indexing_service = AsyncMock()
+        service._search_factory = MagicMock()
+        shared_tool = MagicMock()
+        mock_create_tool.return_value = shared_tool
+
+        rag = RagConfig(
+            active=True,
+            doc_name="manual.txt",
+            model="m",
+            factory_ia_model="ollama",
+            search_strategy=SearchStrategy.HIERARCHICAL,
+        )
+        await asyncio.gather(
+            service.create_agent(_make_config(id="a1", rag_config=rag)),
+            service.create_agent(_make_config(id="a2", rag_config=rag)),
+        )
+
+        service._indexing_service.index_document.assert_awaited_once_with(
+            "manual.txt", "conteúdo", rag
+        )
+        mock_create_tool.assert_called_once()
+        for call in mock_agent.call_args_list:
+            assert call.kwargs["tools"] == [shared_tool]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -98,3 +99,122 @@ class TestAgentFactoryService:
         assert call_kwargs["store_history_messages"] is True
         assert call_kwargs["store_tool_messages"] is True
         assert call_kwargs["store_events"] is True
+
+
+class TestSharedResources:
+    @patch("src.application.services.agent_factory_service.Agent")
+    @patch("src.application.services.agent_factory_service.MongoAgentDb")
+    async def test_db_uses_shared_mongo_client(self, mock_db, mock_agent, service):
+        client = MagicMock()
+        service._mongo_client = client
+        await service.create_agent(_make_config())
+        assert mock_db.call_args.kwargs["db_client"] is client
+
+    @patch("src.application.services.agent_factory_service.Agent")
+    @patch("src.application.services.agent_factory_service.MongoAgentDb")
+    async def test_db_shared_and_models_left_to_model_cache(
+        self, mock_db, mock_agent, service
+    ):
+        await asyncio.gather(
+            service.create_agent(_make_config(id="a1")),
+            service.create_agent(_make_config(id="a2")),
+        )
+
+        # O compartilhamento do modelo é do ModelCacheService (na factory)
+        assert service._model_factory.create_model.call_count == 2
+        service._model_factory.create_model.assert_called_with(
+            "ollama", "llama3.2:latest"
+        )
+        mock_db.assert_called_once()
+        first, second = (c.kwargs for c in mock_agent.call_args_list)
+        assert first["db"] is second["db"]
+        assert service.get_build_stats()["resource_pool"]["resources"] == 1
+
+    @patch("src.application.services.agent_factory_service.Agent")
+    @patch("src.application.services.agent_factory_service.MongoAgentDb")
+    async def test_reset_shared_resources_releases_pool(
+        self, mock_db, mock_agent, service
+    ):
+        await service.create_agent(_make_config(id="a1"))
+        service.reset_shared_resources()
+        await service.create_agent(_make_config(id="a2"))
+
+        assert mock_db.call_count == 2
+        assert service.get_build_stats()["resource_pool"]["resources"] == 1
+
+    @patch("src.application.services.agent_factory_service.Agent")
+    @patch("src.application.services.agent_factory_service.MongoAgentDb")
+    async def test_toolkit_created_once_per_tool(
+        self, mock_db, mock_agent, service, mock_tool_repository
+    ):
+        tool = MagicMock()
+        toolkit = MagicMock()
+        mock_tool_repository.get_tools_by_ids.return_value = [tool]
+        service._tool_factory.create_tools_from_configs.return_value = [toolkit]
+
+        await asyncio.gather(
+            service.create_agent(_make_config(id="a1", tools_ids=["t1"])),
+            service.create_agent(_make_config(id="a2", tools_ids=["t1"])),
+        )
+
+        service._tool_factory.create_tools_from_configs.assert_awaited_once_with([tool])
+        for call in mock_agent.call_args_list:
+            assert call.kwargs["tools"] == [toolkit]
+
+    @patch("src.application.services.agent_factory_service.Agent")
+    @patch("src.application.services.agent_factory_service.MongoAgentDb")
+    async def test_stage_breakdown_logged_and_aggregated(
+        self, mock_db, mock_agent, service, mock_logger
+    ):
+        await service.create_agent(_make_config())
+
+        kwargs = next(
+            c.kwargs for c in mock_logger.info.call_args_list if c.args == ("Agente criado",)
+        )
+        assert {"validate", "model", "tools", "db", "assemble"} <= set(kwargs["stages_ms"])
+
+        stats = service.get_build_stats()
+        assert stats["agents_built"] == 1
+        assert stats["resource_pool"]["misses"] >= 1
+
+        build = service.get_build_times()["test-agent"]
+        assert build["end_ns"] >= build["start_ns"]
+        assert build["stages_ms"] == kwargs["stages_ms"]
+
+
+class TestPreloadTools:
+    @staticmethod
+    def _tool(tool_id):
+        tool = MagicMock()
+        tool.id = tool_id
+        return tool
+
+    async def test_one_query_for_all_agents(self, service, mock_tool_repository):
+        t1, t2 = self._tool("t1"), self._tool("t2")
+        mock_tool_repository.get_tools_by_ids.return_value = [t1, t2]
+        configs = [
+            _make_config(id="a1", tools_ids=["t1"]),
+            _make_config(id="a2", tools_ids=["t2", "t1"]),
+            _make_config(id="a3", tools_ids=["gone"]),
+        ]
+
+        assert await service.preload_tools(configs) == 3
+        mock_tool_repository.get_tools_by_ids.assert_awaited_once_with(["gone", "t1", "t2"])
+
+        mock_tool_repository.get_tools_by_ids.reset_mock()
+        assert await service._resolve_tools(["t2", "t1"]) == [t2, t1]
+        assert await service._resolve_tools(["gone"]) == []
+        mock_tool_repository.get_tools_by_ids.assert_not_awaited()
+
+    async def test_unknown_ids_fall_back_to_repository(self, service, mock_tool_repository):
+        t1, t9 = self._tool("t1"), self._tool("t9")
+        mock_tool_repository.get_tools_by_ids.return_value = [t1]
+        await service.preload_tools([_make_config(tools_ids=["t1"])])
+
+        mock_tool_repository.get_tools_by_ids.return_value = [t9]
+        assert await service._resolve_tools(["t1", "t9"]) == [t1, t9]
+        mock_tool_repository.get_tools_by_ids.assert_awaited_with(["t9"])
+
+    async def test_no_tools_skips_query(self, service, mock_tool_repository):
+        assert await service.preload_tools([_make_config()]) == 0
+        mock_tool_repository.get_tools_by_ids.assert_not_awaited()
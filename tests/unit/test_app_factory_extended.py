@@ -146,7 +146,9 @@ class TestEnsureContainer:
         await factory._ensure_container()
         assert factory._container is not None
         mock_config_cls.load.assert_called_once()
-        mock_dc_cls.create_async.assert_awaited_once_with(mock_config)
+        mock_dc_cls.create_async.assert_awaited_once_with(
+            mock_config, profiler=factory._profiler
+        )
 
     @patch("src.infrastructure.web.app_factory.DependencyContainer")
     @patch("src.infrastructure.web.app_factory.AppConfig")
@@ -248,6 +250,7 @@ class TestLifespan:
         mock_config.otel_enabled = True
         mock_config.otel_exporter_endpoint = "http://localhost:4317"
         mock_config.otel_service_name = "test"
+        mock_config.log_async_enabled = False
         mock_config_cls.load.return_value = mock_config
 
         controller = MagicMock()
@@ -288,6 +291,7 @@ class TestLifespan:
         mock_config.otel_enabled = True
         mock_config.otel_exporter_endpoint = "http://localhost:4317"
         mock_config.otel_service_name = "test"
+        mock_config.log_async_enabled = False
         mock_config_cls.load.return_value = mock_config
 
         controller = MagicMock()
@@ -323,6 +327,7 @@ class TestLifespan:
         mock_config.otel_enabled = True
         mock_config.otel_exporter_endpoint = "http://localhost:4317"
         mock_config.otel_service_name = "test"
+        mock_config.log_async_enabled = False
         mock_config_cls.load.return_value = mock_config
 
         controller = MagicMock()
@@ -0,0 +1,191 @@
+"""Testes para AsyncLogShipper."""
+
+from __future__ import annotations
+
+import io
+import logging
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.logging.async_shipping import (
+    DROP_OLDEST,
+    AsyncLogShipper,
+    _ForwardHandler,
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+
+class _BlockingHandler(_ListHandler):
+    """Segura a thread de envio até ``unblock`` ser sinalizado."""
+
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+        self.entered = threading.Event()
+
+    def emit(self, record):
+        self.entered.set()
+        self.unblock.wait(5)
+        super().emit(record)
+
+
+@pytest.fixture
+def logger(request):
+    log = logging.getLogger(f"test.shipper.{request.node.name}")
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    yield log
+    log.handlers = []
+
+
+class TestShipping:
+    def test_records_delivered_on_background_thread(self, logger):
+        target = _ListHandler()
+        logger.addHandler(target)
+        originals = list(logger.handlers)
+        shipper = AsyncLogShipper(flush_interval_s=0.01)
+        shipper.install([logger])
+
+        assert isinstance(logger.handlers[0], _ForwardHandler)
+        for i in range(5):
+            logger.info("msg %d", i)
+        shipper.shutdown()
+
+        assert target.messages == [f"msg {i}" for i in range(5)]
+        assert target.threads == {"log-shipper"}
+        assert logger.handlers == originals
+        assert shipper.get_stats()["shipped"] == 5
+
+    def test_handler_level_respected(self, logger):
+        target = _ListHandler(level=logging.WARNING)
+        logger.addHandler(target)
+        shipper = AsyncLogShipper(flush_interval_s=0.01)
+        shipper.install([logger])
+
+        logger.info("ignorado")
+        logger.warning("enviado")
+        shipper.shutdown()
+
+        assert target.messages == ["enviado"]
+
+    def test_stream_handler_flushed_once_per_batch(self, logger):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        logger.addHandler(handler)
+        shipper = AsyncLogShipper(batch_size=100, flush_interval_s=0.01)
+
+        with patch.object(handler, "flush", wraps=handler.flush) as flush:
+            shipper.install([logger])
+            for i in range(50):
+                logger.info("linha %d", i)
+            shipper.shutdown()
+
+        assert stream.getvalue().splitlines() == [f"linha {i}" for i in range(50)]
+        assert flush.call_count <= shipper.get_stats()["batches"]
+
+    def test_args_resolved_at_log_time(self, logger):
+        target = _ListHandler()
+        logger.addHandler(target)
+        shipper = AsyncLogShipper(flush_interval_s=0.01)
+        shipper.install([logger])
+
+        payload = {"v": 1}
+        logger.info("valor %s", payload)
+        payload["v"] = 2
+        shipper.shutdown()
+
+        assert target.messages == ["valor {'v': 1}"]
+
+
+class TestDropPolicy:
+    def _saturate(self, logger, **kwargs):
+        target = _BlockingHandler()
+        logger.addHandler(target)
+        shipper = AsyncLogShipper(queue_size=2, batch_size=1, flush_interval_s=0.01, **kwargs)
+        shipper.install([logger])
+        logger.info("em envio")
+        assert target.entered.wait(1)
+        for i in range(5):
+            logger.info("msg %d", i)
+        return shipper, target
+
+    def test_drop_newest_keeps_first_records(self, logger):
+        with patch(
+            "src.infrastructure.logging.async_shipping.TelemetryMetrics"
+        ) as metrics:
+            shipper, target = self._saturate(logger)
+            assert shipper.get_stats()["dropped"] == 3
+            target.unblock.set()
+            shipper.shutdown()
+
+        assert target.messages == ["em envio", "msg 0", "msg 1"]
+        metrics.record_logs_dropped.assert_called_once_with(3, "drop_newest")
+
+    def test_drop_oldest_keeps_latest_records(self, logger):
+        shipper, target = self._saturate(logger, drop_policy=DROP_OLDEST)
+        target.unblock.set()
+        shipper.shutdown()
+
+        assert target.messages == ["em envio", "msg 3", "msg 4"]
+        assert shipper.get_stats()["dropped"] == 3
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            AsyncLogShipper(drop_policy="block")
+        with pytest.raises(ValueError):
+            AsyncLogShipper(queue_size=0)
+
+
+class TestInstall:
+    def test_default_install_covers_root(self):
+        root = logging.getLogger()
+        original = list(root.handlers)
+        shipper = AsyncLogShipper(flush_interval_s=0.01)
+        shipper.install()
+        try:
+            if original:
+                assert isinstance(root.handlers[0], _ForwardHandler)
+            assert shipper.get_stats()["running"] is True
+        finally:
+            shipper.shutdown()
+        assert root.handlers == original
+        assert shipper.get_stats()["running"] is False
+
+
+class TestAppFactoryWiring:
+    def test_start_and_stop_follow_config(self):
+        from unittest.mock import MagicMock
+
+        from src.infrastructure.web.app_factory import AppFactory
+
+        factory = AppFactory()
+        config = MagicMock(
+            log_async_enabled=True,
+            log_queue_size=100,
+            log_batch_size=10,
+            log_flush_interval_s=0.01,
+            log_drop_policy="drop_oldest",
+        )
+        with patch.object(AsyncLogShipper, "install") as install:
+            factory._start_log_shipping(config)
+        install.assert_called_once_with()
+        assert factory._log_shipper.get_stats()["drop_policy"] == "drop_oldest"
+
+        factory._stop_log_shipping()
+        assert factory._log_shipper is None
+
+        config.log_async_enabled = False
+        factory._start_log_shipping(config)
+        assert factory._log_shipper is None
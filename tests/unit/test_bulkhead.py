@@ -0,0 +1,141 @@
+"""Testes para Bulkhead e os limites de concorrência das tools HTTP."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.domain.entities.tool import HttpMethod, Tool
+from src.domain.entities.tool_http_config import ToolHttpConfig
+from src.infrastructure.http.bulkhead import Bulkhead, BulkheadFullError, acquire_all
+from src.infrastructure.http.client_pool import HttpClientPool
+from src.infrastructure.http.http_tool_factory import HttpToolFactory
+
+
+class TestBulkhead:
+    async def test_limits_concurrency(self):
+        bulkhead = Bulkhead("b", max_concurrent=2, max_queue=10)
+        running = peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with acquire_all(bulkhead):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak == 2
+
+    async def test_rejects_when_queue_full(self):
+        bulkhead = Bulkhead("b", max_concurrent=1, max_queue=0)
+        await bulkhead.acquire()
+        with pytest.raises(BulkheadFullError):
+            await bulkhead.acquire()
+        assert bulkhead.get_stats()["rejected"] == 1
+        bulkhead.release()
+        assert await bulkhead.acquire() >= 0.0
+
+    async def test_reports_queue_wait(self):
+        bulkhead = Bulkhead("b", max_concurrent=1, max_queue=1)
+        await bulkhead.acquire()
+        waiter = asyncio.create_task(bulkhead.acquire())
+        await asyncio.sleep(0.02)
+        assert bulkhead.get_stats()["waiting"] == 1
+        bulkhead.release()
+        assert await waiter >= 0.02
+
+    async def test_acquire_all_releases_on_rejection(self):
+        first = Bulkhead("first", max_concurrent=1, max_queue=0)
+        second = Bulkhead("second", max_concurrent=1, max_queue=0)
+        await second.acquire()
+        with pytest.raises(BulkheadFullError):
+            async with acquire_all(first, second):
+                pass
+        assert not first._semaphore.locked()
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            Bulkhead("b", max_concurrent=0, max_queue=0)
+        with pytest.raises(ValueError):
+            Bulkhead("b", max_concurrent=1, max_queue=-1)
+
+
+def _make_tool(**overrides) -> Tool:
+    defaults = dict(
+        id="slow",
+        name="Slow",
+        description="Slow tool",
+        route="http://api.local/items",
+        http_method=HttpMethod.POST,
+        parameters=[],
+        http_config=ToolHttpConfig(max_concurrency=1, max_queue=0),
+    )
+    defaults.update(overrides)
+    return Tool(**defaults)
+
+
+async def _entrypoints(mock_logger, tools, **factory_kwargs):
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    pool = HttpClientPool(mock_logger)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    pool.get_client = lambda url, config: client
+    factory = HttpToolFactory(logger=mock_logger, client_pool=pool, **factory_kwargs)
+    toolkits = await factory.create_tools_from_configs(tools)
+    fns = [tk.async_functions[t.id].entrypoint for tk, t in zip(toolkits, tools)]
+    return fns, release
+
+
+class TestHttpFunctionBulkhead:
+    async def test_saturated_tool_fails_fast(self, mock_logger):
+        (fn,), release = await _entrypoints(mock_logger, [_make_tool()])
+        with patch(
+            "src.infrastructure.http.http_tool_factory.TelemetryMetrics"
+        ) as metrics:
+            first = asyncio.create_task(fn(a=1))
+            await asyncio.sleep(0.01)
+            assert "capacidade esgotada" in await fn(a=2)
+            metrics.record_tool_call.assert_called_with("slow", 0.0, "rejected")
+            release.set()
+            assert await first == '{"ok":true}'
+        _, kwargs = metrics.record_tool_call.call_args
+        assert kwargs["queue_wait_s"] >= 0.0
+
+    async def test_host_limit_shared_across_tools(self, mock_logger):
+        config = ToolHttpConfig(max_concurrency=5, max_queue=5)
+        tools = [
+            _make_tool(id="a", http_config=config),
+            _make_tool(id="b", http_config=config),
+        ]
+        (fn_a, fn_b), release = await _entrypoints(
+            mock_logger, tools, host_max_concurrency=1, host_max_queue=0
+        )
+        first = asyncio.create_task(fn_a(x=1))
+        await asyncio.sleep(0.01)
+        assert "host:api.local" in await fn_b(x=2)
+        release.set()
+        await first
+
+    async def test_other_hosts_unaffected(self, mock_logger):
+        tools = [
+            _make_tool(id="a"),
+            _make_tool(id="b", route="http://other.local/items"),
+        ]
+        (fn_a, fn_b), release = await _entrypoints(
+            mock_logger, tools, host_max_concurrency=1, host_max_queue=0
+        )
+        first = asyncio.create_task(fn_a(x=1))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(fn_b(x=2))
+        await asyncio.sleep(0.01)
+        release.set()
+        assert await first == await second == '{"ok":true}'
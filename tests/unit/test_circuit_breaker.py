@@ -0,0 +1,213 @@
+"""Testes para CircuitBreaker e o short-circuit das tools HTTP."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.domain.entities.tool import HttpMethod, Tool
+from src.domain.entities.tool_http_config import ToolHttpConfig
+from src.infrastructure.http.circuit_breaker import CircuitBreaker, CircuitState
+from src.infrastructure.http.client_pool import HttpClientPool
+from src.infrastructure.http.http_tool_factory import HttpToolFactory
+
+
+def _breaker(**overrides) -> CircuitBreaker:
+    defaults = dict(error_rate_threshold=0.5, min_calls=4, open_duration_s=30.0)
+    defaults.update(overrides)
+    return CircuitBreaker(**defaults)
+
+
+class TestCircuitBreaker:
+    def test_opens_when_error_rate_exceeded(self):
+        breaker = _breaker()
+        for failed in (False, True, False, True):
+            assert breaker.allow()
+            breaker.record(0.1, failed=failed)
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.get_stats()["short_circuited"] == 1
+
+    def test_stays_closed_below_min_calls(self):
+        breaker = _breaker()
+        for _ in range(3):
+            breaker.record(0.1, failed=True)
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_slow_calls_count_as_failures(self):
+        breaker = _breaker(slow_call_s=0.5)
+        for _ in range(4):
+            breaker.record(1.0, failed=False)
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_allows_single_probe(self):
+        breaker = _breaker()
+        for _ in range(4):
+            breaker.record(0.1, failed=True)
+        with patch(
+            "src.infrastructure.http.circuit_breaker.time.monotonic",
+            return_value=breaker._opened_at + 31,
+        ):
+            assert breaker.state is CircuitState.HALF_OPEN
+            probe = breaker.allow()
+            assert probe
+            assert not breaker.allow()
+            breaker.record(0.1, failed=False, permit=probe)
+            assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self):
+        breaker = _breaker()
+        for _ in range(4):
+            breaker.record(0.1, failed=True)
+        with patch(
+            "src.infrastructure.http.circuit_breaker.time.monotonic",
+            return_value=breaker._opened_at + 31,
+        ):
+            probe = breaker.allow()
+            breaker.record(0.1, failed=True, permit=probe)
+            assert breaker.state is CircuitState.OPEN
+
+    def test_abort_releases_probe(self):
+        breaker = _breaker(open_duration_s=0.001)
+        for _ in range(4):
+            breaker.record(0.1, failed=True)
+        breaker._opened_at -= 1
+        probe = breaker.allow()
+        assert probe
+        breaker.abort(probe)
+        assert breaker.allow()
+
+    def test_calls_admitted_before_opening_do_not_decide_half_open(self):
+        breaker = _breaker()
+        slow_ok, slow_fail = breaker.allow(), breaker.allow()
+        for _ in range(4):
+            breaker.record(0.1, failed=True, permit=breaker.allow())
+        assert breaker.state is CircuitState.OPEN
+        with patch(
+            "src.infrastructure.http.circuit_breaker.time.monotonic",
+            return_value=breaker._opened_at + 31,
+        ):
+            probe = breaker.allow()
+            # Chamadas antigas terminam durante o teste: não fecham nem reabrem
+            breaker.record(0.1, failed=False, permit=slow_ok)
+            assert breaker.state is CircuitState.HALF_OPEN
+            breaker.record(0.1, failed=True, permit=slow_fail)
+            assert breaker.state is CircuitState.HALF_OPEN
+            assert not breaker.allow()
+
+            breaker.record(0.1, failed=False, permit=probe)
+            assert breaker.state is CircuitState.CLOSED
+
+    def test_late_failures_do_not_reopen_closed_circuit(self):
+        breaker = _breaker(min_calls=1)
+        stale = [breaker.allow() for _ in range(2)]
+        breaker.record(0.1, failed=True, permit=breaker.allow())
+        with patch(
+            "src.infrastructure.http.circuit_breaker.time.monotonic",
+            return_value=breaker._opened_at + 31,
+        ):
+            breaker.record(0.1, failed=False, permit=breaker.allow())
+            for permit in stale:
+                breaker.record(0.1, failed=True, permit=permit)
+            assert breaker.state is CircuitState.CLOSED
+
+    def test_timeout_adapts_to_p99(self):
+        breaker = _breaker()
+        assert breaker.timeout(30.0) == 30.0
+        for _ in range(30):
+            breaker.record(0.5, failed=False)
+        assert breaker.timeout(30.0) == pytest.approx(1.5)
+        assert breaker.timeout(1.2) == 1.2
+
+    def test_timeout_has_floor(self):
+        breaker = _breaker()
+        for _ in range(30):
+            breaker.record(0.01, failed=False)
+        assert breaker.timeout(30.0) == 1.0
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(error_rate_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(min_calls=0)
+
+
+def _make_tool(**overrides) -> Tool:
+    defaults = dict(
+        id="flaky",
+        name="Flaky",
+        description="Flaky tool",
+        route="http://api.local/items",
+        http_method=HttpMethod.POST,
+        parameters=[],
+        http_config=ToolHttpConfig(breaker_min_calls=2, breaker_error_rate=0.5),
+    )
+    defaults.update(overrides)
+    return Tool(**defaults)
+
+
+async def _entrypoint(mock_logger, tool, handler):
+    pool = HttpClientPool(mock_logger)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    pool.get_client = lambda url, config: client
+    factory = HttpToolFactory(logger=mock_logger, client_pool=pool)
+    toolkit = (await factory.create_tools_from_configs([tool]))[0]
+    return toolkit.async_functions[tool.id].entrypoint
+
+
+class TestHttpFunctionCircuitBreaker:
+    async def test_open_circuit_short_circuits(self, mock_logger):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, text="down")
+
+        fn = await _entrypoint(mock_logger, _make_tool(), handler)
+        assert (await fn(a=1)).startswith("Erro HTTP 503")
+        assert (await fn(a=2)).startswith("Erro HTTP 503")
+        result = await fn(a=3)
+        assert result == "Erro na requisição: circuito aberto para 'flaky'"
+        assert len(calls) == 2
+
+    async def test_client_errors_do_not_open_circuit(self, mock_logger):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404, text="missing")
+
+        fn = await _entrypoint(mock_logger, _make_tool(), handler)
+        for i in range(4):
+            await fn(a=i)
+        assert len(calls) == 4
+
+    async def test_breaker_can_be_disabled(self, mock_logger):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, text="down")
+
+        tool = _make_tool(
+            http_config=ToolHttpConfig(circuit_breaker=False, breaker_min_calls=1)
+        )
+        fn = await _entrypoint(mock_logger, tool, handler)
+        for i in range(3):
+            await fn(a=i)
+        assert len(calls) == 3
+
+    async def test_adaptive_timeout_applied_to_request(self, mock_logger):
+        seen = []
+
+        def handler(request):
+            seen.append(request.extensions["timeout"]["read"])
+            return httpx.Response(200, json={})
+
+        fn = await _entrypoint(mock_logger, _make_tool(), handler)
+        for i in range(25):
+            await fn(a=i)
+        assert seen[0] == 30.0
+        assert seen[-1] == 1.0
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.infrastructure.dependency_injection import DependencyContainer, HealthService
+from src.infrastructure.repositories.mongo_base import MongoClientFactory
 
 
 # ── HealthService ───────────────────────────────────────────────────
@@ -90,7 +91,15 @@ class TestHealthService:
 
 
 class TestDependencyContainer:
-    @patch("src.infrastructure.dependency_injection.AsyncIOMotorClient")
+    @pytest.fixture(autouse=True)
+    def _isolated_mongo_factory(self):
+        options = MongoClientFactory._pool_options
+        MongoClientFactory._instances.clear()
+        yield
+        MongoClientFactory._instances.clear()
+        MongoClientFactory._pool_options = options
+
+    @patch("src.infrastructure.repositories.mongo_base.AsyncIOMotorClient")
     async def test_create_async(self, mock_motor_cls):
         mock_client = MagicMock()
         mock_client.admin.command = AsyncMock(return_value={"ok": 1})
@@ -109,8 +118,12 @@ class TestDependencyContainer:
         assert container.health_service is not None
         controller = container.get_orquestrador_controller()
         assert controller is not None
+        # Repositórios, watcher e agno compartilham um único cliente
+        mock_motor_cls.assert_called_once()
+        assert "mongo_pool" in controller.get_cache_stats()
+        assert "log_sanitizer" in controller.get_cache_stats()
 
-    @patch("src.infrastructure.dependency_injection.AsyncIOMotorClient")
+    @patch("src.infrastructure.repositories.mongo_base.AsyncIOMotorClient")
     async def test_create_async_mongo_unavailable(self, mock_motor_cls):
         mock_client = MagicMock()
         mock_client.admin.command = AsyncMock(side_effect=Exception("connection refused"))
@@ -128,7 +141,7 @@ class TestDependencyContainer:
         container = await DependencyContainer.create_async(config)
         assert container is not None
 
-    @patch("src.infrastructure.dependency_injection.AsyncIOMotorClient")
+    @patch("src.infrastructure.repositories.mongo_base.AsyncIOMotorClient")
     async def test_cleanup(self, mock_motor_cls):
         mock_client = MagicMock()
         mock_client.admin.command = AsyncMock(return_value={"ok": 1})
@@ -146,7 +159,7 @@ class TestDependencyContainer:
         await container.cleanup()
         mock_client.close.assert_called_once()
 
-    @patch("src.infrastructure.dependency_injection.AsyncIOMotorClient")
+    @patch("src.infrastructure.repositories.mongo_base.AsyncIOMotorClient")
     async def test_cleanup_with_coroutine_close(self, mock_motor_cls):
         mock_client = MagicMock()
         mock_client.admin.command = AsyncMock(return_value={"ok": 1})
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import hashlib
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
@@ -82,7 +83,9 @@ class TestDocumentIndexingService:
         result = await self.service.index_document("test.txt", "# Title\nContent", rag)
 
         assert len(result) == 2
-        self.mock_tree_repo.save_nodes.assert_called_once_with(nodes)
+        self.mock_tree_repo.save_nodes.assert_called_once_with(
+            nodes, checksum=hashlib.sha256(b"# Title\nContent").hexdigest()
+        )
         # Parent node should get summary
         self.mock_summary_gen.generate_summary.assert_called()
 
@@ -139,3 +142,149 @@ class TestDocumentIndexingService:
         assert len(result) == 1
         assert result[0].embedding is None
         self.mock_logger.warning.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidates_tree_index_after_save(self):
+        tree_index = MagicMock()
+        service = DocumentIndexingService(
+            parser=self.mock_parser,
+            tree_repository=self.mock_tree_repo,
+            summary_generator=self.mock_summary_gen,
+            embedder_factory=self.mock_embedder_factory,
+            logger=self.mock_logger,
+            tree_index=tree_index,
+        )
+        self.mock_tree_repo.exists.return_value = False
+        self.mock_parser.parse.return_value = _make_nodes()
+        self.mock_summary_gen.generate_summary.return_value = "Sum"
+        self.mock_embedder_factory.create_model.return_value = MagicMock(
+            get_embedding=MagicMock(return_value=[0.1])
+        )
+
+        rag = RagConfig(active=True, doc_name="test.txt")
+        await service.index_document("test.txt", "content", rag)
+
+        tree_index.invalidate.assert_called_once_with("test.txt")
+
+
+class _InMemoryStore:
+    """IEmbeddingStore em memória para testes."""
+
+    def __init__(self):
+        self.data: dict = {}
+
+    async def get_many(self, keys):
+        return {k: self.data[k] for k in keys if k in self.data}
+
+    async def put_many(self, entries, *, kind):
+        self.data.update(entries)
+
+
+class TestIncrementalIndexing:
+    """Reindexação incremental via store endereçado por conteúdo."""
+
+    def setup_method(self):
+        self.mock_tree_repo = AsyncMock()
+        self.mock_tree_repo.get_checksum.return_value = None
+        self.mock_tree_repo.exists.return_value = False
+        self.mock_summary_gen = AsyncMock()
+        self.mock_summary_gen.model_key = "ollama:llama"
+        self.mock_summary_gen.generate_summary.side_effect = (
+            lambda content: f"resumo de {content}"
+        )
+        self.embedder = MagicMock()
+        self.embedder.get_embedding.side_effect = lambda text: [float(len(text))]
+        self.mock_embedder_factory = MagicMock()
+        self.mock_embedder_factory.create_model.return_value = self.embedder
+        self.store = _InMemoryStore()
+        self.mock_parser = MagicMock()
+        self.service = DocumentIndexingService(
+            parser=self.mock_parser,
+            tree_repository=self.mock_tree_repo,
+            summary_generator=self.mock_summary_gen,
+            embedder_factory=self.mock_embedder_factory,
+            logger=MagicMock(),
+            embedding_store=self.store,
+            reindex_if_changed=True,
+        )
+        self.rag = RagConfig(active=True, doc_name="test.txt", model="m")
+
+    async def test_unchanged_checksum_skips(self):
+        self.mock_tree_repo.get_checksum.return_value = hashlib.sha256(
+            b"content"
+        ).hexdigest()
+        result = await self.service.index_document("test.txt", "content", self.rag)
+        assert result == []
+        self.mock_parser.parse.assert_not_called()
+
+    async def test_changed_document_only_recomputes_changed_sections(self):
+        self.mock_parser.parse.return_value = _make_nodes()
+        await self.service.index_document("test.txt", "v1", self.rag)
+        assert self.mock_summary_gen.generate_summary.await_count == 1
+        assert self.embedder.get_embedding.call_count == 2
+        assert self.mock_tree_repo.save_nodes.await_args.kwargs["checksum"]
+
+        # Nova versão: só o filho muda
+        self.mock_tree_repo.get_checksum.return_value = "old"
+        nodes = _make_nodes()
+        nodes[1].content = "Child content editado"
+        self.mock_parser.parse.return_value = nodes
+        result = await self.service.index_document("test.txt", "v2", self.rag)
+
+        assert self.mock_summary_gen.generate_summary.await_count == 1
+        assert self.embedder.get_embedding.call_count == 3
+        assert result[0].summary == "resumo de Parent content"
+        assert result[0].embedding is not None
+        new = hashlib.sha256(b"v2").hexdigest()
+        assert self.mock_tree_repo.delete_document.await_args_list == [
+            call("test.txt", keep_checksum="old"),
+            call("test.txt", keep_checksum=new),
+        ]
+        assert result[0].id == f"test.txt::node::0@{new[:12]}"
+        assert result[0].children_ids == [result[1].id]
+        assert result[1].parent_id == result[0].id
+
+    async def test_reindex_saves_new_version_before_deleting_old(self):
+        self.mock_tree_repo.get_checksum.return_value = "old"
+        self.mock_parser.parse.return_value = _make_nodes()
+        calls = []
+        self.mock_tree_repo.save_nodes.side_effect = (
+            lambda *a, **kw: calls.append("save")
+        )
+        self.mock_tree_repo.delete_document.side_effect = (
+            lambda *a, keep_checksum: calls.append(("delete", keep_checksum))
+        )
+        await self.service.index_document("test.txt", "v2", self.rag)
+        new = hashlib.sha256(b"v2").hexdigest()
+        assert calls == [("delete", "old"), "save", ("delete", new)]
+
+    async def test_failed_save_keeps_current_version(self):
+        self.mock_tree_repo.get_checksum.return_value = "old"
+        self.mock_parser.parse.return_value = _make_nodes()
+        self.mock_tree_repo.save_nodes.side_effect = RuntimeError("mongo down")
+        with pytest.raises(RuntimeError):
+            await self.service.index_document("test.txt", "v2", self.rag)
+        # Só sobras de outras versões são removidas — a atual permanece
+        self.mock_tree_repo.delete_document.assert_awaited_once_with(
+            "test.txt", keep_checksum="old"
+        )
+
+    async def test_first_index_does_not_delete(self):
+        self.mock_parser.parse.return_value = _make_nodes()
+        await self.service.index_document("test.txt", "v1", self.rag)
+        self.mock_tree_repo.delete_document.assert_not_called()
+
+    async def test_fallback_summary_not_stored(self):
+        self.mock_summary_gen.generate_summary.side_effect = RuntimeError("down")
+        self.mock_parser.parse.return_value = _make_nodes()
+        await self.service.index_document("test.txt", "v1", self.rag)
+        assert "Parent content" not in self.store.data.values()
+
+    async def test_embedding_key_depends_on_model(self):
+        self.mock_parser.parse.return_value = _make_nodes()
+        await self.service.index_document("test.txt", "v1", self.rag)
+
+        self.mock_parser.parse.return_value = _make_nodes()
+        other = RagConfig(active=True, doc_name="test.txt", model="outro")
+        await self.service.index_document("test.txt", "v2", other)
+        assert self.embedder.get_embedding.call_count == 4
@@ -0,0 +1,163 @@
+"""Testes unitários para DocumentTreeIndex e travessia em memória."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.services.document_tree_index import (
+    DocumentTreeIndex,
+    DocumentTreeSnapshot,
+)
+from src.application.services.search_strategies.hierarchical_search_strategy import (
+    HierarchicalSearchStrategy,
+)
+from src.domain.entities.document_node import DocumentNode
+
+
+def _make_tree() -> list[DocumentNode]:
+    """Raiz A (filhos A1, A2) e raiz B (folha)."""
+    return [
+        DocumentNode(
+            id="a", doc_name="doc.txt", level=0, title="A", content="A",
+            embedding=[1.0, 0.0], children_ids=["a1", "a2"],
+        ),
+        DocumentNode(
+            id="a1", doc_name="doc.txt", level=1, title="A1", content="a1 content",
+            embedding=[1.0, 0.1], parent_id="a",
+        ),
+        DocumentNode(
+            id="a2", doc_name="doc.txt", level=1, title="A2", content="a2 content",
+            embedding=[0.0, 1.0], parent_id="a",
+        ),
+        DocumentNode(
+            id="b", doc_name="doc.txt", level=0, title="B", content="b content",
+            embedding=[0.0, 1.0],
+        ),
+    ]
+
+
+class TestDocumentTreeSnapshot:
+    def test_adjacency(self):
+        snapshot = DocumentTreeSnapshot("doc.txt", _make_tree())
+        assert snapshot.roots.tolist() == [0, 3]
+        assert snapshot.children[0].tolist() == [1, 2]
+        assert snapshot.children[3].tolist() == []
+        assert len(snapshot) == 4
+
+    def test_ignores_unknown_children(self):
+        nodes = _make_tree()
+        nodes[3].children_ids = ["missing"]
+        snapshot = DocumentTreeSnapshot("doc.txt", nodes)
+        assert snapshot.children[3].tolist() == []
+
+
+class TestDocumentTreeIndex:
+    def setup_method(self):
+        self.mock_repo = AsyncMock()
+        self.mock_repo.get_document_nodes.return_value = _make_tree()
+        self.index = DocumentTreeIndex(
+            tree_repository=self.mock_repo, logger=MagicMock()
+        )
+
+    @pytest.mark.asyncio
+    async def test_loads_once(self):
+        first = await self.index.get_snapshot("doc.txt")
+        second = await self.index.get_snapshot("doc.txt")
+        assert first is second
+        self.mock_repo.get_document_nodes.assert_awaited_once_with("doc.txt")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_deduplicated(self):
+        results = await asyncio.gather(
+            *(self.index.get_snapshot("doc.txt") for _ in range(5))
+        )
+        assert all(r is results[0] for r in results)
+        assert self.mock_repo.get_document_nodes.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_document_returns_none(self):
+        self.mock_repo.get_document_nodes.return_value = []
+        assert await self.index.get_snapshot("nope.txt") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads(self):
+        await self.index.get_snapshot("doc.txt")
+        self.index.invalidate("doc.txt")
+        await self.index.get_snapshot("doc.txt")
+        assert self.mock_repo.get_document_nodes.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load_is_not_cached(self):
+        async def slow_load(doc_name):
+            self.index.invalidate(doc_name)
+            return _make_tree()
+
+        self.mock_repo.get_document_nodes.side_effect = slow_load
+        assert await self.index.get_snapshot("doc.txt") is not None
+        assert self.index.get_stats()["documents"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        await self.index.get_snapshot("doc.txt")
+        assert self.index.get_stats() == {"documents": 1, "total_nodes": 4}
+        self.index.invalidate()
+        assert self.index.get_stats() == {"documents": 0, "total_nodes": 0}
+
+
+class TestSnapshotTraversal:
+    def setup_method(self):
+        self.mock_repo = AsyncMock()
+        self.mock_repo.get_document_nodes.return_value = _make_tree()
+        self.mock_embedder = MagicMock()
+        self.strategy = HierarchicalSearchStrategy(
+            tree_repository=self.mock_repo,
+            embedder=self.mock_embedder,
+            doc_name="doc.txt",
+            logger=MagicMock(),
+            beam_width=1,
+            tree_index=DocumentTreeIndex(
+                tree_repository=self.mock_repo, logger=MagicMock()
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_descends_without_repository_traversal(self):
+        self.mock_embedder.get_embedding.return_value = [1.0, 0.0]
+
+        results = await self.strategy.search("query")
+
+        assert [r.node_id for r in results] == ["a1"]
+        self.mock_repo.get_root_nodes.assert_not_called()
+        self.mock_repo.get_children.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_matches_repository_traversal(self):
+        self.mock_embedder.get_embedding.return_value = [0.2, 1.0]
+        nodes = {n.id: n for n in _make_tree()}
+        self.mock_repo.get_root_nodes.return_value = [nodes["a"], nodes["b"]]
+        self.mock_repo.get_children.return_value = [nodes["a1"], nodes["a2"]]
+        legacy = HierarchicalSearchStrategy(
+            tree_repository=self.mock_repo,
+            embedder=self.mock_embedder,
+            doc_name="doc.txt",
+            logger=MagicMock(),
+            beam_width=2,
+        )
+        self.strategy._beam_width = 2
+
+        expected = await legacy.search("query")
+        results = await self.strategy.search("query")
+
+        assert [r.node_id for r in results] == [r.node_id for r in expected]
+        assert [r.score for r in results] == pytest.approx(
+            [r.score for r in expected]
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_document(self):
+        self.mock_repo.get_document_nodes.return_value = []
+        self.mock_embedder.get_embedding.return_value = [1.0, 0.0]
+        assert await self.strategy.search("query") == []
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.application.services.embedder_model_factory_service import EmbedderModelFactory
+from src.infrastructure.cache.model_cache_service import ModelCacheService
 
 
 @pytest.fixture
@@ -42,3 +43,17 @@ class TestEmbedderModelFactory:
         assert EmbedderModelFactory.is_supported_model("ollama") is True
         assert EmbedderModelFactory.is_supported_model("OPENAI") is True
         assert EmbedderModelFactory.is_supported_model("nonexistent") is False
+
+
+class TestEmbedderModelFactoryCache:
+    def test_cached_embedder_reused(self, mock_logger):
+        cache = ModelCacheService(logger=mock_logger)
+        factory = EmbedderModelFactory(logger=mock_logger, cache=cache)
+        with patch.object(factory, "_get_model_class") as mock_cls:
+            mock_cls.return_value = MagicMock(side_effect=lambda **kw: MagicMock())
+            first = factory.create_model("ollama", "nomic-embed-text")
+            second = factory.create_model("ollama", "nomic-embed-text")
+
+        assert first is second
+        mock_cls.assert_called_once_with("ollama")
+        assert cache.get_stats()["entries"][0]["key"] == "embedder:ollama:nomic-embed-text"
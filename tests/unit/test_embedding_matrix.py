@@ -0,0 +1,66 @@
+"""Testes do motor de scoring vetorizado (EmbeddingMatrix)."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+from src.application.services.search_strategies.embedding_matrix import (
+    EmbeddingMatrix,
+    QueryVector,
+    select_top_k,
+)
+from src.application.services.search_strategies.hierarchical_search_strategy import (
+    HierarchicalSearchStrategy,
+)
+
+
+class TestEmbeddingMatrix:
+    def test_matches_scalar_cosine(self):
+        rng = random.Random(42)
+        embeddings = [[rng.uniform(-1, 1) for _ in range(16)] for _ in range(20)]
+        query = [rng.uniform(-1, 1) for _ in range(16)]
+
+        scores = EmbeddingMatrix(embeddings).scores(QueryVector(query))
+
+        for row, emb in enumerate(embeddings):
+            expected = HierarchicalSearchStrategy._cosine_similarity(query, emb)
+            assert abs(float(scores[row]) - expected) < 1e-5
+
+    def test_missing_embedding_scores_zero(self):
+        matrix = EmbeddingMatrix([[1.0, 0.0], None, [0.0, 1.0]])
+        scores = matrix.scores(QueryVector([1.0, 0.0]))
+        assert scores.tolist() == [1.0, 0.0, 0.0]
+
+    def test_dimension_mismatch_scores_zero(self):
+        matrix = EmbeddingMatrix([[1.0, 0.0], [1.0, 0.0, 0.0]])
+        assert matrix.scores(QueryVector([1.0, 0.0])).tolist() == [1.0, 0.0]
+        assert matrix.scores(QueryVector([1.0])).tolist() == [0.0, 0.0]
+
+    def test_zero_query_scores_zero(self):
+        matrix = EmbeddingMatrix([[1.0, 0.0]])
+        assert matrix.scores(QueryVector([0.0, 0.0])).tolist() == [0.0]
+
+    def test_no_embeddings(self):
+        matrix = EmbeddingMatrix([None, None])
+        assert matrix.dim == 0
+        assert matrix.scores(QueryVector([1.0])).tolist() == [0.0, 0.0]
+
+
+class TestSelectTopK:
+    def test_returns_descending_order(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.7], dtype=np.float32)
+        assert select_top_k(scores, 2).tolist() == [1, 3]
+
+    def test_k_larger_than_n(self):
+        scores = np.array([0.1, 0.9], dtype=np.float32)
+        assert select_top_k(scores, 5).tolist() == [1, 0]
+
+    def test_ties_keep_original_order(self):
+        scores = np.array([0.5, 0.5, 0.5], dtype=np.float32)
+        assert select_top_k(scores, 3).tolist() == [0, 1, 2]
+
+    def test_empty(self):
+        assert select_top_k(np.array([], dtype=np.float32), 2).tolist() == []
+        assert select_top_k(np.array([0.3], dtype=np.float32), 0).tolist() == []
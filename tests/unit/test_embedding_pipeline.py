@@ -0,0 +1,101 @@
+"""Testes unitários para BatchEmbeddingPipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.services.embedding_pipeline import BatchEmbeddingPipeline
+
+
+@pytest.fixture
+def pipeline(mock_logger):
+    p = BatchEmbeddingPipeline(logger=mock_logger, batch_size=2, max_workers=2)
+    yield p
+    p.shutdown()
+
+
+class _SyncEmbedder:
+    """Embedder sem API de lote (como o OllamaEmbedder)."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls = 0
+
+    def get_embedding(self, text: str) -> list:
+        self.calls += 1
+        time.sleep(self.delay)
+        if text == "boom":
+            raise RuntimeError("fail")
+        return [float(len(text))]
+
+
+class TestBatchEmbeddingPipeline:
+    async def test_thread_pool_path_preserves_order(self, pipeline):
+        embedder = _SyncEmbedder()
+        result = await pipeline.embed(["a", "bb", "ccc"], embedder)
+        assert result == [[1.0], [2.0], [3.0]]
+        assert embedder.calls == 3
+
+    async def test_failure_becomes_none(self, pipeline, mock_logger):
+        result = await pipeline.embed(["a", "boom"], _SyncEmbedder())
+        assert result == [[1.0], None]
+        mock_logger.warning.assert_called()
+
+    async def test_uses_batch_api_when_available(self, pipeline):
+        embedder = MagicMock()
+        embedder.async_get_embeddings_batch_and_usage = AsyncMock(
+            side_effect=lambda texts: ([[1.0]] * len(texts), [None] * len(texts))
+        )
+        result = await pipeline.embed(["a", "b", "c"], embedder)
+
+        assert result == [[1.0], [1.0], [1.0]]
+        assert embedder.async_get_embeddings_batch_and_usage.await_count == 2
+        embedder.get_embedding.assert_not_called()
+
+    async def test_batch_api_short_or_empty_response(self, pipeline):
+        embedder = MagicMock()
+        embedder.async_get_embeddings_batch_and_usage = AsyncMock(
+            return_value=([[1.0]], [None])
+        )
+        assert await pipeline.embed(["a", "b"], embedder) == [[1.0], None]
+
+    async def test_batch_api_failure_falls_back(self, pipeline):
+        embedder = MagicMock()
+        embedder.async_get_embeddings_batch_and_usage = AsyncMock(
+            side_effect=RuntimeError("down")
+        )
+        embedder.get_embedding.return_value = [0.5]
+        assert await pipeline.embed(["a"], embedder) == [[0.5]]
+
+    async def test_reports_latency_per_batch(self, pipeline, mock_logger):
+        await pipeline.embed(["a", "b", "c"], _SyncEmbedder())
+        batch_logs = [
+            c for c in mock_logger.info.call_args_list
+            if c.args[0] == "Lote de embeddings concluído"
+        ]
+        assert len(batch_logs) == 2
+        assert "elapsed_ms" in batch_logs[0].kwargs
+
+    async def test_does_not_block_event_loop(self, pipeline):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        await pipeline.embed(["a"] * 4, _SyncEmbedder(delay=0.05))
+        task.cancel()
+        assert ticks >= 5
+
+    def test_invalid_config(self, mock_logger):
+        with pytest.raises(ValueError):
+            BatchEmbeddingPipeline(logger=mock_logger, batch_size=0)
+        with pytest.raises(ValueError):
+            BatchEmbeddingPipeline(logger=mock_logger, max_workers=0)
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
 
+from src.application.services.agent_factory_service import AgentFactoryService
 from src.application.use_cases.get_active_agents_use_case import GetActiveAgentsUseCase
 from src.domain.entities.agent_config import AgentConfig
 
 
-def _make_config(agent_id: str = "a1") -> AgentConfig:
+def _make_config(agent_id: str = "a1", tools_ids=None) -> AgentConfig:
     return AgentConfig(
         id=agent_id,
         nome="Agente",
@@ -16,6 +17,7 @@ def _make_config(agent_id: str = "a1") -> AgentConfig:
         model="llama3.2:latest",
         descricao="desc",
         prompt="prompt",
+        tools_ids=tools_ids or [],
     )
 
 
@@ -24,7 +26,7 @@ class TestGetActiveAgentsUseCase:
         configs = [_make_config("a1"), _make_config("a2")]
         mock_agent_config_repository.get_active_agents.return_value = configs
 
-        mock_factory = AsyncMock()
+        mock_factory = AsyncMock(spec=AgentFactoryService)
         mock_agent = MagicMock()
         mock_factory.create_agent = AsyncMock(return_value=mock_agent)
 
@@ -36,7 +38,7 @@ class TestGetActiveAgentsUseCase:
 
     async def test_execute_returns_empty_when_no_configs(self, mock_agent_config_repository):
         mock_agent_config_repository.get_active_agents.return_value = []
-        mock_factory = AsyncMock()
+        mock_factory = AsyncMock(spec=AgentFactoryService)
 
         use_case = GetActiveAgentsUseCase(mock_factory, mock_agent_config_repository)
         agents = await use_case.execute()
@@ -48,7 +50,7 @@ class TestGetActiveAgentsUseCase:
         configs = [_make_config("ok"), _make_config("fail")]
         mock_agent_config_repository.get_active_agents.return_value = configs
 
-        mock_factory = AsyncMock()
+        mock_factory = AsyncMock(spec=AgentFactoryService)
         mock_agent = MagicMock()
         mock_factory.create_agent = AsyncMock(
             side_effect=[mock_agent, RuntimeError("boom")]
@@ -58,3 +60,101 @@ class TestGetActiveAgentsUseCase:
         agents = await use_case.execute()
 
         assert len(agents) == 1
+
+    async def test_execute_logs_build_summary(self, mock_agent_config_repository, mock_logger):
+        mock_agent_config_repository.get_active_agents.return_value = [_make_config("a1")]
+        mock_factory = MagicMock(spec=AgentFactoryService)
+        mock_factory.create_agent = AsyncMock(return_value=MagicMock())
+        mock_factory.preload_tools = AsyncMock(return_value=0)
+        mock_factory.get_build_stats.return_value = {
+            "agents_built": 1,
+            "stages_ms": {"model": 1.0},
+            "resource_pool": {"resources": 2, "hits": 0, "misses": 2},
+        }
+
+        use_case = GetActiveAgentsUseCase(
+            mock_factory, mock_agent_config_repository, mock_logger
+        )
+        await use_case.execute()
+
+        kwargs = mock_logger.info.call_args.kwargs
+        assert mock_logger.info.call_args.args == ("Agentes ativos criados",)
+        assert kwargs["total"] == 1
+        assert kwargs["created"] == 1
+        assert kwargs["stages_ms"] == {"model": 1.0}
+
+
+    async def test_execute_preloads_tools_once(self, mock_agent_config_repository):
+        configs = [_make_config("a1", tools_ids=["t1"]), _make_config("a2", tools_ids=["t2"])]
+        mock_agent_config_repository.get_active_agents.return_value = configs
+        factory = AsyncMock(spec=AgentFactoryService)
+        factory.create_agent = AsyncMock(return_value=MagicMock())
+
+        await GetActiveAgentsUseCase(factory, mock_agent_config_repository).execute()
+
+        factory.preload_tools.assert_awaited_once_with(configs)
+        factory.reset_shared_resources.assert_called_once_with()
+
+
+class TestRebuild:
+    async def _loaded_use_case(self, repo, factory):
+        repo.get_active_agents.return_value = [
+            _make_config("a1", tools_ids=["t1"]),
+            _make_config("a2"),
+            _make_config("a3", tools_ids=["t2"]),
+        ]
+        use_case = GetActiveAgentsUseCase(factory, repo)
+        await use_case.execute()
+        factory.create_agent.reset_mock()
+        return use_case
+
+    async def test_rebuilds_changed_agents_and_tool_users(
+        self, mock_agent_config_repository
+    ):
+        factory = AsyncMock(spec=AgentFactoryService)
+        factory.create_agent = AsyncMock(side_effect=lambda cfg: f"agent:{cfg.id}")
+        use_case = await self._loaded_use_case(mock_agent_config_repository, factory)
+        mock_agent_config_repository.get_active_agents_by_ids = AsyncMock(
+            return_value=[_make_config("a1", tools_ids=["t1"]), _make_config("a2")]
+        )
+
+        built, removed = await use_case.rebuild({"a2"}, {"t1"})
+
+        mock_agent_config_repository.get_active_agents_by_ids.assert_awaited_once_with(
+            ["a1", "a2"]
+        )
+        assert built == {"a1": "agent:a1", "a2": "agent:a2"}
+        assert removed == set()
+
+    async def test_missing_configs_are_removed(self, mock_agent_config_repository):
+        factory = AsyncMock(spec=AgentFactoryService)
+        factory.create_agent = AsyncMock(return_value=MagicMock())
+        use_case = await self._loaded_use_case(mock_agent_config_repository, factory)
+        mock_agent_config_repository.get_active_agents_by_ids = AsyncMock(return_value=[])
+
+        built, removed = await use_case.rebuild({"a3"})
+
+        assert built == {}
+        assert removed == {"a3"}
+        # a3 não é mais considerado quando sua tool muda
+        assert await use_case.rebuild(set(), {"t2"}) == ({}, set())
+
+    async def test_failed_build_is_neither_built_nor_removed(
+        self, mock_agent_config_repository
+    ):
+        factory = AsyncMock(spec=AgentFactoryService)
+        factory.create_agent = AsyncMock(return_value=MagicMock())
+        use_case = await self._loaded_use_case(mock_agent_config_repository, factory)
+        mock_agent_config_repository.get_active_agents_by_ids = AsyncMock(
+            return_value=[_make_config("a2")]
+        )
+        factory.create_agent = AsyncMock(side_effect=RuntimeError("boom"))
+
+        assert await use_case.rebuild({"a2"}) == ({}, set())
+
+    async def test_nothing_affected_skips_repository(self, mock_agent_config_repository):
+        use_case = GetActiveAgentsUseCase(AsyncMock(), mock_agent_config_repository)
+        mock_agent_config_repository.get_active_agents_by_ids = AsyncMock()
+
+        assert await use_case.rebuild(set(), {"t9"}) == ({}, set())
+        mock_agent_config_repository.get_active_agents_by_ids.assert_not_awaited()
@@ -10,13 +10,13 @@ from src.application.use_cases.get_active_teams_use_case import GetActiveTeamsUs
 from src.domain.entities.team_config import TeamConfig
 
 
-def _make_team_config(team_id: str = "team-1") -> TeamConfig:
+def _make_team_config(team_id: str = "team-1", member_ids=None) -> TeamConfig:
     return TeamConfig(
         id=team_id,
         nome=f"Team {team_id}",
         factory_ia_model="ollama",
         model="llama3.2:latest",
-        member_ids=["agent-a"],
+        member_ids=member_ids or ["agent-a"],
         mode="route",
     )
 
@@ -85,3 +85,37 @@ class TestGetActiveTeamsUseCase:
         result = await use_case.execute([MagicMock()])
 
         assert result == []
+
+
+class TestRebuild:
+    async def test_rebuilds_teams_with_changed_members(
+        self, use_case, mock_team_config_repository, team_factory_service
+    ):
+        mock_team_config_repository.get_active_teams = AsyncMock(
+            return_value=[
+                _make_team_config("t1", ["agent-a"]),
+                _make_team_config("t2", ["agent-b"]),
+            ]
+        )
+        await use_case.execute([MagicMock()])
+        mock_team_config_repository.get_active_teams_by_ids = AsyncMock(
+            return_value=[_make_team_config("t2", ["agent-b"])]
+        )
+        team_factory_service.create_team = MagicMock(return_value="team:t2")
+        agents = [MagicMock()]
+
+        built, removed = await use_case.rebuild({"t3"}, {"agent-b"}, agents)
+
+        mock_team_config_repository.get_active_teams_by_ids.assert_awaited_once_with(
+            ["t2", "t3"]
+        )
+        team_factory_service.create_team.assert_called_once()
+        assert team_factory_service.create_team.call_args.args[1] is agents
+        assert built == {"t2": "team:t2"}
+        assert removed == {"t3"}
+
+    async def test_nothing_affected(self, use_case, mock_team_config_repository):
+        mock_team_config_repository.get_active_teams_by_ids = AsyncMock()
+
+        assert await use_case.rebuild(set(), {"agent-z"}, []) == ({}, set())
+        mock_team_config_repository.get_active_teams_by_ids.assert_not_awaited()
@@ -0,0 +1,104 @@
+"""Testes para HttpClientPool."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.domain.entities.tool_http_config import ToolHttpConfig
+from src.infrastructure.http.client_pool import HttpClientPool
+
+
+@pytest.fixture
+def pool(mock_logger):
+    return HttpClientPool(mock_logger, default_timeout=30.0)
+
+
+class TestHttpClientPool:
+    async def test_same_host_reuses_client(self, pool):
+        config = ToolHttpConfig()
+        a = pool.get_client("http://api.local/users/1", config)
+        b = pool.get_client("http://api.local:80/orders?x=1", config)
+        assert a is b
+        await pool.aclose()
+
+    async def test_distinct_hosts_and_limits_get_distinct_clients(self, pool):
+        default = ToolHttpConfig()
+        a = pool.get_client("http://api.local/x", default)
+        b = pool.get_client("http://other.local/x", default)
+        c = pool.get_client("http://api.local/x", ToolHttpConfig(max_connections=2))
+        assert len({id(a), id(b), id(c)}) == 3
+        assert pool.get_stats()["clients"] == 3
+        await pool.aclose()
+
+    async def test_cookies_are_not_shared_between_calls(self, pool):
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "session=userA"})
+
+        client = pool.get_client("http://api.local/x", ToolHttpConfig())
+        client._transport = httpx.MockTransport(handler)
+        await client.get("http://api.local/login")
+        await client.get("http://api.local/x")
+
+        assert sent == [None, None]
+        assert not client.cookies
+        await pool.aclose()
+
+    async def test_aclose_closes_clients(self, pool):
+        client = pool.get_client("https://api.local/x", ToolHttpConfig())
+        await pool.aclose()
+        assert client.is_closed
+        assert pool.get_stats()["clients"] == 0
+
+    async def test_closed_client_is_recreated(self, pool):
+        config = ToolHttpConfig()
+        first = pool.get_client("http://api.local/x", config)
+        await first.aclose()
+        second = pool.get_client("http://api.local/x", config)
+        assert second is not first
+        await pool.aclose()
+
+    async def test_aclose_logs_errors(self, pool, mock_logger):
+        with patch("httpx.AsyncClient") as client_cls:
+            client = MagicMock(is_closed=False)
+            client.aclose = AsyncMock(side_effect=RuntimeError("boom"))
+            client_cls.return_value = client
+            pool.get_client("http://api.local/x", ToolHttpConfig())
+        await pool.aclose()
+        mock_logger.warning.assert_called_once_with(
+            "Erro ao fechar cliente HTTP", error="boom"
+        )
+
+    def test_timeout_for(self, pool):
+        assert pool.timeout_for(ToolHttpConfig()) == 30.0
+        assert pool.timeout_for(ToolHttpConfig(timeout_s=5.0)) == 5.0
+        timeout = pool.timeout_for(ToolHttpConfig(timeout_s=5.0, connect_timeout_s=1.0))
+        assert isinstance(timeout, httpx.Timeout)
+        assert timeout.connect == 1.0
+        assert timeout.read == 5.0
+
+
+class TestToolHttpConfig:
+    def test_defaults(self):
+        config = ToolHttpConfig()
+        assert config.timeout_s is None
+        assert config.http2 is True
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"timeout_s": 0},
+            {"connect_timeout_s": -1},
+            {"max_connections": 0},
+            {"max_keepalive_connections": -1},
+            {"keepalive_expiry_s": -1},
+        ],
+    )
+    def test_invalid_values(self, kwargs):
+        with pytest.raises(ValueError):
+            ToolHttpConfig(**kwargs)
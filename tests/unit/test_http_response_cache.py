@@ -0,0 +1,219 @@
+"""Testes para HttpResponseCache e o cache de respostas das tools HTTP."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.domain.entities.tool import HttpMethod, Tool
+from src.domain.entities.tool_http_config import ToolHttpConfig
+from src.infrastructure.cache.http_response_cache import HttpResponseCache
+from src.infrastructure.http.client_pool import HttpClientPool
+from src.infrastructure.http.http_tool_factory import HttpToolFactory
+
+
+@pytest.fixture
+def cache():
+    return HttpResponseCache(ttl_seconds=60, max_bytes=1024)
+
+
+class TestHttpResponseCache:
+    def test_key_ignores_param_order(self):
+        a = HttpResponseCache.key("http://x/a", {"b": 1, "a": 2})
+        b = HttpResponseCache.key("http://x/a", {"a": 2, "b": 1})
+        assert a == b
+        assert HttpResponseCache.key("http://x/a", None) == "http://x/a"
+
+    def test_store_and_hit(self, cache):
+        cache.store("k", "body", {})
+        entry = cache.lookup("k")
+        assert entry is not None and entry.is_fresh()
+        assert entry.body == "body"
+        assert cache.get_stats()["total_hits"] == 1
+
+    def test_miss(self, cache):
+        assert cache.lookup("k") is None
+        assert cache.get_stats()["total_misses"] == 1
+
+    def test_no_store_is_not_cached(self, cache):
+        cache.store("k", "body", {"cache-control": "no-store"})
+        assert cache.lookup("k") is None
+
+    def test_max_age_caps_lifetime(self, cache):
+        with patch("time.monotonic", return_value=1000.0):
+            cache.store("k", "body", {"cache-control": "public, max-age=5"})
+        with patch("time.monotonic", return_value=1006.0):
+            # Vencida e sem validadores → descartada
+            assert cache.lookup("k") is None
+
+    def test_expired_entry_with_etag_is_kept_for_revalidation(self, cache):
+        with patch("time.monotonic", return_value=1000.0):
+            cache.store("k", "body", {"etag": '"v1"', "cache-control": "max-age=1"})
+        with patch("time.monotonic", return_value=1010.0):
+            entry = cache.lookup("k")
+        assert entry is not None and not entry.is_fresh()
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+
+    def test_no_cache_requires_revalidation(self, cache):
+        cache.store("k", "body", {"cache-control": "no-cache", "last-modified": "x"})
+        entry = cache.lookup("k")
+        assert entry is not None and not entry.is_fresh()
+
+    def test_revalidated_refreshes_entry(self, cache):
+        cache.store("k", "body", {"cache-control": "no-cache", "etag": '"v1"'})
+        assert cache.revalidated("k", {"etag": '"v2"'}) == "body"
+        entry = cache.lookup("k")
+        assert entry.is_fresh()
+        assert entry.etag == '"v2"'
+        assert cache.get_stats()["revalidations"] == 1
+
+    def test_byte_limit_evicts_lru(self):
+        cache = HttpResponseCache(ttl_seconds=60, max_bytes=10)
+        cache.store("a", "12345", {})
+        cache.store("b", "12345", {})
+        cache.lookup("a")
+        cache.store("c", "12345", {})
+        assert cache.lookup("b") is None
+        assert cache.lookup("a") is not None
+        assert cache.get_stats()["bytes"] == 10
+
+    def test_oversized_body_not_stored(self):
+        cache = HttpResponseCache(ttl_seconds=60, max_bytes=4)
+        cache.store("k", "12345", {})
+        assert cache.get_stats()["cache_size"] == 0
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            HttpResponseCache(ttl_seconds=0, max_bytes=10)
+        with pytest.raises(ValueError):
+            HttpResponseCache(ttl_seconds=1, max_bytes=0)
+
+
+# ── integração com http_function ────────────────────────────────────
+
+
+def _make_tool(**overrides) -> Tool:
+    defaults = dict(
+        id="lookup",
+        name="Lookup",
+        description="Lookup tool",
+        route="http://api.local/items",
+        http_method=HttpMethod.GET,
+        parameters=[],
+        http_config=ToolHttpConfig(cache_ttl_s=60),
+    )
+    defaults.update(overrides)
+    return Tool(**defaults)
+
+
+async def _entrypoint(mock_logger, tool, handler):
+    pool = HttpClientPool(mock_logger)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    pool.get_client = lambda url, config: client
+    factory = HttpToolFactory(logger=mock_logger, client_pool=pool)
+    toolkit = (await factory.create_tools_from_configs([tool]))[0]
+    return toolkit.async_functions[tool.id].entrypoint
+
+
+class TestHttpFunctionCache:
+    async def test_repeated_get_served_from_cache(self, mock_logger):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": request.url.params["id"]})
+
+        fn = await _entrypoint(mock_logger, _make_tool(), handler)
+        first = await fn(id="1")
+        second = await fn(id="1")
+        other = await fn(id="2")
+
+        assert first == second
+        assert "2" in other
+        assert len(requests) == 2
+
+    async def test_etag_revalidation_uses_304(self, mock_logger):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(
+                200,
+                json={"value": 1},
+                headers={"etag": '"v1"', "cache-control": "no-cache"},
+            )
+
+        fn = await _entrypoint(mock_logger, _make_tool(), handler)
+        first = await fn()
+        second = await fn()
+
+        assert first == second
+        assert len(requests) == 2
+        assert requests[1].headers["if-none-match"] == '"v1"'
+
+    async def test_304_after_eviction_refetches_without_validators(
+        self, mock_logger
+    ):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(
+                200,
+                json={"value": len(requests)},
+                headers={"etag": '"v1"', "cache-control": "no-cache"},
+            )
+
+        fn = await _entrypoint(mock_logger, _make_tool(), handler)
+        await fn()
+        # Entrada descartada entre o lookup e a chegada do 304
+        with patch.object(HttpResponseCache, "revalidated", return_value=None):
+            second = await fn()
+
+        assert second == '{"value":3}'
+        assert len(requests) == 3
+        assert "if-none-match" not in requests[2].headers
+
+    async def test_cache_disabled_by_default(self, mock_logger):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        fn = await _entrypoint(
+            mock_logger, _make_tool(http_config=ToolHttpConfig()), handler
+        )
+        await fn()
+        await fn()
+        assert len(requests) == 2
+
+    async def test_post_is_never_cached(self, mock_logger):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        fn = await _entrypoint(
+            mock_logger, _make_tool(http_method=HttpMethod.POST), handler
+        )
+        await fn(a=1)
+        await fn(a=1)
+        assert len(requests) == 2
+
+    async def test_errors_are_not_cached(self, mock_logger):
+        responses = iter([httpx.Response(500, text="boom"), httpx.Response(200, json={"ok": 1})])
+
+        def handler(request):
+            return next(responses)
+
+        fn = await _entrypoint(mock_logger, _make_tool(), handler)
+        assert "Erro HTTP 500" in await fn()
+        assert "ok" in await fn()
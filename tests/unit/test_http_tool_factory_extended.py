@@ -1,4 +1,4 @@
-"""Testes estendidos para HttpToolFactory — cobertura de _build_description, _resolve_url, _serialize e http_function."""
+"""Testes estendidos para HttpToolFactory — cobertura de _build_description, _serialize e http_function."""
 
 from __future__ import annotations
 
@@ -8,9 +8,11 @@ import httpx
 import pytest
 
 from src.domain.entities.tool import HttpMethod, ToolParameter, Tool
+from src.domain.entities.tool_http_config import ToolHttpConfig
+from src.infrastructure.http.client_pool import HttpClientPool
+from src.infrastructure.http.json_projection import JsonProjection
 from src.infrastructure.http.http_tool_factory import (
     HttpToolFactory,
-    _resolve_url,
     _serialize,
 )
 
@@ -33,56 +35,24 @@ def _make_tool(**overrides) -> Tool:
     return Tool(**defaults)
 
 
-# ── _resolve_url ────────────────────────────────────────────────────
-
-
-class TestResolveUrl:
-    def test_no_placeholders(self):
-        url, remaining = _resolve_url("http://example.com/api", {"q": "hello"})
-        assert url == "http://example.com/api"
-        assert remaining == {"q": "hello"}
-
-    def test_with_placeholder(self):
-        url, remaining = _resolve_url(
-            "http://example.com/api/{user_id}",
-            {"param": '{"user_id": "123"}'},
-        )
-        assert url == "http://example.com/api/123"
-        assert "param" not in remaining
-
-    def test_non_dict_value(self):
-        url, remaining = _resolve_url(
-            "http://example.com/api",
-            {"key": "simple_value"},
-        )
-        assert url == "http://example.com/api"
-        assert remaining == {"key": "simple_value"}
-
-    def test_invalid_literal(self):
-        url, remaining = _resolve_url(
-            "http://example.com/api",
-            {"key": "not a dict {bad}"},
-        )
-        assert url == "http://example.com/api"
-
-
 # ── _serialize ──────────────────────────────────────────────────────
 
 
 class TestSerialize:
     def test_json_response(self):
-        resp = MagicMock(spec=httpx.Response)
-        resp.json.return_value = {"status": "ok"}
-        result = _serialize(resp)
-        assert "ok" in result
+        result = _serialize('{"status": "ok", "nome": "José"}'.encode())
+        assert result == '{"status":"ok","nome":"José"}'
 
     def test_text_fallback(self):
-        resp = MagicMock(spec=httpx.Response)
-        resp.json.side_effect = ValueError("not json")
-        resp.text = "plain text"
-        result = _serialize(resp)
+        result = _serialize(b"plain text")
         assert result == "plain text"
 
+    def test_projection(self):
+        projection = JsonProjection(["items[*].id"])
+        raw = b'{"items": [{"id": 1, "x": 0}, {"id": 2}]}'
+        result = _serialize(raw, projection=projection)
+        assert result == "[1,2]"
+
 
 # ── _build_description ──────────────────────────────────────────────
 
@@ -128,14 +98,12 @@ class TestHttpFunction:
         tool = _make_tool(http_method=HttpMethod.GET)
         fn = await self._get_entrypoint(factory, tool)
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": "ok"}
-        mock_response.raise_for_status = MagicMock()
+        mock_response = httpx.Response(200, json={"result": "ok"})
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.request = AsyncMock(return_value=mock_response)
+            mock_client.build_request = MagicMock()
+            mock_client.send = AsyncMock(return_value=mock_response)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=False)
             mock_client_cls.return_value = mock_client
@@ -147,14 +115,12 @@ class TestHttpFunction:
         tool = _make_tool(http_method=HttpMethod.POST)
         fn = await self._get_entrypoint(factory, tool)
 
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"created": True}
-        mock_response.raise_for_status = MagicMock()
+        mock_response = httpx.Response(201, json={"created": True})
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.request = AsyncMock(return_value=mock_response)
+            mock_client.build_request = MagicMock()
+            mock_client.send = AsyncMock(return_value=mock_response)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=False)
             mock_client_cls.return_value = mock_client
@@ -166,14 +132,12 @@ class TestHttpFunction:
         tool = _make_tool(http_method=HttpMethod.GET)
         fn = await self._get_entrypoint(factory, tool)
 
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        error = httpx.HTTPStatusError("404", request=MagicMock(), response=mock_response)
+        mock_response = httpx.Response(404, text="Not Found")
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.request = AsyncMock(side_effect=error)
+            mock_client.build_request = MagicMock()
+            mock_client.send = AsyncMock(return_value=mock_response)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=False)
             mock_client_cls.return_value = mock_client
@@ -189,7 +153,8 @@ class TestHttpFunction:
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.request = AsyncMock(side_effect=error)
+            mock_client.build_request = MagicMock()
+            mock_client.send = AsyncMock(side_effect=error)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=False)
             mock_client_cls.return_value = mock_client
@@ -203,7 +168,8 @@ class TestHttpFunction:
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.request = AsyncMock(side_effect=RuntimeError("unexpected"))
+            mock_client.build_request = MagicMock()
+            mock_client.send = AsyncMock(side_effect=RuntimeError("unexpected"))
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=False)
             mock_client_cls.return_value = mock_client
@@ -215,17 +181,101 @@ class TestHttpFunction:
         tool = _make_tool(http_method=HttpMethod.DELETE)
         fn = await self._get_entrypoint(factory, tool)
 
-        mock_response = MagicMock()
-        mock_response.status_code = 204
-        mock_response.json.return_value = {"deleted": True}
-        mock_response.raise_for_status = MagicMock()
+        mock_response = httpx.Response(204, json={"deleted": True})
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.request = AsyncMock(return_value=mock_response)
+            mock_client.build_request = MagicMock()
+            mock_client.send = AsyncMock(return_value=mock_response)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=False)
             mock_client_cls.return_value = mock_client
 
             result = await fn(id="123")
             assert "deleted" in result
+
+
+class TestPooledClient:
+    async def test_calls_reuse_pooled_client(self, mock_logger):
+        pool = HttpClientPool(mock_logger)
+        factory = HttpToolFactory(logger=mock_logger, client_pool=pool)
+        tool = _make_tool(http_config=ToolHttpConfig(timeout_s=5.0))
+        toolkits = await factory.create_tools_from_configs([tool])
+        fn = toolkits[0].async_functions["test-tool"].entrypoint
+
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = MagicMock(is_closed=False)
+            mock_client.send = AsyncMock(
+                side_effect=lambda *a, **kw: httpx.Response(200, json={"ok": True})
+            )
+            mock_client_cls.return_value = mock_client
+
+            await fn(q="a")
+            await fn(q="b")
+
+        mock_client_cls.assert_called_once()
+        assert mock_client.send.await_count == 2
+        assert mock_client.build_request.call_args.kwargs["timeout"] == 5.0
+
+
+class TestResponseHandling:
+    async def _entrypoint(self, mock_logger, tool, handler):
+        pool = HttpClientPool(mock_logger)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        pool.get_client = lambda url, config: client
+        factory = HttpToolFactory(logger=mock_logger, client_pool=pool)
+        toolkits = await factory.create_tools_from_configs([tool])
+        return toolkits[0].async_functions["test-tool"].entrypoint
+
+    async def test_large_response_is_truncated(self, mock_logger):
+        tool = _make_tool(http_config=ToolHttpConfig(max_response_bytes=10))
+        fn = await self._entrypoint(
+            mock_logger, tool, lambda request: httpx.Response(200, text="x" * 100)
+        )
+        result = await fn()
+        assert result.startswith("x" * 10 + "\n")
+        assert "truncada em 10 bytes" in result
+
+    async def test_error_body_is_capped(self, mock_logger):
+        tool = _make_tool(http_config=ToolHttpConfig(max_response_bytes=5))
+        fn = await self._entrypoint(
+            mock_logger, tool, lambda request: httpx.Response(500, text="boom" * 10)
+        )
+        assert await fn() == "Erro HTTP 500: boomb"
+
+    async def test_response_fields_projection(self, mock_logger):
+        tool = _make_tool(
+            http_config=ToolHttpConfig(response_fields=["items[*].id", "total"])
+        )
+        body = {"items": [{"id": 1, "blob": "..."}, {"id": 2}], "total": 2, "x": 0}
+        fn = await self._entrypoint(
+            mock_logger, tool, lambda request: httpx.Response(200, json=body)
+        )
+        assert await fn() == '{"items[*].id":[1,2],"total":2}'
+
+    async def test_invalid_response_fields_keep_tool_without_projection(
+        self, mock_logger
+    ):
+        tool = _make_tool(http_config=ToolHttpConfig(response_fields=["items["]))
+        fn = await self._entrypoint(
+            mock_logger, tool, lambda request: httpx.Response(200, json={"total": 2})
+        )
+        assert await fn() == '{"total":2}'
+        mock_logger.warning.assert_any_call(
+            "response_fields inválido — resposta sem projeção",
+            tool_id=tool.id,
+            error="Caminho de projeção inválido: 'items['",
+        )
+
+    async def test_invalid_parameters_skip_request(self, mock_logger):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        tool = _make_tool(route="http://example.com/api/{user_id}")
+        fn = await self._entrypoint(mock_logger, tool, handler)
+        result = await fn(q="x")
+        assert result.startswith("Erro nos parâmetros")
+        assert calls == []
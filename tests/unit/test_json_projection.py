@@ -0,0 +1,50 @@
+"""Testes para JsonProjection."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.infrastructure.http.json_projection import JsonProjection
+
+_DOC = {
+    "data": {
+        "items": [
+            {"id": 1, "name": "a", "tags": ["x"]},
+            {"id": 2, "name": "b"},
+        ],
+        "meta": {"total count": 2},
+    }
+}
+
+
+class TestJsonProjection:
+    def test_single_path_returns_value(self):
+        assert JsonProjection(["$.data.items[0].name"]).apply(_DOC) == "a"
+
+    def test_dollar_prefix_is_optional(self):
+        assert JsonProjection(["data.items[-1].id"]).apply(_DOC) == 2
+
+    def test_wildcard_over_list(self):
+        assert JsonProjection(["$.data.items[*].id"]).apply(_DOC) == [1, 2]
+
+    def test_wildcard_skips_missing(self):
+        assert JsonProjection(["data.items[*].tags"]).apply(_DOC) == [["x"]]
+
+    def test_quoted_key(self):
+        projection = JsonProjection(["data.meta['total count']"])
+        assert projection.apply(_DOC) == 2
+
+    def test_multiple_paths_keyed_by_path(self):
+        projection = JsonProjection(["data.items[*].name", "data.missing"])
+        assert projection.apply(_DOC) == {"data.items[*].name": ["a", "b"]}
+
+    def test_missing_single_path_is_none(self):
+        assert JsonProjection(["data.items[5]"]).apply(_DOC) is None
+
+    def test_invalid_path(self):
+        with pytest.raises(ValueError):
+            JsonProjection(["data[abc"])
+
+    def test_empty_paths(self):
+        with pytest.raises(ValueError):
+            JsonProjection([])
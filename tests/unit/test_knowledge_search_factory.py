@@ -79,3 +79,23 @@ class TestKnowledgeSearchFactory:
 
         strategy = self.factory.create_strategy(config, knowledge=mock_knowledge)
         assert isinstance(strategy, SemanticSearchStrategy)
+
+    def test_hierarchical_strategies_share_embedding_cache(self):
+        cache = MagicMock()
+        factory = KnowledgeSearchFactory(
+            tree_repository=self.mock_tree_repo,
+            logger=self.mock_logger,
+            embedding_cache=cache,
+        )
+        strategies = [
+            factory.create_strategy(
+                RagConfig(
+                    active=True,
+                    doc_name=name,
+                    search_strategy=SearchStrategy.HIERARCHICAL,
+                ),
+                embedder=MagicMock(),
+            )
+            for name in ("a.txt", "b.txt")
+        ]
+        assert all(s._embedding_cache is cache for s in strategies)
@@ -0,0 +1,219 @@
+"""Testes para LazyAgent e materialize_members."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.services.lazy_agent import LazyAgent, materialize_members
+from src.application.use_cases.get_active_agents_use_case import GetActiveAgentsUseCase
+from src.domain.entities.agent_config import AgentConfig
+from src.infrastructure.repositories.mongo_agent_usage_repository import (
+    MongoAgentUsageRepository,
+)
+
+
+def _make_config(agent_id: str = "a1") -> AgentConfig:
+    return AgentConfig(
+        id=agent_id,
+        nome=f"Agente {agent_id}",
+        factory_ia_model="ollama",
+        model="llama3.2:latest",
+        descricao="desc",
+        prompt="prompt",
+    )
+
+
+def _stub(agent_id: str = "a1", build=None) -> LazyAgent:
+    build = build or AsyncMock(side_effect=lambda cfg: MagicMock(id=cfg.id))
+    return LazyAgent(_make_config(agent_id), db=MagicMock(), build=build)
+
+
+class TestLazyAgent:
+    def test_stub_exposes_listing_metadata(self):
+        stub = _stub()
+        assert (stub.id, stub.name, stub.description) == ("a1", "Agente a1", "desc")
+        assert stub.is_async()
+        assert not stub.is_materialized
+
+    async def test_concurrent_materialize_builds_once(self):
+        release = asyncio.Event()
+
+        async def build(cfg):
+            await release.wait()
+            return MagicMock(id=cfg.id)
+
+        build_mock = AsyncMock(side_effect=build)
+        stub = _stub(build=build_mock)
+        pending = [asyncio.create_task(stub.materialize()) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        agents = await asyncio.gather(*pending)
+
+        build_mock.assert_awaited_once()
+        assert all(agent is agents[0] for agent in agents)
+        assert stub.is_materialized
+
+    async def test_each_run_gets_a_copy(self):
+        stub = _stub()
+        agent = await stub.materialize()
+
+        produced = await stub.factory(MagicMock())
+
+        assert produced is agent.deep_copy.return_value
+        assert produced.team_id is None
+        assert stub.run_count == 1
+
+    async def test_failed_build_is_retried(self):
+        build = AsyncMock(side_effect=[RuntimeError("ollama down"), MagicMock()])
+        stub = _stub(build=build)
+        with pytest.raises(RuntimeError):
+            await stub.materialize()
+        assert not stub.is_materialized
+        await stub.materialize()
+        assert build.await_count == 2
+
+
+class TestMaterializeMembers:
+    async def test_only_team_members_are_materialized(self):
+        member, other = _stub("a1"), _stub("a2")
+        plain = MagicMock(id="a3")
+
+        agents = await materialize_members([member, other, plain], {"a1", "a3"})
+
+        assert agents[0] is member._agent
+        assert agents[1] is other and not other.is_materialized
+        assert agents[2] is plain
+
+    async def test_failed_members_are_dropped(self):
+        broken = _stub("a1", build=AsyncMock(side_effect=RuntimeError("boom")))
+        assert await materialize_members([broken], {"a1"}) == []
+
+
+class TestLazyUseCase:
+    @pytest.fixture
+    def factory(self):
+        factory = MagicMock()
+        factory.preload_tools = AsyncMock(return_value=0)
+        factory.create_agent = AsyncMock(side_effect=lambda cfg: MagicMock(id=cfg.id))
+        factory.create_lazy_agent.side_effect = lambda cfg: LazyAgent(
+            cfg, db=MagicMock(), build=factory.create_agent
+        )
+        factory.get_build_stats.return_value = {}
+        return factory
+
+    async def test_execute_returns_stubs_without_building(
+        self, factory, mock_agent_config_repository, mock_logger
+    ):
+        mock_agent_config_repository.get_active_agents.return_value = [
+            _make_config("a1"), _make_config("a2")
+        ]
+        use_case = GetActiveAgentsUseCase(
+            factory, mock_agent_config_repository, mock_logger, lazy=True
+        )
+
+        agents = await use_case.execute()
+
+        assert [a.id for a in agents] == ["a1", "a2"]
+        assert all(isinstance(a, LazyAgent) for a in agents)
+        factory.create_agent.assert_not_awaited()
+
+    async def test_prewarms_most_used_agents(
+        self, factory, mock_agent_config_repository, mock_logger
+    ):
+        mock_agent_config_repository.get_active_agents.return_value = [
+            _make_config(i) for i in ("a1", "a2", "a3")
+        ]
+        usage = MagicMock()
+        usage.get_most_used_agent_ids = AsyncMock(return_value=["a3", "gone"])
+        use_case = GetActiveAgentsUseCase(
+            factory,
+            mock_agent_config_repository,
+            mock_logger,
+            lazy=True,
+            prewarm_top_n=2,
+            usage_repository=usage,
+        )
+
+        agents = await use_case.execute()
+        await use_case._prewarm_task
+
+        assert [a.is_materialized for a in agents] == [True, False, True]
+        usage.get_most_used_agent_ids.assert_awaited_once_with(2)
+
+    async def test_refresh_reuses_stubs_with_unchanged_config(
+        self, factory, mock_agent_config_repository, mock_logger
+    ):
+        mock_agent_config_repository.get_active_agents.return_value = [
+            _make_config("a1"), _make_config("a2")
+        ]
+        use_case = GetActiveAgentsUseCase(
+            factory, mock_agent_config_repository, mock_logger, lazy=True
+        )
+        first = await use_case.execute()
+        await first[0].materialize()
+
+        edited = _make_config("a2")
+        edited.prompt = "novo prompt"
+        mock_agent_config_repository.get_active_agents.return_value = [
+            _make_config("a1"), edited
+        ]
+        second = await use_case.execute()
+
+        assert second[0] is first[0]
+        assert second[0].is_materialized
+        assert second[1] is not first[1]
+        assert second[1].config.prompt == "novo prompt"
+        assert factory.create_agent.await_count == 1
+
+    async def test_rebuild_returns_fresh_stubs(
+        self, factory, mock_agent_config_repository
+    ):
+        mock_agent_config_repository.get_active_agents.return_value = [_make_config("a1")]
+        mock_agent_config_repository.get_active_agents_by_ids = AsyncMock(
+            return_value=[_make_config("a1")]
+        )
+        use_case = GetActiveAgentsUseCase(
+            factory, mock_agent_config_repository, lazy=True
+        )
+        await use_case.execute()
+
+        built, removed = await use_case.rebuild({"a1"})
+
+        assert isinstance(built["a1"], LazyAgent)
+        assert removed == set()
+
+
+class _AsyncCursorMock:
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._docs:
+            raise StopAsyncIteration
+        return self._docs.pop(0)
+
+
+class TestMongoAgentUsageRepository:
+    async def test_ranks_agents_by_session_count(self, mock_logger):
+        repo = MongoAgentUsageRepository.__new__(MongoAgentUsageRepository)
+        repo._logger = mock_logger
+        repo._collection = MagicMock()
+        repo._collection.aggregate.return_value = _AsyncCursorMock(
+            [{"_id": "a2", "sessions": 9}, {"_id": "a1", "sessions": 3}]
+        )
+
+        assert await repo.get_most_used_agent_ids(2) == ["a2", "a1"]
+        pipeline = repo._collection.aggregate.call_args.args[0]
+        assert pipeline[-1] == {"$limit": 2}
+
+    async def test_non_positive_limit_skips_query(self, mock_logger):
+        repo = MongoAgentUsageRepository.__new__(MongoAgentUsageRepository)
+        repo._collection = MagicMock()
+        assert await repo.get_most_used_agent_ids(0) == []
+        repo._collection.aggregate.assert_not_called()
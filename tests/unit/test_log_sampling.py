@@ -0,0 +1,124 @@
+"""Testes para LogSampler e a amostragem no StructlogLoggerAdapter."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure.logging.logger_adapter import StructlogLoggerAdapter
+from src.infrastructure.logging.sampling import LogSampler, parse_ratios
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestParseRatios:
+    def test_parses_events_with_spaces(self):
+        assert parse_ratios("HTTP OK=0.1, Agente criado=0.5,") == {
+            "HTTP OK": 0.1,
+            "Agente criado": 0.5,
+        }
+
+    def test_empty_spec(self):
+        assert parse_ratios("") == {}
+
+    @pytest.mark.parametrize("spec", ["HTTP OK", "=0.5", "HTTP OK=1.5", "HTTP OK=x"])
+    def test_invalid_specs(self, spec):
+        with pytest.raises(ValueError):
+            parse_ratios(spec)
+
+
+class TestLogSampler:
+    def test_ratio_keeps_first_and_every_nth(self):
+        sampler = LogSampler(ratios={"HTTP OK": 0.25})
+        kept = [i for i in range(12) if sampler.allow("info", "HTTP OK")]
+        assert kept == [0, 4, 8]
+        assert all(sampler.allow("info", "outro") for _ in range(5))
+
+    def test_zero_ratio_drops_everything(self):
+        sampler = LogSampler(ratios={"ruído": 0.0})
+        assert not any(sampler.allow("debug", "ruído") for _ in range(10))
+
+    def test_token_bucket_refills(self):
+        clock = _Clock()
+        sampler = LogSampler(rate_per_s=2, burst=3, clock=clock)
+        assert [sampler.allow("info", "e") for _ in range(4)] == [True, True, True, False]
+        clock.now = 0.5
+        assert sampler.allow("info", "e") is True
+        assert sampler.allow("info", "e") is False
+        assert sampler.allow("info", "outro") is True
+
+    def test_warnings_and_errors_always_pass(self):
+        sampler = LogSampler(ratios={"falha": 0.0}, rate_per_s=1, burst=1)
+        assert all(sampler.allow(level, "falha") for level in ("warning", "error") for _ in range(5))
+
+    def test_summaries_every_interval(self):
+        clock = _Clock()
+        sampler = LogSampler(ratios={"a": 0.0, "b": 0.0}, summary_interval_s=10, clock=clock)
+        for _ in range(3):
+            sampler.allow("info", "a")
+        sampler.allow("info", "b")
+
+        assert sampler.pop_summaries() == []
+        clock.now = 10
+        assert sampler.pop_summaries() == [("a", 3), ("b", 1)]
+        assert sampler.pop_summaries() == []
+
+    def test_disabled_without_ratios_or_rate(self):
+        assert LogSampler().enabled is False
+        assert LogSampler(rate_per_s=1).enabled is True
+
+
+@pytest.fixture
+def sampled_adapter():
+    with patch("src.infrastructure.logging.logger_adapter.LoggerFactory") as factory:
+        factory.get_logger.return_value = MagicMock()
+        yield StructlogLoggerAdapter("test"), factory.get_logger.return_value
+    StructlogLoggerAdapter.configure_sampling(None)
+
+
+class TestAdapterSampling:
+    def test_info_sampled_and_summary_emitted(self, sampled_adapter):
+        adapter, log = sampled_adapter
+        clock = _Clock()
+        StructlogLoggerAdapter.configure_sampling(
+            LogSampler(ratios={"HTTP OK": 0.5}, summary_interval_s=60, clock=clock)
+        )
+
+        for _ in range(4):
+            adapter.info("HTTP OK", status=200)
+        assert log.info.call_count == 2
+
+        clock.now = 60
+        adapter.info("Agente criado")
+        log.info.assert_any_call(
+            "Logs suprimidos por amostragem/limite de taxa",
+            suppressed_event="HTTP OK",
+            suppressed_count=2,
+        )
+
+    def test_warning_and_error_bypass(self, sampled_adapter):
+        adapter, log = sampled_adapter
+        StructlogLoggerAdapter.configure_sampling(LogSampler(ratios={"x": 0.0}))
+
+        adapter.debug("x")
+        adapter.warning("x")
+        adapter.error("x")
+
+        log.debug.assert_not_called()
+        log.warning.assert_called_once_with("x")
+        log.error.assert_called_once_with("x")
+
+    def test_disabled_sampler_not_installed(self, sampled_adapter):
+        adapter, log = sampled_adapter
+        StructlogLoggerAdapter.configure_sampling(LogSampler())
+
+        assert StructlogLoggerAdapter._sampler is None
+        adapter.info("HTTP OK")
+        log.info.assert_called_once_with("HTTP OK")
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -69,3 +74,113 @@ class TestModelCacheService:
             entry.ttl = timedelta(seconds=-1)
         removed = await cache_service.cleanup_expired()
         assert removed == 1
+
+
+class TestSingleFlightAndLru:
+    async def test_concurrent_async_misses_share_one_creation(self, cache_service):
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return object()
+
+        results = await asyncio.gather(
+            *(cache_service.get_or_create("k", factory) for _ in range(5))
+        )
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+
+    async def test_distinct_keys_are_created_in_parallel(self, cache_service):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await release.wait()
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        slow_task = asyncio.create_task(cache_service.get_or_create("slow", slow))
+        await started.wait()
+        # Sem lock global, outra chave não espera a criação em andamento
+        assert await asyncio.wait_for(cache_service.get_or_create("fast", fast), 1) == "fast"
+        release.set()
+        assert await slow_task == "slow"
+
+    def test_sync_concurrent_threads_create_once(self, cache_service):
+        calls = 0
+
+        def factory():
+            nonlocal calls
+            calls += 1
+            time.sleep(0.02)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(lambda _: cache_service.get_or_create_sync("k", factory), range(4))
+            )
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+
+    def test_sync_failure_is_not_cached(self, cache_service, mock_logger):
+        with pytest.raises(RuntimeError):
+            cache_service.get_or_create_sync("k", MagicMock(side_effect=RuntimeError("x")))
+        assert cache_service.get_or_create_sync("k", lambda: "ok") == "ok"
+
+    def test_lru_eviction(self, mock_logger):
+        cache = ModelCacheService(logger=mock_logger, max_size=2)
+        cache.get_or_create_sync("a", lambda: "A")
+        cache.get_or_create_sync("b", lambda: "B")
+        cache.get_or_create_sync("a", lambda: "A2")  # "a" passa a ser a mais recente
+        cache.get_or_create_sync("c", lambda: "C")
+
+        assert list(cache._cache) == ["a", "c"]
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["max_size"] == 2
+
+    def test_eviction_during_build_keeps_key_lock(self, mock_logger):
+        cache = ModelCacheService(logger=mock_logger, max_size=1)
+        building, release = threading.Event(), threading.Event()
+        calls = 0
+
+        def factory():
+            nonlocal calls
+            calls += 1
+            building.set()
+            release.wait(1)
+            return "model"
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(cache.get_or_create_sync, "k", factory)
+            assert building.wait(1)
+            # "k" entra e sai do cache enquanto a criação está em andamento
+            cache._store("k", "stale")
+            cache._store("other", "x")
+            second = pool.submit(cache.get_or_create_sync, "k", factory)
+            time.sleep(0.05)
+            release.set()
+            assert first.result() == second.result() == "model"
+
+        assert calls == 1
+        assert cache._key_locks == {}
+
+    def test_invalid_max_size(self, mock_logger):
+        with pytest.raises(ValueError):
+            ModelCacheService(logger=mock_logger, max_size=0)
+
+    async def test_background_cleanup_removes_expired(self, cache_service):
+        cache_service.get_or_create_sync("k", lambda: "m")
+        cache_service._cache["k"].ttl = timedelta(seconds=-1)
+
+        cache_service.start_cleanup_task(interval_seconds=0.01)
+        await asyncio.sleep(0.05)
+        await cache_service.stop_cleanup_task()
+
+        assert "k" not in cache_service._cache
+        assert cache_service._cleanup_task is None
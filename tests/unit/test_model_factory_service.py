@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from src.application.services.model_factory_service import ModelFactory
+from src.infrastructure.cache.model_cache_service import ModelCacheService
 
 
 @pytest.fixture
@@ -56,3 +57,34 @@ class TestModelFactory:
     def test_alias_google_to_gemini(self, factory):
         result = factory.validate_model_config("google", "gemini-pro")
         assert result["factory_type"] == "gemini"
+
+
+class TestModelFactoryCache:
+    def test_cached_instance_reused(self, mock_logger):
+        cache = ModelCacheService(logger=mock_logger)
+        factory = ModelFactory(logger=mock_logger, cache=cache)
+
+        first = factory.create_model("ollama", "llama3.2:latest")
+        second = factory.create_model("Ollama", "llama3.2:latest")
+
+        assert first is second
+        assert cache.get_stats()["total_misses"] == 1
+
+    def test_kwargs_hashed_into_key(self, mock_logger):
+        cache = ModelCacheService(logger=mock_logger)
+        factory = ModelFactory(logger=mock_logger, cache=cache)
+
+        a = factory.create_model("ollama", "llama3.2:latest", api_key="secret")
+        b = factory.create_model("ollama", "llama3.2:latest")
+
+        assert a is not b
+        keys = [e["key"] for e in cache.get_stats()["entries"]]
+        assert "model:ollama:llama3.2:latest" in keys
+        assert not any("secret" in k for k in keys)
+
+    def test_invalid_input_not_cached(self, mock_logger):
+        cache = ModelCacheService(logger=mock_logger)
+        factory = ModelFactory(logger=mock_logger, cache=cache)
+        with pytest.raises(ValueError):
+            factory.create_model("ollama", "")
+        assert cache.get_stats()["cache_size"] == 0
@@ -71,6 +71,25 @@ class TestMongoAgentConfigRepository:
         assert len(configs) == 1
         assert configs[0].id == "a1"
 
+    async def test_get_active_agents_by_ids(self, repo):
+        repository, mock_collection = repo
+        mock_collection.find.return_value = _AsyncCursorMock(
+            [{"id": "a1", "nome": "Agent 1", "model": "llama3.2:latest", "active": True}]
+        )
+
+        configs = await repository.get_active_agents_by_ids(["a1", "a2"])
+
+        assert [c.id for c in configs] == ["a1"]
+        mock_collection.find.assert_called_once()
+        query, projection = mock_collection.find.call_args.args
+        assert query == {"id": {"$in": ["a1", "a2"]}, "active": True}
+        assert projection["_id"] == 0 and projection["tools_ids"] == 1
+
+    async def test_get_active_agents_by_ids_empty_skips_query(self, repo):
+        repository, mock_collection = repo
+        assert await repository.get_active_agents_by_ids([]) == []
+        mock_collection.find.assert_not_called()
+
     async def test_get_active_agents_empty(self, repo):
         repository, mock_collection = repo
         mock_collection.find.return_value = _AsyncCursorMock([])
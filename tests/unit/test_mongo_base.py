@@ -59,6 +59,40 @@ class TestMongoClientFactory:
         assert call_kwargs[1].get("tls") is True
         assert call_kwargs[1].get("tlsAllowInvalidCertificates") is True
 
+    @patch("src.infrastructure.repositories.mongo_base.AsyncIOMotorClient")
+    def test_configure_sets_pool_options(self, mock_motor_cls):
+        options = MongoClientFactory._pool_options
+        try:
+            MongoClientFactory.configure(
+                max_pool_size=20, min_pool_size=2, max_idle_time_ms=1000, timeout_ms=500
+            )
+            MongoClientFactory.get_client("mongodb://localhost:27017")
+        finally:
+            MongoClientFactory._pool_options = options
+        kwargs = mock_motor_cls.call_args.kwargs
+        assert kwargs["maxPoolSize"] == 20
+        assert kwargs["minPoolSize"] == 2
+        assert kwargs["serverSelectionTimeoutMS"] == 500
+        assert MongoClientFactory._monitor in kwargs["event_listeners"]
+
+    @patch("src.infrastructure.repositories.mongo_base.AsyncIOMotorClient")
+    def test_sync_client_is_motor_delegate(self, mock_motor_cls):
+        client = MongoClientFactory.get_client("mongodb://localhost:27017")
+        assert MongoClientFactory.get_sync_client("mongodb://localhost:27017") is client.delegate
+        assert mock_motor_cls.call_count == 1
+
+    @patch("src.infrastructure.repositories.mongo_base.AsyncIOMotorClient")
+    async def test_close_all(self, mock_motor_cls):
+        client = MongoClientFactory.get_client("mongodb://localhost:27017")
+        await MongoClientFactory.close_all()
+        client.close.assert_called_once()
+        assert MongoClientFactory._instances == {}
+
+    def test_pool_stats(self):
+        stats = MongoClientFactory.get_pool_stats()
+        assert stats["clients"] == 0
+        assert "connections_in_use" in stats
+
 
 class TestAsyncMongoRepository:
     @patch("src.infrastructure.repositories.mongo_base.MongoClientFactory.get_client")
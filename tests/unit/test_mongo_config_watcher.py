@@ -0,0 +1,212 @@
+"""Testes para MongoConfigWatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.domain.ports.config_watcher_port import ConfigChanges
+from src.infrastructure.repositories.mongo_config_watcher import MongoConfigWatcher
+
+
+class _AsyncCursorStub:
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._docs:
+            raise StopAsyncIteration
+        return self._docs.pop(0)
+
+
+class _FakeDb:
+    """Coleções em memória; ``find`` devolve um cursor novo a cada chamada."""
+
+    def __init__(self, docs_by_collection):
+        self.docs = docs_by_collection
+        self.watch = MagicMock(side_effect=RuntimeError("not a replica set"))
+
+    def __getitem__(self, name):
+        collection = MagicMock()
+        collection.find.side_effect = lambda *a, **kw: _AsyncCursorStub(
+            self.docs.get(name, [])
+        )
+        return collection
+
+
+@pytest.fixture
+def db():
+    return _FakeDb(
+        {
+            "agents_config": [
+                {"_id": 1, "id": "a1", "updated_at": 1},
+                {"_id": 2, "id": "a2", "updated_at": 1},
+            ],
+            "teams_config": [{"_id": 3, "id": "t1", "updated_at": 1}],
+            "tools": [{"_id": 4, "id": "tool1"}],
+        }
+    )
+
+
+@pytest.fixture
+def watcher(db, mock_logger):
+    with patch(
+        "src.infrastructure.repositories.mongo_config_watcher.MongoClientFactory.get_client"
+    ) as get_client:
+        get_client.return_value.__getitem__.return_value = db
+        yield MongoConfigWatcher(
+            connection_string="mongodb://test:27017",
+            database_name="agno",
+            logger=mock_logger,
+            poll_interval_s=0.01,
+            debounce_s=0.01,
+        )
+
+
+class TestPolling:
+    async def test_detects_updates_inserts_and_deletes(self, watcher, db):
+        await watcher._snapshot()
+        db.docs["agents_config"] = [
+            {"_id": 1, "id": "a1", "updated_at": 2},
+            {"_id": 5, "id": "a5", "updated_at": 1},
+        ]
+        db.docs["tools"] = []
+
+        changes = await watcher._poll_once()
+
+        assert changes == ConfigChanges(agent_ids={"a1", "a2", "a5"}, tool_ids={"tool1"})
+
+    async def test_unchanged_documents_are_ignored(self, watcher):
+        await watcher._snapshot()
+        assert (await watcher._poll_once()).is_empty()
+
+    async def test_first_poll_without_snapshot_is_baseline(self, watcher):
+        assert (await watcher._poll_once()).is_empty()
+
+    async def test_falls_back_to_polling_when_change_streams_fail(self, watcher, db):
+        received = []
+        done = asyncio.Event()
+
+        async def on_change(changes):
+            received.append(changes)
+            done.set()
+
+        await watcher.start(on_change)
+        await asyncio.sleep(0.02)
+        assert watcher.mode == "polling"
+        db.docs["teams_config"] = [{"_id": 3, "id": "t1", "updated_at": 2}]
+        await asyncio.wait_for(done.wait(), timeout=1)
+        await watcher.stop()
+
+        assert received == [ConfigChanges(team_ids={"t1"})]
+        assert watcher.mode == "stopped"
+
+
+class TestChangeStream:
+    def test_update_event_uses_full_document(self, watcher):
+        changes = watcher._changes_from_event(
+            {
+                "operationType": "update",
+                "ns": {"coll": "tools"},
+                "documentKey": {"_id": 9},
+                "fullDocument": {"_id": 9, "id": "tool9"},
+            }
+        )
+        assert changes.tool_ids == {"tool9"}
+
+    async def test_delete_event_resolved_from_snapshot(self, watcher):
+        await watcher._snapshot()
+        changes = watcher._changes_from_event(
+            {"operationType": "delete", "ns": {"coll": "agents_config"}, "documentKey": {"_id": 2}}
+        )
+        assert changes.agent_ids == {"a2"}
+
+    def test_unknown_collection_ignored(self, watcher):
+        changes = watcher._changes_from_event(
+            {"operationType": "insert", "ns": {"coll": "other"}, "fullDocument": {"id": "x"}}
+        )
+        assert changes.is_empty()
+
+    async def test_events_are_debounced_into_one_batch(self, watcher, db):
+        events = [
+            {"operationType": "update", "ns": {"coll": "agents_config"},
+             "documentKey": {"_id": 1}, "fullDocument": {"id": "a1"}},
+            {"operationType": "update", "ns": {"coll": "tools"},
+             "documentKey": {"_id": 4}, "fullDocument": {"id": "tool1"}},
+        ]
+
+        class _Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if events:
+                    return events.pop(0)
+                await asyncio.sleep(3600)
+
+        db.watch = MagicMock(return_value=_Stream())
+        on_change = AsyncMock()
+
+        await watcher.start(on_change)
+        await asyncio.sleep(0.05)
+        await watcher.stop()
+
+        assert watcher.mode == "stopped"
+        on_change.assert_awaited_once_with(
+            ConfigChanges(agent_ids={"a1"}, tool_ids={"tool1"})
+        )
+
+    async def test_events_during_emit_are_flushed_afterwards(self, watcher, db):
+        events = asyncio.Queue()
+        events.put_nowait("a1")
+
+        class _Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                agent_id = await events.get()
+                return {"operationType": "update", "ns": {"coll": "agents_config"},
+                        "documentKey": {"_id": agent_id}, "fullDocument": {"id": agent_id}}
+
+        received = []
+        handler_running = asyncio.Event()
+        release_handler = asyncio.Event()
+
+        async def on_change(changes):
+            received.append(changes)
+            if len(received) == 1:
+                handler_running.set()
+                await release_handler.wait()
+
+        db.watch = MagicMock(return_value=_Stream())
+        await watcher.start(on_change)
+        await asyncio.wait_for(handler_running.wait(), timeout=1)
+        # a2 chega enquanto o handler de a1 ainda está rodando
+        events.put_nowait("a2")
+        await asyncio.sleep(0.02)
+        release_handler.set()
+        await asyncio.sleep(0.05)
+        await watcher.stop()
+
+        assert received == [
+            ConfigChanges(agent_ids={"a1"}),
+            ConfigChanges(agent_ids={"a2"}),
+        ]
@@ -0,0 +1,79 @@
+"""Testes para MongoEmbeddingStore (motor async)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.repositories.mongo_embedding_store import MongoEmbeddingStore
+
+
+class _AsyncCursorMock:
+    """Cursor mock que suporta ``async for``."""
+
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.fixture
+def store(mock_logger):
+    with patch(
+        "src.infrastructure.repositories.mongo_base.MongoClientFactory.get_client"
+    ) as mock_factory:
+        mock_collection = MagicMock()
+        mock_db = MagicMock()
+        mock_db.__getitem__ = MagicMock(return_value=mock_collection)
+        mock_client = MagicMock()
+        mock_client.__getitem__ = MagicMock(return_value=mock_db)
+        mock_factory.return_value = mock_client
+
+        yield MongoEmbeddingStore(
+            connection_string="mongodb://localhost:27017", logger=mock_logger
+        )
+
+
+class TestMongoEmbeddingStore:
+    async def test_get_many(self, store):
+        store._collection.find.return_value = _AsyncCursorMock(
+            [{"_id": "k1", "value": [1.0]}]
+        )
+        assert await store.get_many(["k1", "k2"]) == {"k1": [1.0]}
+        query = store._collection.find.call_args.args[0]
+        assert query == {"_id": {"$in": ["k1", "k2"]}}
+
+    async def test_get_many_empty_keys(self, store):
+        assert await store.get_many([]) == {}
+        store._collection.find.assert_not_called()
+
+    async def test_get_many_error_returns_empty(self, store, mock_logger):
+        store._collection.find.side_effect = Exception("down")
+        assert await store.get_many(["k1"]) == {}
+        mock_logger.warning.assert_called()
+
+    async def test_put_many_upserts(self, store):
+        store._collection.bulk_write = AsyncMock()
+        await store.put_many({"k1": [1.0], "k2": [2.0]}, kind="embedding")
+        ops = store._collection.bulk_write.call_args.args[0]
+        assert len(ops) == 2
+        assert ops[0]._filter == {"_id": "k1"}
+        assert ops[0]._upsert is True
+
+    async def test_put_many_empty(self, store):
+        store._collection.bulk_write = AsyncMock()
+        await store.put_many({}, kind="summary")
+        store._collection.bulk_write.assert_not_called()
+
+    async def test_put_many_error_is_logged(self, store, mock_logger):
+        store._collection.bulk_write = AsyncMock(side_effect=Exception("down"))
+        await store.put_many({"k": "v"}, kind="summary")
+        mock_logger.warning.assert_called()
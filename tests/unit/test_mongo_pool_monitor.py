@@ -0,0 +1,55 @@
+"""Testes para MongoPoolMonitor."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from pymongo import monitoring
+
+from src.infrastructure.repositories.mongo_pool_monitor import MongoPoolMonitor
+
+_ADDRESS = ("db.local", 27017)
+
+
+def test_tracks_open_and_in_use_connections():
+    monitor = MongoPoolMonitor()
+    with patch(
+        "src.infrastructure.repositories.mongo_pool_monitor.TelemetryMetrics"
+    ) as metrics:
+        for conn_id in (1, 2):
+            monitor.connection_created(monitoring.ConnectionCreatedEvent(_ADDRESS, conn_id))
+            monitor.connection_checked_out(
+                monitoring.ConnectionCheckedOutEvent(_ADDRESS, conn_id, 0.01)
+            )
+        monitor.connection_checked_in(monitoring.ConnectionCheckedInEvent(_ADDRESS, 1))
+        monitor.connection_closed(
+            monitoring.ConnectionClosedEvent(_ADDRESS, 1, monitoring.ConnectionClosedReason.IDLE)
+        )
+
+    stats = monitor.get_stats()
+    assert stats["connections_open"] == 1
+    assert stats["connections_in_use"] == 1
+    assert stats["max_in_use"] == 2
+    assert stats["checkouts"] == 2
+    assert stats["avg_checkout_wait_ms"] == 10.0
+    assert stats["servers"] == ["db.local:27017"]
+    metrics.record_mongo_pool_connections.assert_any_call(
+        "db.local:27017", open_delta=1, in_use_delta=0
+    )
+    metrics.record_mongo_checkout.assert_called_with("db.local:27017", 0.01)
+
+
+def test_checkout_failure_counted():
+    monitor = MongoPoolMonitor()
+    with patch(
+        "src.infrastructure.repositories.mongo_pool_monitor.TelemetryMetrics"
+    ) as metrics:
+        monitor.connection_check_out_failed(
+            monitoring.ConnectionCheckOutFailedEvent(
+                _ADDRESS, monitoring.ConnectionCheckOutFailedReason.TIMEOUT, 0.5
+            )
+        )
+    assert monitor.get_stats()["checkout_failures"] == 1
+    metrics.record_mongo_checkout.assert_called_once_with(
+        "db.local:27017", 0.5, failed=True
+    )
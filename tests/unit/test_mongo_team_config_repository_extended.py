@@ -90,6 +90,33 @@ class TestGetActiveTeams:
         mock_logger.error.assert_called_once()
 
 
+class TestGetActiveTeamsByIds:
+    async def test_queries_only_requested_active_teams(self, team_repo):
+        team_repo._collection.find.return_value = _AsyncCursorStub(
+            [
+                {
+                    "id": "team-1",
+                    "nome": "Router",
+                    "model": "qwen3",
+                    "member_ids": ["a1"],
+                    "active": True,
+                }
+            ]
+        )
+
+        result = await team_repo.get_active_teams_by_ids(["team-1", "team-9"])
+
+        assert [t.id for t in result] == ["team-1"]
+        team_repo._collection.find.assert_called_once()
+        query, projection = team_repo._collection.find.call_args.args
+        assert query == {"id": {"$in": ["team-1", "team-9"]}, "active": True}
+        assert projection["member_ids"] == projection["memberIds"] == 1
+
+    async def test_empty_ids_skip_query(self, team_repo):
+        assert await team_repo.get_active_teams_by_ids([]) == []
+        team_repo._collection.find.assert_not_called()
+
+
 class TestGetTeamById:
     async def test_returns_team_config(self, team_repo):
         doc = {
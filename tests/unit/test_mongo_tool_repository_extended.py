@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.domain.entities.tool import HttpMethod, ParameterType
+from src.domain.entities.tool_http_config import ToolHttpConfig
 from src.infrastructure.repositories.mongo_tool_repository import MongoToolRepository
 
 
@@ -76,6 +77,23 @@ class TestGetToolsByIds:
         assert tools[0].id == "t1"
         assert tools[1].id == "t2"
 
+    async def test_invalid_http_config_does_not_drop_other_tools(
+        self, repo, mock_logger
+    ):
+        repository, mock_collection = repo
+        docs = [
+            _make_tool_doc(id="bad", http_config={"timeout_s": -1}),
+            _make_tool_doc(id="t2", http_config={"timeout_s": 5}),
+        ]
+        mock_collection.find.return_value = _AsyncCursorMock(docs)
+
+        tools = await repository.get_tools_by_ids(["bad", "t2"])
+
+        assert [t.id for t in tools] == ["bad", "t2"]
+        assert tools[0].http_config == ToolHttpConfig()
+        assert tools[1].http_config.timeout_s == 5
+        mock_logger.warning.assert_called_once()
+
     async def test_empty_ids_returns_empty(self, repo):
         repository, _ = repo
         tools = await repository.get_tools_by_ids([])
@@ -87,6 +105,14 @@ class TestGetToolsByIds:
         tools = await repository.get_tools_by_ids(["missing"])
         assert tools == []
 
+    async def test_projects_only_mapped_fields(self, repo):
+        repository, mock_collection = repo
+        mock_collection.find.return_value = _AsyncCursorMock([])
+        await repository.get_tools_by_ids(["t1"])
+        _, projection = mock_collection.find.call_args.args
+        assert projection["_id"] == 0
+        assert projection["http_config"] == projection["parameters"] == 1
+
 
 class TestGetToolById:
     async def test_found(self, repo):
@@ -137,3 +163,25 @@ class TestMapToEntity:
         doc = _make_tool_doc(http_method="POST")
         tool = MongoToolRepository._map_to_entity(doc)
         assert tool.http_method == HttpMethod.POST
+
+    def test_http_config_default(self):
+        tool = MongoToolRepository._map_to_entity(_make_tool_doc())
+        assert tool.http_config.max_connections == 20
+
+    def test_http_config_mapping_ignores_unknown_keys(self):
+        doc = _make_tool_doc(
+            http_config={"timeout_s": 5, "max_connections": 4, "unknown": True}
+        )
+        tool = MongoToolRepository._map_to_entity(doc)
+        assert tool.http_config.timeout_s == 5
+        assert tool.http_config.max_connections == 4
+
+    def test_invalid_http_config_falls_back_to_default(self):
+        logger = MagicMock()
+        doc = _make_tool_doc(id="bad", http_config={"max_connections": 0})
+
+        tool = MongoToolRepository._map_to_entity(doc, logger)
+
+        assert tool.http_config == ToolHttpConfig()
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.kwargs["tool_id"] == "bad"
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.domain.ports.config_watcher_port import ConfigChanges
 from src.presentation.controllers.orquestrador_controller import OrquestradorController
 
 
@@ -62,3 +63,96 @@ class TestOrquestradorController:
         controller._cache = None
         with pytest.raises(RuntimeError):
             await controller.get_agents()
+
+    def test_cache_stats_includes_providers(self, mock_logger):
+        controller = OrquestradorController(
+            get_active_agents_use_case=AsyncMock(),
+            get_active_teams_use_case=AsyncMock(),
+            logger=mock_logger,
+            cache_stats_providers={"models": lambda: {"cache_size": 3}},
+        )
+        stats = controller.get_cache_stats()
+        assert stats["models"] == {"cache_size": 3}
+        assert stats["agents"]["status"] == "empty"
+
+
+def _item(item_id: str) -> MagicMock:
+    item = MagicMock()
+    item.id = item_id
+    return item
+
+
+class TestApplyConfigChanges:
+    @pytest.fixture
+    def controller(self, mock_logger):
+        agents_use_case = AsyncMock()
+        agents_use_case.execute = AsyncMock(
+            return_value=[_item("a1"), _item("a2"), _item("a3")]
+        )
+        teams_use_case = AsyncMock()
+        teams_use_case.execute = AsyncMock(return_value=[_item("t1"), _item("t2")])
+        return OrquestradorController(
+            get_active_agents_use_case=agents_use_case,
+            get_active_teams_use_case=teams_use_case,
+            logger=mock_logger,
+        )
+
+    async def test_swaps_only_affected_entries_in_place(self, controller):
+        await controller.warm_up_cache()
+        published_agents = controller._cache.agents
+        published_teams = controller._team_cache.teams
+        new_a2, new_a4, new_t1 = _item("a2"), _item("a4"), _item("t1")
+        controller._agents_use_case.rebuild = AsyncMock(
+            return_value=({"a2": new_a2, "a4": new_a4}, {"a3"})
+        )
+        controller._teams_use_case.rebuild = AsyncMock(
+            return_value=({"t1": new_t1}, set())
+        )
+
+        await controller.apply_config_changes(
+            ConfigChanges(agent_ids={"a2", "a3", "a4"}, tool_ids={"x"})
+        )
+
+        assert controller._cache.agents is published_agents
+        assert [a.id for a in published_agents] == ["a1", "a2", "a4"]
+        assert published_agents[1] is new_a2
+        assert published_teams[0] is new_t1
+        args = controller._teams_use_case.rebuild.await_args.args
+        assert args[1] == {"a2", "a3", "a4"}
+        assert controller._agents_use_case.execute.await_count == 1
+
+    async def test_team_only_change_skips_agent_swap(self, controller):
+        await controller.warm_up_cache()
+        controller._agents_use_case.rebuild = AsyncMock(return_value=({}, set()))
+        controller._teams_use_case.rebuild = AsyncMock(return_value=({}, {"t2"}))
+
+        await controller.apply_config_changes(ConfigChanges(team_ids={"t2"}))
+
+        assert [t.id for t in controller._team_cache.teams] == ["t1"]
+
+    async def test_noop_before_first_load(self, controller):
+        controller._agents_use_case.rebuild = AsyncMock()
+        await controller.apply_config_changes(ConfigChanges(agent_ids={"a1"}))
+        controller._agents_use_case.rebuild.assert_not_awaited()
+
+    async def test_full_refresh_keeps_published_list(self, controller):
+        await controller.get_agents()
+        published = controller._cache.agents
+        await controller.refresh_agents()
+        assert controller._cache.agents is published
+
+    async def test_warm_up_starts_watcher(self, mock_logger):
+        watcher = AsyncMock()
+        controller = OrquestradorController(
+            get_active_agents_use_case=AsyncMock(),
+            get_active_teams_use_case=AsyncMock(),
+            logger=mock_logger,
+            config_watcher=watcher,
+        )
+        controller._agents_use_case.execute = AsyncMock(return_value=[])
+        controller._teams_use_case.execute = AsyncMock(return_value=[])
+
+        await controller.warm_up_cache()
+        watcher.start.assert_awaited_once_with(controller.apply_config_changes)
+        await controller.stop_config_watch()
+        watcher.stop.assert_awaited_once()
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -167,3 +168,110 @@ class TestLoadAgentsFallback:
         agents = await controller.get_agents()
         assert len(agents) == 2
         mock_logger.warning.assert_any_call("Usando cache expirado como fallback")
+
+
+# ── Stale-while-revalidate ───────────────────────────────────────────
+
+
+class TestStaleWhileRevalidate:
+    @pytest.fixture
+    def release(self):
+        return asyncio.Event()
+
+    @pytest.fixture
+    def controller(self, mock_logger, release):
+        async def slow_execute():
+            await release.wait()
+            return [MagicMock(), MagicMock(), MagicMock()]
+
+        agents_uc = AsyncMock()
+        agents_uc.execute = AsyncMock(side_effect=slow_execute)
+        teams_uc = AsyncMock()
+        teams_uc.execute = AsyncMock(return_value=[])
+        return OrquestradorController(
+            get_active_agents_use_case=agents_uc,
+            get_active_teams_use_case=teams_uc,
+            logger=mock_logger,
+            stale_grace_minutes=30,
+        )
+
+    async def test_serves_stale_and_refreshes_in_background(self, controller, release):
+        stale = [MagicMock()]
+        controller._cache = AgentCacheEntry(stale)
+        controller._cache.created_at = datetime.now(timezone.utc) - timedelta(minutes=10)
+
+        assert await controller.get_agents() is stale
+        assert await controller.get_agents() is stale
+        assert controller.get_cache_stats()["agents"]["refreshing"] is True
+
+        release.set()
+        await controller._refresh_tasks["agents"]
+        assert controller._agents_use_case.execute.await_count == 1
+        agents = await controller.get_agents()
+        assert len(agents) == 3
+        assert not controller._cache.is_expired()
+
+    async def test_beyond_grace_waits_for_refresh(self, controller, release):
+        controller._cache = AgentCacheEntry([MagicMock()])
+        controller._cache.created_at = datetime.now(timezone.utc) - timedelta(minutes=60)
+
+        pending = asyncio.create_task(controller.get_agents())
+        await asyncio.sleep(0)
+        assert not pending.done()
+        release.set()
+        assert len(await pending) == 3
+
+    async def test_concurrent_misses_share_one_refresh(self, controller, release):
+        callers = [asyncio.create_task(controller.get_agents()) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert controller._agents_use_case.execute.await_count == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_refresh_duration_recorded(self, controller, release):
+        release.set()
+        with patch(
+            "src.presentation.controllers.orquestrador_controller.TelemetryMetrics"
+        ) as metrics:
+            await controller.get_agents()
+        name, duration = metrics.record_cache_refresh.call_args.args
+        assert name == "agents"
+        assert duration >= 0.0
+
+    async def test_failed_refresh_backs_off(self, mock_logger):
+        agents_uc = AsyncMock()
+        agents_uc.execute = AsyncMock(side_effect=RuntimeError("mongo down"))
+        controller = OrquestradorController(
+            get_active_agents_use_case=agents_uc,
+            get_active_teams_use_case=AsyncMock(),
+            logger=mock_logger,
+            stale_grace_minutes=30,
+            refresh_backoff_seconds=60,
+        )
+        stale = [MagicMock()]
+        controller._cache = AgentCacheEntry(stale)
+        controller._cache.created_at = datetime.now(timezone.utc) - timedelta(minutes=10)
+
+        assert await controller.get_agents() is stale
+        await asyncio.gather(controller._refresh_tasks["agents"])
+        for _ in range(5):
+            assert await controller.get_agents() is stale
+        assert agents_uc.execute.await_count == 1
+
+        # Passado o backoff, volta a tentar
+        controller._failed_at["agents"] -= 60
+        assert await controller.get_agents() is stale
+        await asyncio.gather(controller._refresh_tasks["agents"])
+        assert agents_uc.execute.await_count == 2
+
+    async def test_ttl_is_configurable(self, mock_logger):
+        controller = OrquestradorController(
+            get_active_agents_use_case=AsyncMock(execute=AsyncMock(return_value=[])),
+            get_active_teams_use_case=AsyncMock(),
+            logger=mock_logger,
+            cache_ttl_minutes=15,
+        )
+        await controller.get_agents()
+        assert controller._cache.ttl == timedelta(minutes=15)
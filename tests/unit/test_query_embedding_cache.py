@@ -0,0 +1,104 @@
+"""Testes para QueryEmbeddingCache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application.services.search_strategies.hierarchical_search_strategy import (
+    HierarchicalSearchStrategy,
+)
+from src.infrastructure.cache.query_embedding_cache import QueryEmbeddingCache
+
+
+class TestQueryEmbeddingCache:
+    def test_miss_then_hit(self):
+        cache = QueryEmbeddingCache()
+        assert cache.get("Ollama", "nomic", "q") is None
+        cache.put("Ollama", "nomic", "q", [1.0])
+        assert cache.get("Ollama", "nomic", "q") == [1.0]
+        stats = cache.get_stats()
+        assert stats["total_hits"] == 1
+        assert stats["total_misses"] == 1
+
+    def test_query_is_normalized(self):
+        cache = QueryEmbeddingCache()
+        cache.put("Ollama", "nomic", "  Qual o  Prazo? ", [1.0])
+        assert cache.get("Ollama", "nomic", "qual o prazo?") == [1.0]
+
+    def test_key_includes_provider_and_model(self):
+        cache = QueryEmbeddingCache()
+        cache.put("Ollama", "nomic", "q", [1.0])
+        assert cache.get("OpenAI", "nomic", "q") is None
+        assert cache.get("Ollama", "other", "q") is None
+
+    def test_lru_eviction(self):
+        cache = QueryEmbeddingCache(max_size=2)
+        cache.put("p", "m", "a", [1.0])
+        cache.put("p", "m", "b", [2.0])
+        cache.get("p", "m", "a")  # "a" passa a ser o mais recente
+        cache.put("p", "m", "c", [3.0])
+        assert cache.get("p", "m", "b") is None
+        assert cache.get("p", "m", "a") == [1.0]
+        assert cache.get_stats()["cache_size"] == 2
+
+    def test_ttl_expiry(self):
+        cache = QueryEmbeddingCache(ttl_seconds=10)
+        with patch("src.infrastructure.cache.query_embedding_cache.time") as t:
+            t.monotonic.return_value = 100.0
+            cache.put("p", "m", "q", [1.0])
+            t.monotonic.return_value = 111.0
+            assert cache.get("p", "m", "q") is None
+        assert cache.get_stats()["cache_size"] == 0
+
+    def test_records_telemetry(self):
+        cache = QueryEmbeddingCache()
+        with patch(
+            "src.infrastructure.cache.query_embedding_cache.TelemetryMetrics"
+        ) as metrics:
+            cache.get("p", "m", "q")
+            cache.put("p", "m", "q", [1.0])
+            cache.get("p", "m", "q")
+        metrics.record_cache_miss.assert_called_once_with("query_embeddings")
+        metrics.record_cache_hit.assert_called_once_with("query_embeddings")
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            QueryEmbeddingCache(max_size=0)
+
+
+class TestStrategyWithCache:
+    async def test_repeated_query_embeds_once(self):
+        embedder = MagicMock()
+        embedder.id = "nomic"
+        embedder.get_embedding.return_value = [1.0, 0.0]
+        cache = QueryEmbeddingCache()
+        strategies = [
+            HierarchicalSearchStrategy(
+                tree_repository=MagicMock(),
+                embedder=embedder,
+                doc_name=f"doc{i}.txt",
+                logger=MagicMock(),
+                embedding_cache=cache,
+            )
+            for i in range(2)
+        ]
+
+        assert strategies[0]._compute_embedding("Olá mundo") == [1.0, 0.0]
+        assert strategies[1]._compute_embedding("olá  MUNDO") == [1.0, 0.0]
+        embedder.get_embedding.assert_called_once()
+
+    async def test_failed_embedding_not_cached(self):
+        embedder = MagicMock()
+        embedder.get_embedding.side_effect = RuntimeError("down")
+        cache = QueryEmbeddingCache()
+        strategy = HierarchicalSearchStrategy(
+            tree_repository=MagicMock(),
+            embedder=embedder,
+            doc_name="doc.txt",
+            logger=MagicMock(),
+            embedding_cache=cache,
+        )
+        assert strategy._compute_embedding("q") is None
+        assert cache.get_stats()["cache_size"] == 0
@@ -0,0 +1,137 @@
+"""Testes para ResourcePool e StageTimer."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.services.resource_pool import ResourcePool
+from src.application.services.stage_timer import StageTimer
+
+
+class TestResourcePoolSync:
+    def test_get_creates_once_per_key(self):
+        pool = ResourcePool()
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = pool.get(("model", "ollama", "llama"), factory)
+        second = pool.get(("model", "ollama", "llama"), factory)
+
+        assert first is second
+        factory.assert_called_once()
+        assert pool.get_stats() == {
+            "resources": 1, "hits": 1, "misses": 1, "evictions": 0
+        }
+
+    def test_distinct_keys_create_distinct_resources(self):
+        pool = ResourcePool()
+        a = pool.get(("model", "ollama", "a"), object)
+        b = pool.get(("model", "ollama", "b"), object)
+        assert a is not b
+
+    def test_failed_factory_is_not_cached(self):
+        pool = ResourcePool()
+        with pytest.raises(RuntimeError):
+            pool.get("k", MagicMock(side_effect=RuntimeError("boom")))
+        assert pool.get("k", lambda: "ok") == "ok"
+
+    def test_least_recently_used_evicted_above_limit(self):
+        pool = ResourcePool(max_entries=2)
+        first = pool.get("a", object)
+        pool.get("b", object)
+        pool.get("a", object)  # "b" passa a ser o mais antigo
+        pool.get("c", object)
+
+        assert pool.get("a", object) is first
+        assert pool.get_stats()["resources"] == 2
+        assert pool.get_stats()["evictions"] == 1
+        factory = MagicMock(return_value="novo")
+        assert pool.get("b", factory) == "novo"
+        factory.assert_called_once()
+
+    def test_clear(self):
+        pool = ResourcePool()
+        pool.get("k", object)
+        pool.clear()
+        assert pool.get_stats()["resources"] == 0
+
+
+class TestResourcePoolAsync:
+    async def test_concurrent_calls_are_single_flight(self):
+        pool = ResourcePool()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return object()
+
+        results = await asyncio.gather(*(pool.aget("toolkit", factory) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert pool.get_stats() == {
+            "resources": 1, "hits": 4, "misses": 1, "evictions": 0
+        }
+
+    async def test_failure_propagates_to_waiters_and_allows_retry(self):
+        pool = ResourcePool()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            pool.aget("k", failing), pool.aget("k", failing), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        async def ok():
+            return "ok"
+
+        assert await pool.aget("k", ok) == "ok"
+
+    async def test_aget_reuses_sync_resource(self):
+        pool = ResourcePool()
+        resource = pool.get("k", object)
+
+        async def never():
+            raise AssertionError("não deveria ser chamada")
+
+        assert await pool.aget("k", never) is resource
+
+
+class TestStageTimer:
+    def test_records_and_accumulates_stages(self):
+        timer = StageTimer()
+        with timer.stage("model"):
+            pass
+        with timer.stage("tools"):
+            pass
+        with timer.stage("model"):
+            pass
+
+        stages = timer.as_dict()
+        assert list(stages) == ["model", "tools"]
+        assert all(ms >= 0 for ms in stages.values())
+
+    def test_records_stage_on_exception(self):
+        timer = StageTimer()
+        with pytest.raises(ValueError):
+            with timer.stage("validate"):
+                raise ValueError("x")
+        assert "validate" in timer.as_dict()
+
+    def test_merge(self):
+        a, b = StageTimer(), StageTimer()
+        with a.stage("db"):
+            pass
+        with b.stage("db"):
+            pass
+        with b.stage("assemble"):
+            pass
+        a.merge(b)
+        assert set(a.as_dict()) == {"db", "assemble"}
@@ -0,0 +1,89 @@
+"""Testes para RouteTemplate (resolução de URL das tools HTTP)."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.domain.entities.tool import ParameterType, ToolParameter
+from src.infrastructure.http.route_template import RouteTemplate
+
+
+def _param(name: str, ptype: ParameterType) -> ToolParameter:
+    return ToolParameter(name=name, type=ptype, description=name)
+
+
+class TestRouteTemplate:
+    def test_no_placeholders(self):
+        url, remaining = RouteTemplate("http://example.com/api").resolve({"q": "hello"})
+        assert url == "http://example.com/api"
+        assert remaining == {"q": "hello"}
+
+    def test_with_placeholder(self):
+        url, remaining = RouteTemplate("http://example.com/api/{user_id}").resolve(
+            {"param": '{"user_id": "123"}'}
+        )
+        assert url == "http://example.com/api/123"
+        assert "param" not in remaining
+
+    def test_legacy_python_literal(self):
+        url, remaining = RouteTemplate("http://example.com/api/{user_id}").resolve(
+            {"param": "{'user_id': 7}"}
+        )
+        assert url == "http://example.com/api/7"
+        assert remaining == {}
+
+    def test_non_dict_value(self):
+        url, remaining = RouteTemplate("http://example.com/api").resolve(
+            {"key": "simple_value"}
+        )
+        assert url == "http://example.com/api"
+        assert remaining == {"key": "simple_value"}
+
+    def test_invalid_literal(self):
+        url, remaining = RouteTemplate("http://example.com/api").resolve(
+            {"key": "not a dict {bad}"}
+        )
+        assert url == "http://example.com/api"
+
+    def test_slot_filled_by_name(self):
+        template = RouteTemplate("http://x/users/{user_id}/orders/{order_id}")
+        url, remaining = template.resolve({"user_id": "42", "order_id": 9, "q": "a"})
+        assert url == "http://x/users/42/orders/9"
+        assert remaining == {"q": "a"}
+        assert template.slots == ["user_id", "order_id"]
+
+    def test_path_values_are_encoded(self):
+        url, _ = RouteTemplate("http://x/files/{name}").resolve({"name": "a/b c"})
+        assert url == "http://x/files/a%2Fb%20c"
+
+    def test_missing_slot_raises(self):
+        with pytest.raises(ValueError, match="user_id"):
+            RouteTemplate("http://x/users/{user_id}").resolve({"q": "a"})
+
+    def test_typed_coercion(self):
+        template = RouteTemplate(
+            "http://x/items/{id}",
+            [
+                _param("id", ParameterType.INTEGER),
+                _param("limit", ParameterType.INTEGER),
+                _param("ratio", ParameterType.FLOAT),
+                _param("active", ParameterType.BOOLEAN),
+            ],
+        )
+        url, remaining = template.resolve(
+            {"id": " 5 ", "limit": "10", "ratio": "0.5", "active": "false"}
+        )
+        assert url == "http://x/items/5"
+        assert remaining == {"limit": 10, "ratio": 0.5, "active": False}
+
+    def test_coercion_accepts_string_type_names(self):
+        template = RouteTemplate(
+            "http://x",
+            [ToolParameter(name="n", type="integer", description="n")],
+        )
+        assert template.resolve({"n": "3"})[1] == {"n": 3}
+
+    def test_invalid_typed_value_raises(self):
+        template = RouteTemplate("http://x", [_param("limit", ParameterType.INTEGER)])
+        with pytest.raises(ValueError, match="limit"):
+            template.resolve({"limit": "dez"})
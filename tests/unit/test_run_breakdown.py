@@ -0,0 +1,215 @@
+"""Testes para a decomposição de latência dos runs (spans + histograma)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode
+from starlette.testclient import TestClient
+
+from src.application.services.search_strategies.hierarchical_search_strategy import (
+    HierarchicalSearchStrategy,
+)
+from src.domain.entities.document_node import DocumentNode
+from src.domain.entities.tool import HttpMethod, Tool
+from src.infrastructure.http.http_tool_factory import HttpToolFactory
+from src.infrastructure.repositories.mongo_document_tree_repository import (
+    MongoDocumentTreeRepository,
+)
+from src.infrastructure.telemetry import run_breakdown
+from src.infrastructure.telemetry.run_breakdown import (
+    bind_run,
+    component_span,
+    run_attributes,
+)
+from src.infrastructure.tools.hierarchical_search_tool import (
+    create_hierarchical_search_tool,
+)
+from src.infrastructure.web.metrics_middleware import MetricsMiddleware
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(run_breakdown, "_tracer", provider.get_tracer("test"))
+    return exporter
+
+
+@pytest.fixture
+def record():
+    with patch(
+        "src.infrastructure.telemetry.run_breakdown.TelemetryMetrics.record_run_component"
+    ) as record:
+        yield record
+
+
+class _AsyncCursor:
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._docs:
+            raise StopAsyncIteration
+        return self._docs.pop(0)
+
+
+def _node(node_id, embedding, *, level=0, children=()):
+    return DocumentNode(
+        id=node_id,
+        doc_name="manual.txt",
+        level=level,
+        title=node_id,
+        content=f"conteúdo {node_id}",
+        embedding=embedding,
+        children_ids=list(children),
+    )
+
+
+class TestComponentSpan:
+    def test_span_and_histogram_carry_run_attributes(self, exporter, record):
+        with bind_run(agent_id="agent-1"):
+            with component_span("tool", "tool.http", tool_id="t1", level=None):
+                pass
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "tool.http"
+        assert dict(span.attributes) == {
+            "agent_id": "agent-1",
+            "component": "tool",
+            "tool_id": "t1",
+        }
+        component, duration_s, attrs = record.call_args.args
+        assert component == "tool"
+        assert duration_s >= 0
+        assert attrs["agent_id"] == "agent-1"
+        assert attrs["status"] == "success"
+
+    def test_exception_marks_error_and_propagates(self, exporter, record):
+        with pytest.raises(RuntimeError):
+            with component_span("mongo", "mongo.get_node"):
+                raise RuntimeError("timeout")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status.status_code == StatusCode.ERROR
+        assert record.call_args.args[2]["status"] == "error"
+
+    def test_bind_run_is_scoped(self):
+        with bind_run(agent_id="a", team_id=None):
+            assert run_attributes() == {"agent_id": "a"}
+        assert run_attributes() == {}
+
+
+class TestInstrumentedRun:
+    async def test_rag_search_breaks_down_by_level_and_mongo(self, exporter, record):
+        batches = [
+            [_node("root", [1.0, 0.0], children=["leaf"])],
+            [_node("leaf", [1.0, 0.0], level=1)],
+        ]
+        collection = MagicMock()
+        collection.find.return_value.sort.side_effect = lambda *a: _AsyncCursor(
+            [MongoDocumentTreeRepository._to_document(n) for n in batches.pop(0)]
+        )
+        with patch(
+            "src.infrastructure.repositories.mongo_base.MongoClientFactory.get_client"
+        ) as get_client:
+            get_client.return_value.__getitem__.return_value.__getitem__.return_value = (
+                collection
+            )
+            repo = MongoDocumentTreeRepository(
+                connection_string="mongodb://test:27017",
+                database_name="agno",
+                logger=MagicMock(),
+            )
+        embedder = MagicMock()
+        embedder.get_embedding.return_value = [1.0, 0.0]
+        strategy = HierarchicalSearchStrategy(
+            tree_repository=repo,
+            embedder=embedder,
+            doc_name="manual.txt",
+            logger=MagicMock(),
+        )
+        toolkit = create_hierarchical_search_tool(strategy, doc_name="manual.txt")
+        search = toolkit.async_functions["search_knowledge"].entrypoint
+
+        with bind_run(agent_id="agent-1"):
+            result = await search(query="pergunta")
+
+        assert "conteúdo leaf" in result
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        root = spans["rag.search"]
+        assert root.attributes["doc_name"] == "manual.txt"
+        assert root.attributes["results"] == 1
+        levels = [s for s in exporter.get_finished_spans() if s.name == "rag.level"]
+        assert [s.attributes["level"] for s in levels] == [0, 1]
+        mongo = [s for s in exporter.get_finished_spans() if s.name.startswith("mongo.")]
+        assert [s.name for s in mongo] == ["mongo.get_root_nodes", "mongo.get_children"]
+        assert all(s.attributes["collection"] == "document_tree" for s in mongo)
+        # get_children é consultado dentro do span do nível 0
+        assert mongo[1].parent.span_id == levels[0].context.span_id
+        for span in exporter.get_finished_spans():
+            assert span.attributes["agent_id"] == "agent-1"
+            if span.name != "rag.search":
+                assert span.context.trace_id == root.context.trace_id
+
+        components = {call.args[0] for call in record.call_args_list}
+        assert components == {"rag", "rag_embed", "rag_level", "mongo"}
+
+    async def test_http_tool_span_records_status(self, exporter, record, mock_logger):
+        tool = Tool(
+            id="cep",
+            name="CEP",
+            description="Consulta CEP",
+            route="http://example.com/cep",
+            http_method=HttpMethod.GET,
+            parameters=[],
+        )
+        toolkits = await HttpToolFactory(logger=mock_logger).create_tools_from_configs(
+            [tool]
+        )
+        fn = toolkits[0].async_functions["cep"].entrypoint
+
+        with patch("httpx.AsyncClient") as client_cls:
+            client = AsyncMock()
+            client.build_request = MagicMock()
+            client.send = AsyncMock(return_value=httpx.Response(200, json={"ok": 1}))
+            client_cls.return_value = client
+            with bind_run(agent_id="agent-1"):
+                await fn()
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "tool.http"
+        assert span.attributes["tool_id"] == "cep"
+        assert span.attributes["agent_id"] == "agent-1"
+        assert span.attributes["tool_status"] == "success"
+        assert record.call_args.args[0] == "tool"
+
+
+class TestMiddlewareBinding:
+    def test_agent_run_binds_agent_id(self):
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.post("/agents/{agent_id}/runs")
+        async def agent_run(agent_id: str):
+            return dict(run_attributes())
+
+        @app.post("/teams/{team_id}/runs")
+        async def team_run(team_id: str):
+            return dict(run_attributes())
+
+        client = TestClient(app)
+        assert client.post("/agents/a1/runs").json() == {"agent_id": "a1"}
+        assert client.post("/teams/t1/runs").json() == {"team_id": "t1"}
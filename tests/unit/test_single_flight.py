@@ -0,0 +1,133 @@
+"""Testes para SingleFlight e a coalescência de chamadas das tools HTTP."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.domain.entities.tool import HttpMethod, Tool
+from src.domain.entities.tool_http_config import ToolHttpConfig
+from src.infrastructure.http.client_pool import HttpClientPool
+from src.infrastructure.http.http_tool_factory import HttpToolFactory
+from src.infrastructure.http.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_execution(self):
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flight.do("k", fn) for _ in range(5)))
+        assert results == [42] * 5
+        assert calls == 1
+        assert flight.shared == 4
+        assert flight.inflight == 0
+
+    async def test_sequential_calls_run_again(self):
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", fn) == 1
+        assert await flight.do("k", fn) == 2
+
+    async def test_exception_fans_out(self):
+        flight: SingleFlight[int] = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fn), flight.do("k", fn), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        flight: SingleFlight[str] = SingleFlight()
+        release = asyncio.Event()
+
+        async def fn():
+            await release.wait()
+            return "ok"
+
+        first = asyncio.create_task(flight.do("k", fn))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flight.do("k", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        assert await second == "ok"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+def _make_tool(**overrides) -> Tool:
+    defaults = dict(
+        id="lookup",
+        name="Lookup",
+        description="Lookup tool",
+        route="http://api.local/items",
+        http_method=HttpMethod.GET,
+        parameters=[],
+    )
+    defaults.update(overrides)
+    return Tool(**defaults)
+
+
+async def _entrypoint_and_counter(mock_logger, tool):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"n": len(requests)})
+
+    pool = HttpClientPool(mock_logger)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    pool.get_client = lambda url, config: client
+    factory = HttpToolFactory(logger=mock_logger, client_pool=pool)
+    toolkit = (await factory.create_tools_from_configs([tool]))[0]
+    return toolkit.async_functions[tool.id].entrypoint, requests
+
+
+class TestHttpFunctionCoalescing:
+    async def test_identical_concurrent_gets_share_upstream_call(self, mock_logger):
+        fn, requests = await _entrypoint_and_counter(mock_logger, _make_tool())
+        results = await asyncio.gather(fn(q="x"), fn(q="x"), fn(q="y"))
+        assert len(requests) == 2
+        assert results[0] == results[1]
+
+    async def test_post_not_coalesced_by_default(self, mock_logger):
+        fn, requests = await _entrypoint_and_counter(
+            mock_logger, _make_tool(http_method=HttpMethod.POST)
+        )
+        await asyncio.gather(fn(a=1), fn(a=1))
+        assert len(requests) == 2
+
+    async def test_post_coalesced_when_enabled(self, mock_logger):
+        tool = _make_tool(
+            http_method=HttpMethod.POST,
+            http_config=ToolHttpConfig(coalesce_requests=True),
+        )
+        fn, requests = await _entrypoint_and_counter(mock_logger, tool)
+        await asyncio.gather(fn(a=1), fn(a=1), fn(a=2))
+        assert len(requests) == 2
+
+    async def test_get_coalescing_can_be_disabled(self, mock_logger):
+        tool = _make_tool(http_config=ToolHttpConfig(coalesce_requests=False))
+        fn, requests = await _entrypoint_and_counter(mock_logger, tool)
+        await asyncio.gather(fn(q="x"), fn(q="x"))
+        assert len(requests) == 2
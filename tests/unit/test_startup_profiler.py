@@ -0,0 +1,140 @@
+"""Testes para StartupProfiler e o endpoint /admin/startup-profile."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from src.infrastructure.telemetry.startup_profiler import (
+    StartupProfiler,
+    profile_imports,
+)
+from src.infrastructure.web.app_factory import AppFactory
+
+
+@pytest.fixture
+def profiler():
+    return StartupProfiler()
+
+
+class TestPhases:
+    def test_nested_phases_and_attributes(self, profiler):
+        with profiler.phase("container"):
+            with profiler.phase("mongo_connect") as attrs:
+                attrs["ok"] = True
+        profiler.finish()
+
+        report = profiler.report()
+        assert report["status"] == "complete"
+        by_name = {p["name"]: p for p in report["phases"]}
+        assert by_name["container"]["parent"] is None
+        assert by_name["mongo_connect"]["parent"] == "container"
+        assert by_name["mongo_connect"]["attributes"] == {"ok": True}
+        assert by_name["container"]["duration_ms"] >= by_name["mongo_connect"]["duration_ms"]
+
+    def test_failed_phase_records_error(self, profiler):
+        with pytest.raises(RuntimeError):
+            with profiler.phase("config_load"):
+                raise RuntimeError("boom")
+
+        (phase,) = profiler.report()["phases"]
+        assert phase["attributes"]["error"] == "RuntimeError"
+        assert profiler.report()["status"] == "in_progress"
+
+    def test_agent_builds_become_child_phases(self, profiler):
+        profiler.record_agent_builds(
+            {"a1": {"start_ns": 10, "end_ns": 2_000_010, "stages_ms": {"model": 1.5}}},
+            parent="agents_build",
+        )
+        profiler.record_agent_builds(MagicMock(), parent="agents_build")
+
+        (phase,) = profiler.report()["phases"]
+        assert phase["name"] == "agent:a1"
+        assert phase["parent"] == "agents_build"
+        assert phase["duration_ms"] == 2.0
+        assert phase["attributes"] == {"stage.model_ms": 1.5}
+
+
+class TestExportSpans:
+    def test_spans_keep_hierarchy_and_timestamps(self, profiler):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+        with profiler.phase("agents_build"):
+            pass
+        profiler.record("agent:a1", 100, 200, parent="agents_build", tools=2)
+        profiler.finish()
+        profiler.export_spans(provider.get_tracer("test"))
+
+        spans = {s.name: s for s in exporter.get_finished_spans()}
+        assert set(spans) == {"startup", "agents_build", "agent:a1"}
+        assert spans["agents_build"].parent.span_id == spans["startup"].context.span_id
+        assert spans["agent:a1"].parent.span_id == spans["agents_build"].context.span_id
+        assert (spans["agent:a1"].start_time, spans["agent:a1"].end_time) == (100, 200)
+        assert spans["agent:a1"].attributes["tools"] == 2
+
+
+class TestProfileImports:
+    def test_parses_importtime_output(self):
+        result = profile_imports(["json", "email.message"], top=3)
+
+        assert result["status"] == "ok"
+        assert set(result["modules_ms"]) == {"json", "email.message"}
+        assert len(result["slowest_self_ms"]) == 3
+        assert result["total_ms"] > 0
+
+    def test_subprocess_failure_reported(self):
+        with patch(
+            "src.infrastructure.telemetry.startup_profiler.subprocess.run",
+            side_effect=OSError("no python"),
+        ):
+            assert profile_imports(["json"]) == {"status": "error", "error": "no python"}
+
+    def test_profiler_caches_import_profile(self, profiler):
+        with patch(
+            "src.infrastructure.telemetry.startup_profiler.profile_imports",
+            return_value={"status": "ok"},
+        ) as run:
+            profiler.profile_imports()
+            profiler.profile_imports()
+
+        run.assert_called_once()
+        assert profiler.report()["imports"] == {"status": "ok"}
+
+
+class TestStartupProfileEndpoint:
+    async def test_returns_report(self):
+        factory = AppFactory()
+        with factory._profiler.phase("config_load"):
+            pass
+        app = factory.create_app()
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.get("/admin/startup-profile")
+
+        assert resp.status_code == 200
+        assert resp.json()["phases"][0]["name"] == "config_load"
+        assert "imports" not in resp.json()
+
+    async def test_imports_opt_in(self):
+        factory = AppFactory()
+        app = factory.create_app()
+
+        with patch.object(
+            factory._profiler, "profile_imports", side_effect=lambda: setattr(
+                factory._profiler, "_imports", {"status": "ok"}
+            )
+        ) as run:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                resp = await client.get("/admin/startup-profile", params={"imports": "true"})
+
+        run.assert_called_once()
+        assert resp.json()["imports"] == {"status": "ok"}
@@ -141,12 +141,27 @@ class TestTelemetryMetrics:
     def test_record_cache_miss_no_error(self):
         TelemetryMetrics.record_cache_miss("agents")
 
+    def test_record_mongo_pool_no_error(self):
+        TelemetryMetrics.record_mongo_pool_connections("db:27017", open_delta=1, in_use_delta=1)
+        TelemetryMetrics.record_mongo_checkout("db:27017", 0.01)
+        TelemetryMetrics.record_mongo_checkout("db:27017", None, failed=True)
+
+    def test_record_cache_refresh_no_error(self):
+        TelemetryMetrics.record_cache_refresh("agents", 0.2)
+        TelemetryMetrics.record_cache_refresh("teams", 0.1, "error")
+
     def test_record_tool_call_no_error(self):
         TelemetryMetrics.record_tool_call("tool-1", 0.5, "success")
 
     def test_record_tool_call_error_status(self):
         TelemetryMetrics.record_tool_call("tool-1", 0.5, "error")
 
+    def test_record_tool_call_with_queue_wait(self):
+        TelemetryMetrics.record_tool_call("tool-1", 0.5, queue_wait_s=0.1)
+
+    def test_record_tool_call_rejected(self):
+        TelemetryMetrics.record_tool_call("tool-1", 0.0, "rejected")
+
     def test_record_startup_duration_no_error(self):
         TelemetryMetrics.record_startup_duration(2.5)
 